@@ -0,0 +1,196 @@
+# benchmarks/cases.py
+
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Tuple
+import asyncio
+import io
+import contextlib
+
+from corstream import Stream
+from benchmarks.harness import Case
+
+
+async def _source(n: int) -> AsyncIterator[int]:
+    for i in range(n):
+        yield i
+
+
+async def _drain(stream: Stream[Any]) -> int:
+    count = 0
+
+    def consume(_: Any) -> None:
+        nonlocal count
+        count += 1
+
+    await stream.for_each(consume)
+    return count
+
+
+def _inc(x: int) -> int:
+    return x + 1
+
+
+def _even(x: int) -> bool:
+    return x % 2 == 0
+
+
+def _square(x: int) -> int:
+    return x * x
+
+
+def _latency(seconds: float) -> Callable[[int], Awaitable[int]]:
+    async def call(x: int) -> int:
+        await asyncio.sleep(seconds)
+        return x
+
+    return call
+
+
+def _op_case(
+    name: str, items: int, build: Callable[[Stream[int]], Stream[Any]]
+) -> Case:
+    async def run(n: int) -> int:
+        return await _drain(build(Stream.from_iterable(_source(n))))
+
+    return Case("operator", name, items, run)
+
+
+def _quiet_log(n: int) -> Awaitable[int]:
+    async def run() -> int:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return await _drain(Stream.from_iterable(_source(n)).log("bench"))
+
+    return run()
+
+
+async def _baseline_loop(n: int) -> int:
+    count = 0
+    async for _ in _source(n):
+        count += 1
+    return count
+
+
+async def _baseline_map_async(n: int, concurrency: int, latency: float) -> int:
+    semaphore = asyncio.Semaphore(concurrency)
+    call = _latency(latency)
+
+    async def worker(x: int) -> int:
+        async with semaphore:
+            return await call(x)
+
+    return len(await asyncio.gather(*(worker(x) for x in range(n))))
+
+
+def operator_cases(items: int) -> List[Case]:
+    """
+    Per-operator overhead: one operator over an async source, drained by for_each.
+    """
+
+    async def log_case(n: int) -> int:
+        return await _quiet_log(n)
+
+    async def identity(x: int) -> int:
+        return x
+
+    cases = [
+        Case("baseline", "async_for", items, _baseline_loop),
+        _op_case("passthrough", items, lambda s: s),
+        _op_case("map", items, lambda s: s.map(_inc)),
+        _op_case("filter", items, lambda s: s.filter(_even)),
+        _op_case("batch", items, lambda s: s.batch(64)),
+        _op_case("map_async", items, lambda s: s.map_async(identity, 64)),
+        _op_case(
+            "map_parallel", items, lambda s: s.map_parallel(_square, chunksize=256)
+        ),
+        _op_case("throttle", items, lambda s: s.throttle(rate=1e9, burst=1e9)),
+        _op_case("buffer", items, lambda s: s.buffer(256)),
+        _op_case("catch", items, lambda s: s.catch(lambda e: None)),
+        _op_case("retry", items, lambda s: s.retry()),
+        _op_case("chunked", items, lambda s: s.chunked(1024).map(_inc).unchunk()),
+        Case("operator", "log", items, log_case),
+    ]
+    return cases
+
+
+def depth_cases(items: int, depths: List[int]) -> List[Case]:
+    """
+    Pipelines of increasing depth, alternating sync map and filter stages,
+    over both an async source and a sync source.
+    """
+    cases: List[Case] = []
+    for depth in depths:
+
+        def build(stream: Stream[int], depth: int = depth) -> Stream[Any]:
+            for i in range(depth):
+                stream = stream.map(_inc) if i % 2 == 0 else stream.filter(bool)
+            return stream
+
+        async def run_async(n: int, build: Any = build) -> int:
+            return await _drain(build(Stream.from_iterable(_source(n))))
+
+        async def run_sync(n: int, build: Any = build) -> int:
+            return len(await build(Stream.from_iterable(range(n))).to_list())
+
+        params = {"depth": depth}
+        cases.append(Case("depth", f"async_source_d{depth}", items, run_async, params))
+        cases.append(Case("depth", f"sync_source_d{depth}", items, run_sync, params))
+    return cases
+
+
+def fusion_cases(items: int) -> List[Case]:
+    """
+    A sync map+filter chain collected with to_list: over a sync source (run
+    as a plain loop) and over an async source (one fused operator), next to
+    the equivalent list comprehension.
+    """
+
+    def build(stream: Stream[int]) -> Stream[int]:
+        return stream.map(_inc).filter(_even).map(_square)
+
+    async def comprehension(n: int) -> int:
+        return len([y * y for y in (x + 1 for x in range(n)) if y % 2 == 0])
+
+    async def sync_plan(n: int) -> int:
+        return len(await build(Stream.from_iterable(range(n))).to_list())
+
+    async def async_source(n: int) -> int:
+        return len(await build(Stream.from_iterable(_source(n))).to_list())
+
+    return [
+        Case("baseline", "comprehension", items, comprehension),
+        Case("fusion", "sync_plan", items, sync_plan),
+        Case("fusion", "async_source", items, async_source),
+    ]
+
+
+# (faster case, slower case, minimum speedup), each case as (group, name);
+# checked by benchmarks.run when both cases ran.
+EXPECTED_GAINS: List[Tuple[Tuple[str, str], Tuple[str, str], float]] = [
+    (("fusion", "sync_plan"), ("fusion", "async_source"), 2.0),
+]
+
+
+def map_async_cases(
+    sizes: List[int], concurrencies: List[int], latency: float
+) -> List[Case]:
+    """
+    map_async scaling with max_concurrent and input size, using coroutines
+    that simulate `latency` seconds of I/O, next to a gather+Semaphore baseline.
+    """
+    cases: List[Case] = []
+    for size in sizes:
+        for concurrency in concurrencies:
+            params = {"max_concurrent": concurrency, "latency": latency}
+
+            async def run(n: int, concurrency: int = concurrency) -> int:
+                stream = Stream.from_iterable(_source(n)).map_async(
+                    _latency(latency), max_concurrent=concurrency
+                )
+                return await _drain(stream)
+
+            async def baseline(n: int, concurrency: int = concurrency) -> int:
+                return await _baseline_map_async(n, concurrency, latency)
+
+            suffix = f"n{size}_c{concurrency}"
+            cases.append(Case("map_async", f"corstream_{suffix}", size, run, params))
+            cases.append(Case("map_async", f"gather_{suffix}", size, baseline, params))
+    return cases
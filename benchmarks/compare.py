@@ -0,0 +1,47 @@
+# benchmarks/compare.py
+"""
+Compares two benchmark result files and reports throughput regressions.
+
+Usage:
+    python -m benchmarks.compare baseline.json candidate.json [--threshold 0.1]
+
+Exits with status 1 if any case got slower by more than the threshold.
+"""
+
+from typing import Any, Dict, List, Tuple
+import argparse
+import json
+import sys
+
+
+def _index(path: str) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    with open(path) as f:
+        report = json.load(f)
+    return {(r["group"], r["name"]): r for r in report["results"]}
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    baseline = _index(args.baseline)
+    candidate = _index(args.candidate)
+    regressions = 0
+    for key in sorted(baseline.keys() & candidate.keys()):
+        before = baseline[key]["items_per_sec"]
+        after = candidate[key]["items_per_sec"]
+        change = (after - before) / before if before else 0.0
+        flag = ""
+        if change < -args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(f"{key[0]:>10} {key[1]:<28} {change:+8.1%}{flag}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
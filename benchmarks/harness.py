@@ -0,0 +1,105 @@
+# benchmarks/harness.py
+
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional
+import asyncio
+import gc
+import multiprocessing
+import statistics
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+
+class Case(NamedTuple):
+    """
+    A single benchmark: `build(items)` returns a coroutine that processes
+    `items` items and returns how many it produced.
+    """
+
+    group: str
+    name: str
+    items: int
+    build: Callable[[int], Awaitable[int]]
+    params: Optional[Dict[str, Any]] = None
+
+
+def _peak_rss_kb() -> int:
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere.
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _measure(case: Case, repeat: int) -> Dict[str, Any]:
+    timings: List[float] = []
+    produced = 0
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        produced = asyncio.run(case.build(case.items))
+        timings.append(time.perf_counter() - started)
+
+    # A separate traced run, so tracemalloc overhead doesn't skew the timings.
+    gc.collect()
+    tracemalloc.start()
+    asyncio.run(case.build(case.items))
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    seconds = statistics.median(timings)
+    return {
+        "group": case.group,
+        "name": case.name,
+        "params": dict(case.params or {}),
+        "items": case.items,
+        "produced": produced,
+        "repeat": repeat,
+        "seconds": seconds,
+        "seconds_min": min(timings),
+        "items_per_sec": case.items / seconds if seconds > 0 else float("inf"),
+        "peak_rss_kb": _peak_rss_kb(),
+        "peak_traced_kb": traced_peak // 1024,
+    }
+
+
+def _child(case: Case, repeat: int, conn: Any) -> None:
+    try:
+        conn.send((True, _measure(case, repeat)))
+    except BaseException as e:  # pragma: no cover - reported by the parent
+        conn.send((False, repr(e)))
+    finally:
+        conn.close()
+
+
+def run_case(case: Case, repeat: int = 3, isolate: bool = True) -> Dict[str, Any]:
+    """
+    Runs a benchmark case and returns its measurements.
+
+    With `isolate`, the case runs in a forked process so its peak RSS is not
+    polluted by earlier cases (where fork is unavailable it runs in-process).
+
+    :param case: The case to run.
+    :param repeat: Number of timed runs; the median is reported.
+    :param isolate: Whether to run the case in its own process.
+    :return: A JSON-serializable result record.
+    """
+    # Cases are closures, so isolation relies on fork to hand them to the child.
+    if not isolate or "fork" not in multiprocessing.get_all_start_methods():
+        return _measure(case, repeat)
+
+    context = multiprocessing.get_context("fork")
+    parent, child = context.Pipe(duplex=False)
+    process = context.Process(target=_child, args=(case, repeat, child))
+    process.start()
+    child.close()
+    ok, payload = parent.recv()
+    process.join()
+    if not ok:
+        raise RuntimeError(f"Benchmark {case.group}/{case.name} failed: {payload}")
+    return payload
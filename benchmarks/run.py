@@ -0,0 +1,115 @@
+# benchmarks/run.py
+"""
+Runs the corstream benchmark suite and writes machine-readable results.
+
+Usage:
+    python -m benchmarks.run --output results.json [--quick] [--group operator]
+"""
+
+from typing import Any, Dict, List, Tuple
+import argparse
+import datetime
+import json
+import platform
+import random
+import subprocess
+import sys
+
+from benchmarks.cases import (
+    EXPECTED_GAINS,
+    depth_cases,
+    fusion_cases,
+    map_async_cases,
+    operator_cases,
+)
+from benchmarks.harness import Case, run_case
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def build_cases(quick: bool) -> List[Case]:
+    items = 20_000 if quick else 200_000
+    cases = operator_cases(items)
+    cases += depth_cases(items, [1, 2, 4, 8] if quick else [1, 2, 4, 8, 16])
+    cases += fusion_cases(items)
+    cases += map_async_cases(
+        sizes=[200, 1_000] if quick else [1_000, 10_000],
+        concurrencies=[1, 16, 128] if quick else [1, 8, 64, 256],
+        latency=0.001,
+    )
+    return cases
+
+
+def check_gains(results: List[Dict[str, Any]]) -> List[str]:
+    """
+    Returns a message for every expected speedup that was not reached.
+    """
+    rates: Dict[Tuple[str, str], float] = {
+        (r["group"], r["name"]): r["items_per_sec"] for r in results
+    }
+    failures = []
+    for faster, slower, minimum in EXPECTED_GAINS:
+        if faster not in rates or slower not in rates:
+            continue
+        gain = rates[faster] / rates[slower]
+        if gain < minimum:
+            failures.append(
+                f"{'/'.join(faster)} is {gain:.1f}x {'/'.join(slower)}, "
+                f"expected at least {minimum}x"
+            )
+    return failures
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", default="benchmarks/results.json")
+    parser.add_argument("--quick", action="store_true", help="smaller inputs")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--group", action="append", help="only run these groups")
+    parser.add_argument("--no-isolate", action="store_true")
+    args = parser.parse_args(argv)
+
+    random.seed(0)
+    results: List[Dict[str, Any]] = []
+    for case in build_cases(args.quick):
+        if args.group and case.group not in args.group:
+            continue
+        result = run_case(case, repeat=args.repeat, isolate=not args.no_isolate)
+        results.append(result)
+        print(
+            f"{case.group:>10} {case.name:<28} "
+            f"{result['items_per_sec']:>14,.0f} items/s "
+            f"{result['peak_rss_kb']:>9,} KB rss"
+        )
+
+    report = {
+        "meta": {
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "python": sys.version,
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "git_revision": _git_revision(),
+            "quick": args.quick,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+    failures = check_gains(results)
+    for failure in failures:
+        print(f"GAIN NOT REACHED: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,3 +1,42 @@
 from .core import Stream
+from .errors import (
+    CorstreamError,
+    StageTimeoutError,
+    DeadlineExceededError,
+    RetryDeadlineError,
+    WorkerError,
+)
+from .chunked import ChunkedStream
+from .grouped import GroupedStream
+from .partitioned import PartitionedStream
+from .plan import CompiledPipeline, Pipeline, pipeline
+from .ops.aggregate.window import WindowResult
+from .ops.aggregate.reducer import Reducer, combine_partials
+from .ops.asyncflow.adaptive import AdaptiveConcurrency
+from .ops.asyncflow.cache import Cache
+from .ops.control.limiter import RateLimiter
+from .ops.control.retry import RetryPolicy
+from .sinks.terminal.to_file import WriteStats
 
-__all__ = ["Stream"]
+__all__ = [
+    "Stream",
+    "CorstreamError",
+    "StageTimeoutError",
+    "DeadlineExceededError",
+    "RetryDeadlineError",
+    "WorkerError",
+    "ChunkedStream",
+    "GroupedStream",
+    "PartitionedStream",
+    "Pipeline",
+    "CompiledPipeline",
+    "pipeline",
+    "WindowResult",
+    "Reducer",
+    "combine_partials",
+    "AdaptiveConcurrency",
+    "Cache",
+    "RateLimiter",
+    "RetryPolicy",
+    "WriteStats",
+]
@@ -0,0 +1,109 @@
+# corstream/chunked.py
+
+from __future__ import annotations
+
+from corstream.ops import (
+    chunked_map_op,
+    chunked_filter_op,
+    chunked_batch_op,
+    unchunk_op,
+)
+
+from corstream.sinks import (
+    chunked_to_list_sink,
+    chunked_reduce_sink,
+)
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generic,
+    List,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    from corstream.core import Stream
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+
+class ChunkedStream(Generic[T]):
+    """
+    A view over a Stream whose items flow through the pipeline in chunks.
+
+    Operators on a ChunkedStream handle whole chunks at a time, so the cost of
+    an async generator round-trip is paid once per chunk instead of once per
+    item. Created with `Stream.chunked(size)`.
+    """
+
+    def __init__(self, stream: Stream[Any]):
+        self._stream = stream
+
+    def map(
+        self, fn: Callable[..., Any], vectorized: bool = False
+    ) -> ChunkedStream[Any]:
+        """
+        Applies a function to the items of each chunk.
+
+        :param fn: A per-item function, or a batch-aware function (e.g. a NumPy
+            ufunc) that maps a whole chunk to a sequence of results if `vectorized`.
+        :param vectorized: Whether `fn` receives whole chunks.
+        :return: A ChunkedStream with transformed output.
+        """
+        return ChunkedStream(self._stream._add_op(chunked_map_op(fn, vectorized)))
+
+    def filter(
+        self, predicate: Callable[..., Any], vectorized: bool = False
+    ) -> ChunkedStream[T]:
+        """
+        Filters the items of each chunk.
+
+        :param predicate: A per-item predicate, or a function that maps a whole
+            chunk to a boolean mask if `vectorized`.
+        :param vectorized: Whether `predicate` receives whole chunks.
+        :return: A ChunkedStream containing only the kept items.
+        """
+        return ChunkedStream(
+            self._stream._add_op(chunked_filter_op(predicate, vectorized))
+        )
+
+    def batch(self, size: int = 1) -> ChunkedStream[List[T]]:
+        """
+        Groups items into fixed-size batches, carried across chunk boundaries.
+        The final batch may contain fewer than `size` items.
+
+        :param size: The number of items per batch. Defaults to 1.
+        :return: A ChunkedStream of lists, each containing up to `size` items.
+        """
+        return ChunkedStream(self._stream._add_op(chunked_batch_op(size)))
+
+    def unchunk(self) -> Stream[T]:
+        """
+        Leaves chunked mode, yielding items one by one again.
+
+        :return: A regular Stream over the individual items.
+        """
+        return self._stream._add_op(unchunk_op())
+
+    async def to_list(self) -> List[T]:
+        """
+        Terminal operation that collects all items into a flat list.
+
+        :return: A list of all output items.
+        """
+        return await self._stream._run(chunked_to_list_sink)
+
+    async def reduce(self, reducer: Callable[[U, T], U], initial: U) -> U:
+        """
+        Terminal operation that reduces all items to a single value.
+
+        :param reducer: A function of (accumulator, item) -> new accumulator.
+        :param initial: The initial value for the accumulator.
+        :return: The final reduced value.
+        """
+        return await self._stream._run(
+            lambda pipeline: chunked_reduce_sink(pipeline, reducer, initial)
+        )
@@ -7,18 +7,65 @@ from corstream.ops import (
     filter_op,
     batch_op,
     map_async_op,
+    map_parallel_op,
     log_op,
     catch_op,
     retry_op,
     throttle_op,
+    buffer_op,
+    chunk_op,
+    scan_op,
+    take_op,
+    take_while_op,
+    skip_op,
+    delimited_op,
+    lines_op,
+    length_prefixed_op,
+    fuse_operations,
 )
 
 from corstream.sinks import (
     for_each_sink,
     to_list_sink,
     reduce_sink,
+    first_sink,
+    any_sink,
+    all_sink,
+    to_file_sink,
 )
 
+from corstream.ops.transform.fused import (
+    FusedStages,
+    split_fusable_prefix,
+    iterate_fused,
+    drive_fused,
+)
+from corstream.ops.stage import stage_info
+from corstream.sources import file_source
+from corstream.sources.file import PathLike
+from corstream.sinks.terminal.to_file import WriteStats
+from corstream.ops.fanout.tee import tee_sources
+from corstream.ops.aggregate.reducer import Reducer
+from corstream.ops.fanin.merge import merge_sources
+from corstream.ops.fanin.zip import zip_sources
+from corstream.ops.fanin.interleave import interleave_sources
+from corstream.ops.asyncflow.adaptive import AdaptiveConcurrency
+from corstream.ops.asyncflow.cache import Cache
+from corstream.ops.control.limiter import RateLimiter
+from corstream.ops.control.retry import RetryPolicy
+from corstream.ops.control.deadline import StageTracker, run_with_deadline
+from corstream.ops.diagnostic.log import LogSink
+from corstream.ops.diagnostic.metrics import PipelineMetrics, instrument_operations
+from corstream.chunked import ChunkedStream
+from corstream.grouped import GroupedStream
+from corstream.partitioned import PartitionedStream
+from corstream.ops.parallel.process_pipeline import StageGroup, process_pipeline_op
+
+from concurrent.futures import Executor
+from multiprocessing.context import BaseContext
+import copy
+import functools
+
 from collections.abc import (
     AsyncIterable as AsyncIterableABC,
     Iterable as IterableABC,
@@ -27,60 +74,266 @@ from collections.abc import (
 from typing import (
     Any,
     AsyncIterable,
-    AsyncIterator,
     Awaitable,
     Callable,
+    Dict,
     Generic,
+    Hashable,
     TypeVar,
     Union,
     List,
+    cast,
     Optional,
+    Sequence,
+    Tuple,
 )
 
 T = TypeVar("T")
 U = TypeVar("U")
+R = TypeVar("R")
 
 Operator = Callable[[AsyncIterable[Any]], AsyncIterable[Any]]
 
+# The fused source stages and the remaining operators of a compiled chain.
+CompiledChain = Tuple[FusedStages, List[Operator]]
+
 
 class Stream(Generic[T]):
     """
     Core abstraction representing a lazy, asynchronous data pipeline.
 
-    Stream wraps an asynchronous iterable and allows chained transformation
-    operations (like `map`, `filter`, etc.) that are only executed when a
-    terminal sink (e.g. `for_each`, `to_list`) is called.
+    Stream wraps an asynchronous (or synchronous) iterable and allows chained
+    transformation operations (like `map`, `filter`, etc.) that are only
+    executed when a terminal sink (e.g. `for_each`, `to_list`) is called.
     """
 
-    def __init__(self, source: AsyncIterable[T]):
-        self._source: AsyncIterable[T] = source
+    def __init__(self, source: Union[AsyncIterable[T], IterableABC[T]]):
+        self._source: Union[AsyncIterable[T], IterableABC[T]] = source
         self._operations: List[Operator] = []
+        self._instrumented = False
+        self._metrics: Optional[PipelineMetrics] = None
+        self._on_run: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self._prefetch: Optional[int] = None
+        self._deadline: Optional[float] = None
+        # Chains precompiled by a Pipeline, keyed by whether the source is sync.
+        self._compiled: Optional[Dict[bool, CompiledChain]] = None
 
     def _add_op(self, op: Operator) -> Stream[Any]:
         """
         Internal helper to register a new transformation in the pipeline.
         """
         self._operations.append(op)
+        self._compiled = None
         return self
 
+    def _compile(self, operations: List[Operator], sync_source: bool) -> CompiledChain:
+        """
+        Compiles an operator chain: with a synchronous source, its leading run
+        of fusable stages is split off to be applied while adapting the source;
+        the rest is fused and, if prefetch is enabled, buffered.
+        """
+        stages: FusedStages = ()
+        if sync_source:
+            stages, operations = split_fusable_prefix(operations)
+        operations = fuse_operations(operations)
+        if self._prefetch is not None:
+            operations = self._with_prefetch(operations, self._prefetch)
+        return stages, operations
+
     def apply(self) -> AsyncIterable[Any]:
         """
         Builds the final async iterable by applying all registered operations
         in order. This does not start iteration.
+
+        Consecutive synchronous `map`/`filter` stages are fused into a single
+        operator so they don't pay one async generator round-trip per stage.
+        With a synchronous source, the leading run of such stages is applied
+        inside the loop that adapts the source.
         """
-        current = self._source
-        for op in self._operations:
-            current = op(current)
-        return current
+        return self._build()[0]
 
-    def log(self, label: Optional[str] = None) -> Stream[T]:
+    def _build(
+        self,
+    ) -> Tuple[AsyncIterable[Any], Optional[StageTracker], Optional[PipelineMetrics]]:
+        """
+        Builds the pipeline for one run, together with that run's StageTracker
+        when a deadline is set and its PipelineMetrics when instrumented
+        (each None otherwise).
+        """
+        metrics: Optional[PipelineMetrics] = None
+        current: AsyncIterable[Any]
+        operations: List[Operator] = self._operations
+        sync_source = not isinstance(self._source, AsyncIterableABC)
+        if self._instrumented:
+            # Instrumented stages are never fused, so each is measured on its own.
+            operations, metrics = instrument_operations(operations)
+            self._metrics = metrics
+            stages, operations = self._compile(operations, sync_source)
+        elif self._compiled is not None:
+            stages, operations = self._compiled[sync_source]
+        else:
+            stages, operations = self._compile(operations, sync_source)
+        if sync_source:
+            source = cast(IterableABC[Any], self._source)
+            info = stage_info(operations[0]) if operations and not stages else None
+            if info is not None and info.name == "chunk" and info.fn is not None:
+                # Chunks of a sync source are sliced off in bulk.
+                source, operations = info.fn(source), operations[1:]
+            current = iterate_fused(source, stages)
+        else:
+            current = cast(AsyncIterable[Any], self._source)
+        if self._deadline is None:
+            for op in operations:
+                current = op(current)
+            return current, None, metrics
+        # Under a deadline, every stage reports whether it was the one stuck.
+        tracker = StageTracker()
+        current = tracker.trace(current, "0:source")
+        for index, op in enumerate(operations, 1):
+            info = stage_info(op)
+            name = info.name if info else getattr(op, "__name__", "op")
+            current = tracker.trace(op(current), f"{index}:{name}")
+        return current, tracker, metrics
+
+    @staticmethod
+    def _with_prefetch(operations: List[Operator], depth: int) -> List[Operator]:
         """
-        Logs each item in the stream for debugging. Passes items through unchanged.
+        Puts a bounded buffer at every stage boundary (after the source and
+        after each operator) that isn't already buffered explicitly.
+        """
+
+        def buffered(op: Optional[Operator]) -> bool:
+            info = stage_info(op) if op is not None else None
+            return info is not None and info.name == "buffer"
+
+        result: List[Operator] = []
+        previous: Optional[Operator] = None
+        for op in [*operations, None]:
+            if not buffered(previous) and not buffered(op):
+                result.append(buffer_op(depth))
+            if op is not None:
+                result.append(op)
+            previous = op
+        return result
+
+    def _sync_plan(self) -> Optional[Tuple[IterableABC[Any], FusedStages]]:
+        """
+        Returns the source and stages when the whole pipeline is synchronous
+        (a sync source followed only by fusable `map`/`filter` stages), so a
+        sink can run it as a plain loop. Returns None otherwise.
+        """
+        if (
+            self._instrumented
+            or self._prefetch is not None
+            or self._deadline is not None
+            or isinstance(self._source, AsyncIterableABC)
+        ):
+            return None
+        if self._compiled is not None:
+            stages, rest = self._compiled[True]
+        else:
+            stages, rest = split_fusable_prefix(self._operations)
+        if rest:
+            return None
+        return self._source, stages
+
+    def with_metrics(
+        self, on_run: Optional[Callable[[Dict[str, Any]], Any]] = None
+    ) -> Stream[T]:
+        """
+        Enables per-stage instrumentation: items in/out, wall time, time spent
+        waiting on upstream versus doing its own work, error counts and
+        latency histograms. Disabled by default, and free when disabled.
+
+        Every run records into metrics of its own. `metrics()` shows the most
+        recently started run; to tell concurrent runs apart, pass `on_run`.
+
+        :param on_run: Optional callable receiving the final snapshot (as
+            returned by `metrics()`) of every terminal operation's run, once
+            it has finished or failed.
+        :return: The same stream with instrumentation enabled.
+        """
+        self._instrumented = True
+        self._on_run = on_run
+        return self
+
+    def with_deadline(self, seconds: float) -> Stream[T]:
+        """
+        Bounds how long a terminal operation (`to_list`, `reduce`, ...) may run.
+        On expiry, outstanding work is cancelled, every generator of the
+        pipeline is closed and DeadlineExceededError is raised, naming the
+        stage the pipeline was waiting on.
+
+        :param seconds: The maximum run time, in seconds.
+        :return: The same stream with the deadline set.
+        """
+        if seconds <= 0:
+            raise ValueError("Deadline must be positive.")
+        self._deadline = seconds
+        return self
+
+    async def _run(self, sink: Callable[[AsyncIterable[Any]], Awaitable[R]]) -> R:
+        """
+        Builds the pipeline and awaits a terminal operation on it, enforcing
+        the deadline if one is set. Concurrent runs never share a tracker or
+        metrics; the metrics of the run are passed to `on_run`, if set.
+        """
+        pipeline, tracker, metrics = self._build()
+        try:
+            if self._deadline is None:
+                return await sink(pipeline)
+            return await run_with_deadline(sink(pipeline), self._deadline, tracker)
+        finally:
+            if metrics is not None and self._on_run is not None:
+                self._on_run(metrics.snapshot())
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Returns a structured snapshot of the per-stage metrics of the most
+        recently started run. Can be polled while the stream is running.
+
+        :return: A dictionary with one entry per stage under "stages".
+        """
+        if not self._instrumented:
+            raise RuntimeError("Metrics are disabled; call with_metrics() first.")
+        if self._metrics is None:
+            return {"stages": []}
+        return self._metrics.snapshot()
+
+    def log(
+        self,
+        label: Optional[str] = None,
+        sample: float = 1.0,
+        rate_limit: Optional[float] = None,
+        formatter: Optional[Callable[[T], str]] = None,
+        sink: Optional[LogSink] = None,
+        queue_size: int = 1024,
+        flush_timeout: Optional[float] = 1.0,
+    ) -> Stream[T]:
+        """
+        Logs items in the stream. Passes items through unchanged.
+
+        Records are written by a background thread through a bounded queue, so
+        logging never blocks the event loop; records that don't fit are dropped
+        and counted (see `metrics()`). Unsampled items are never formatted.
 
         :param label: Optional label to prefix each log entry.
+        :param sample: The fraction of items to log, in (0, 1].
+        :param rate_limit: Optional maximum number of records per second.
+        :param formatter: Optional function turning an item into a log record.
+        :param sink: A logging.Logger or a callable taking the record.
+            Defaults to printing to stdout.
+        :param queue_size: The maximum number of records waiting to be written.
+        :param flush_timeout: The maximum number of seconds a completed stream
+            waits for its records to be written (None waits for all); the rest
+            are dropped and counted.
         :return: The same stream with logging side effects.
         """
-        return self._add_op(log_op(label))
+        return self._add_op(
+            log_op(
+                label, sample, rate_limit, formatter, sink, queue_size, flush_timeout
+            )
+        )
 
     def catch(self, handler: Callable[[Exception], Optional[T]]) -> Stream[T]:
         """
@@ -95,6 +348,8 @@ class Stream(Generic[T]):
     def retry(self, retries: int = 3, delay: float = 0.0) -> Stream[T]:
         """
         Adds retry logic to the previous operation in the stream.
+        To re-run a failed call for a single item, use `map(fn, retry=RetryPolicy(...))`
+        or `map_async(fn, retry=RetryPolicy(...))` instead.
 
         :param retries: Number of times to retry the previous operation on failure.
         :param delay: Optional delay in seconds between retries.
@@ -102,60 +357,373 @@ class Stream(Generic[T]):
         """
         return self._add_op(retry_op(retries, delay))
 
-    def throttle(self, rate: int, per_seconds: float) -> Stream[T]:
+    def buffer(self, size: int, policy: str = "block") -> Stream[T]:
         """
-        Throttles the stream to allow only `rate` items per `per_seconds`.
+        Runs the upstream in its own task, connected to the rest of the
+        pipeline by a bounded buffer, so upstream latency overlaps with
+        downstream work.
+
+        :param size: The maximum number of buffered items.
+        :param policy: What to do when the buffer is full: "block" (backpressure),
+            "drop_oldest" or "drop_newest".
+        :return: A new Stream with buffering applied.
+        """
+        return self._add_op(buffer_op(size, policy))
+
+    def prefetch(self, depth: int = 1) -> Stream[T]:
+        """
+        Sets a stream-wide default prefetch depth: every stage boundary runs as
+        its own task connected by a blocking buffer of `depth` items.
+
+        :param depth: The number of items each stage may run ahead.
+        :return: The same stream with prefetching enabled.
+        """
+        if depth <= 0:
+            raise ValueError("Prefetch depth must be a positive integer.")
+        self._prefetch = depth
+        self._compiled = None
+        return self
+
+    def throttle(
+        self,
+        rate: Optional[float] = None,
+        per_seconds: float = 1.0,
+        burst: float = 1,
+        cost: Optional[Callable[[T], float]] = None,
+        limiter: Optional[RateLimiter] = None,
+    ) -> Stream[T]:
+        """
+        Throttles the stream to allow only `rate` items per `per_seconds`,
+        with bursts of up to `burst` items after an idle period.
 
-        :param rate: Maximum number of items to process per time window.
+        :param rate: Maximum number of items (or units of cost) per time window.
         :param per_seconds: Time window in seconds.
+        :param burst: Number of units that may pass back-to-back.
+        :param cost: Optional function giving the weight of each item.
+        :param limiter: A RateLimiter shared with other streams, used instead of `rate`.
         :return: A new Stream with throttling applied.
         """
-        return self._add_op(throttle_op(rate, per_seconds))
+        return self._add_op(throttle_op(rate, per_seconds, burst, cost, limiter))
 
-    def map(self, fn: Callable[[T], Union[U, Awaitable[U]]]) -> "Stream[U]":
+    def map(
+        self,
+        fn: Callable[[T], Union[U, Awaitable[U]]],
+        retry: Optional[RetryPolicy] = None,
+        timeout: Optional[float] = None,
+    ) -> "Stream[U]":
         """
         Applies a transformation function to each item in the stream.
         Supports both synchronous and asynchronous functions.
 
         :param fn: A function to apply to each item.
+        :param retry: Optional RetryPolicy to re-invoke `fn` for items that fail.
+        :param timeout: Optional maximum number of seconds to await `fn` per item.
         :return: A new Stream with transformed output.
         """
-        return self._add_op(map_op(fn))
+        return self._add_op(map_op(fn, retry, timeout))
 
     def map_async(
-        self, fn: Callable[[T], Awaitable[U]], max_concurrent: int = 5
+        self,
+        fn: Callable[[T], Awaitable[U]],
+        max_concurrent: int = 5,
+        ordered: bool = False,
+        limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        cache: Optional[Cache[T, U]] = None,
+        adaptive: Optional[AdaptiveConcurrency] = None,
+        timeout: Optional[float] = None,
     ) -> "Stream[U]":
         """
         Applies an async function to items in the stream concurrently,
-        with a controlled concurrency limit.
+        with a controlled concurrency limit. Results are streamed downstream
+        as soon as they complete.
 
         :param fn: An async function to map over each item.
         :param max_concurrent: Maximum number of concurrent async calls.
+        :param ordered: If True, preserve input order; otherwise yield in completion order.
+        :param limiter: Optional RateLimiter that every call to `fn` draws from.
+        :param retry: Optional RetryPolicy to re-invoke `fn` for items that fail.
+        :param cache: Optional Cache of results; repeated and concurrent keys are
+            served from it instead of calling `fn` again.
+        :param adaptive: Optional AdaptiveConcurrency controller that replaces
+            `max_concurrent` with a limit adjusted to observed latency and errors.
+        :param timeout: Optional maximum number of seconds per call to `fn`.
+        :return: A new Stream with transformed output.
+        """
+        return self._add_op(
+            map_async_op(
+                fn, max_concurrent, ordered, limiter, retry, cache, adaptive, timeout
+            )
+        )
+
+    def map_parallel(
+        self,
+        fn: Callable[[T], U],
+        executor: Union[str, Executor] = "thread",
+        workers: Optional[int] = None,
+        chunksize: int = 1,
+        ordered: bool = True,
+        max_pending: Optional[int] = None,
+    ) -> "Stream[U]":
+        """
+        Applies a synchronous function to items in a thread or process pool,
+        for CPU-bound or blocking stages that would otherwise stall the event loop.
+
+        :param fn: A sync function to apply to each item (picklable for processes).
+        :param executor: "thread", "process", or an existing concurrent.futures Executor.
+        :param workers: Pool size. Defaults to the CPU count.
+        :param chunksize: Number of items sent to a worker per call.
+        :param ordered: If True, preserve input order.
+        :param max_pending: Maximum number of chunks in flight. Defaults to 2 * workers.
         :return: A new Stream with transformed output.
         """
-        return self._add_op(map_async_op(fn, max_concurrent))
+        return self._add_op(
+            map_parallel_op(fn, executor, workers, chunksize, ordered, max_pending)
+        )
 
     def filter(
-        self, predicate: Callable[[T], Union[bool, Awaitable[bool]]]
+        self,
+        predicate: Callable[[T], Union[bool, Awaitable[bool]]],
+        timeout: Optional[float] = None,
     ) -> Stream[T]:
         """
         Filters items in the stream using the given predicate function.
         Supports both synchronous and asynchronous predicates.
 
         :param predicate: A function that returns True to keep the item.
+        :param timeout: Optional maximum number of seconds to await the predicate per item.
         :return: A Stream containing only items where predicate(item) is True.
         """
-        return self._add_op(filter_op(predicate))
+        return self._add_op(filter_op(predicate, timeout))
+
+    def take(self, n: int) -> Stream[T]:
+        """
+        Keeps only the first `n` items. Once they have passed, the upstream
+        pipeline is closed and in-flight `map_async` tasks are cancelled.
 
-    def batch(self, size: int = 1) -> "Stream[List[T]]":
+        :param n: The number of items to take.
+        :return: A Stream of at most `n` items.
+        """
+        return self._add_op(take_op(n))
+
+    def take_while(
+        self, predicate: Callable[[T], Union[bool, Awaitable[bool]]]
+    ) -> Stream[T]:
+        """
+        Keeps items while the predicate holds and stops at the first item
+        that fails it, closing the upstream pipeline.
+
+        :param predicate: A function (sync or async) that returns True to continue.
+        :return: A Stream of the leading items that satisfy the predicate.
+        """
+        return self._add_op(take_while_op(predicate))
+
+    def skip(self, n: int) -> Stream[T]:
+        """
+        Drops the first `n` items.
+
+        :param n: The number of items to skip.
+        :return: A Stream without its first `n` items.
+        """
+        return self._add_op(skip_op(n))
+
+    def batch(
+        self,
+        size: int = 1,
+        max_wait: Optional[float] = None,
+        target_latency: Optional[float] = None,
+        min_size: int = 1,
+        max_size: Optional[int] = None,
+    ) -> "Stream[List[T]]":
         """
         Groups stream items into batches of fixed size.
         The final batch may contain fewer than `size` items.
 
         :param size: The number of items per batch. Defaults to 1.
+        :param max_wait: Flush a partial batch once it has been open this many seconds.
+        :param target_latency: Adapt the batch size so the downstream spends about
+            this many seconds per batch.
+        :param min_size: Lower bound for the adaptive batch size.
+        :param max_size: Upper bound for the adaptive batch size. Defaults to 16 * size.
         :return: A Stream of lists, each containing up to `size` items.
         """
-        return self._add_op(batch_op(size))
+        return self._add_op(
+            batch_op(size, max_wait, target_latency, min_size, max_size)
+        )
+
+    def run_in_processes(
+        self,
+        *groups: StageGroup,
+        capacity: int = 1 << 20,
+        context: Optional[BaseContext] = None,
+    ) -> Stream[Any]:
+        """
+        Runs groups of stages in separate worker processes, connected by
+        bounded shared-memory ring buffers, so CPU-heavy stages use several
+        cores. Each group is a function adding stages to a Stream::
+
+            stream.run_in_processes(
+                lambda s: s.map(parse),
+                lambda s: s.filter(valid).map(score),
+            )
+
+        Errors raised in any process are re-raised here, and stopping early
+        shuts the workers down. With a start method other than "fork", the
+        groups must be picklable (e.g. module-level functions).
+
+        :param groups: The stage groups, one worker process each, in order.
+        :param capacity: The size of each ring buffer in bytes; bounds the largest item.
+        :param context: Optional multiprocessing context (start method).
+        :return: A Stream of the last group's output.
+        """
+        return self._add_op(process_pipeline_op(groups, capacity, context))
+
+    def chunked(self, size: int = 4096) -> ChunkedStream[T]:
+        """
+        Switches the stream into chunked mode: items are grouped into lists of
+        up to `size` items and subsequent operators work on whole chunks.
+
+        :param size: The maximum number of items per chunk. Defaults to 4096.
+        :return: A ChunkedStream over the same pipeline.
+        """
+        return ChunkedStream(self._add_op(chunk_op(size)))
+
+    def lines(self, keep_ends: bool = False) -> Stream[memoryview]:
+        """
+        Splits a stream of byte chunks (e.g. from `from_file`) into lines.
+        Lines within a chunk are zero-copy memoryview slices of it; only lines
+        that straddle two chunks are copied.
+
+        :param keep_ends: Whether lines include their trailing newline.
+        :return: A Stream of memoryviews, one per line.
+        """
+        return self._add_op(lines_op(keep_ends))
+
+    def delimited(
+        self, delimiter: bytes, keep_ends: bool = False
+    ) -> Stream[memoryview]:
+        """
+        Splits a stream of byte chunks into records separated by `delimiter`,
+        copying only the records that straddle two chunks.
+
+        :param delimiter: The non-empty byte string separating records.
+        :param keep_ends: Whether records include their trailing delimiter.
+        :return: A Stream of memoryviews, one per record.
+        """
+        return self._add_op(delimited_op(delimiter, keep_ends))
+
+    def length_prefixed(
+        self, prefix_size: int = 4, byteorder: str = "big"
+    ) -> Stream[memoryview]:
+        """
+        Splits a stream of byte chunks into records that are each preceded by
+        their length, copying only the records that straddle two chunks.
+
+        :param prefix_size: The size of the unsigned length prefix in bytes (1, 2, 4 or 8).
+        :param byteorder: The byte order of the prefix, "big" or "little".
+        :return: A Stream of memoryviews over the record payloads.
+        """
+        return self._add_op(length_prefixed_op(prefix_size, byteorder))
+
+    def scan(
+        self,
+        reducer: Union[Callable[[U, T], U], Reducer[T, U]],
+        initial: Optional[U] = None,
+        emit_every: Optional[int] = None,
+        interval: Optional[float] = None,
+    ) -> "Stream[U]":
+        """
+        Folds items into a running accumulator and emits snapshots of it, so
+        reductions over large or endless sources can be observed as they go.
+
+        :param reducer: A function of (accumulator, item) -> new accumulator,
+            or a Reducer (whose `initial()` is used when `initial` is None).
+        :param initial: The initial value for the accumulator (copied per run).
+        :param emit_every: Emit a snapshot every this many items.
+        :param interval: Emit a snapshot at most every this many seconds.
+        :return: A Stream of accumulator snapshots (shallow copies).
+        """
+        if isinstance(reducer, Reducer) and initial is None:
+            # A fresh accumulator per run, so reruns never share one.
+            return self._add_op(
+                scan_op(reducer.step, reducer.initial, emit_every, interval)
+            )
+        step, start = _reduction(reducer, initial)
+        return self._add_op(
+            scan_op(step, lambda: copy.copy(start), emit_every, interval)
+        )
+
+    def group_by(self, key: Callable[[T], Hashable]) -> GroupedStream[T]:
+        """
+        Groups items by key, to be aggregated with `.window(...)`.
+
+        :param key: Function extracting the grouping key of an item.
+        :return: A GroupedStream over the same pipeline.
+        """
+        return GroupedStream(self, key)
+
+    def partition_by(
+        self, key: Callable[[T], Hashable], shards: int = 4, queue_size: int = 8
+    ) -> PartitionedStream[T]:
+        """
+        Partitions items by key into `shards` shards, for a following
+        `.map_async(...)` that keeps items of one key in order while
+        different shards run concurrently.
+
+        :param key: Function extracting the partitioning key of an item.
+        :param shards: The number of shards (and concurrent workers).
+        :param queue_size: The maximum number of items waiting per shard.
+        :return: A PartitionedStream over the same pipeline.
+        """
+        if shards <= 0:
+            raise ValueError("shards must be >= 1")
+        if queue_size <= 0:
+            raise ValueError("queue_size must be >= 1")
+        return PartitionedStream(self, key, shards, queue_size)
+
+    def tee(
+        self,
+        n: int = 2,
+        max_lag: int = 1024,
+        lossy: Union[bool, Sequence[bool]] = False,
+    ) -> List[Stream[T]]:
+        """
+        Fans the stream out into `n` child streams fed from a single pass over
+        this pipeline. Children share one buffer; the slowest non-lossy child
+        applies backpressure once it is `max_lag` items behind, so all of them
+        must be consumed concurrently (e.g. with `asyncio.gather`).
+
+        :param n: Number of child streams.
+        :param max_lag: Maximum number of items buffered between the fastest
+            and the slowest non-lossy child.
+        :param lossy: Whether children may drop items instead of applying
+            backpressure; a single flag or one per child.
+        :return: The child streams.
+        """
+        return [
+            Stream(branch) for branch in tee_sources(self.apply(), n, max_lag, lossy)
+        ]
+
+    def split(
+        self,
+        *predicates: Callable[[T], Union[bool, Awaitable[bool]]],
+        max_lag: int = 1024,
+        lossy: Union[bool, Sequence[bool]] = False,
+    ) -> List[Stream[T]]:
+        """
+        Fans the stream out into one child stream per predicate; each child
+        only receives the items its predicate accepts. Built on `tee`, with
+        the same buffering and backpressure rules.
+
+        :param predicates: One filter (sync or async) per child stream.
+        :param max_lag: Maximum number of items buffered between children.
+        :param lossy: Whether children may drop items instead of applying backpressure.
+        :return: The child streams, in predicate order.
+        """
+        branches = self.tee(len(predicates), max_lag, lossy)
+        return [
+            branch.filter(predicate) for branch, predicate in zip(branches, predicates)
+        ]
 
     async def for_each(self, fn: Callable[[T], Union[None, Awaitable[None]]]) -> None:
         """
@@ -164,8 +732,11 @@ class Stream(Generic[T]):
 
         :param fn: A function (sync or async) to call for each item.
         """
-        pipeline = self.apply()
-        await for_each_sink(pipeline, fn)
+        plan = self._sync_plan()
+        if plan is not None:
+            await drive_fused(*plan, fn)
+            return
+        await self._run(lambda pipeline: for_each_sink(pipeline, fn))
 
     async def to_list(self) -> List[T]:
         """
@@ -174,20 +745,201 @@ class Stream(Generic[T]):
 
         :return: A list of all output items.
         """
-        pipeline = self.apply()
-        return await to_list_sink(pipeline)
-
-    async def reduce(self, reducer: Callable[[U, T], U], initial: U) -> U:
+        plan = self._sync_plan()
+        if plan is not None:
+            source, stages = plan
+            if not stages:
+                return list(source)
+            result: List[T] = []
+            await drive_fused(source, stages, result.append)
+            return result
+        return await self._run(to_list_sink)
+
+    async def reduce(
+        self,
+        reducer: Union[Callable[[U, T], U], Reducer[T, U]],
+        initial: Optional[U] = None,
+    ) -> U:
         """
         Terminal operation that reduces the stream to a single value using a reducer function.
         This triggers pipeline execution.
 
-        :param reducer: A function of (accumulator, item) -> new acumulator.
+        :param reducer: A function of (accumulator, item) -> new acumulator, or a
+            Reducer (whose `initial()` is used when `initial` is None).
         :param initial: The initial value for the accumulator.
         :return: The final reduced value.
         """
-        pipeline = self.apply()
-        return await reduce_sink(pipeline, reducer, initial)
+        reducer, initial = _reduction(reducer, initial)
+        plan = self._sync_plan()
+        if plan is not None:
+            source, stages = plan
+            if not stages:
+                return functools.reduce(reducer, source, initial)
+            acc = [initial]
+
+            def step(item: T) -> None:
+                acc[0] = reducer(acc[0], item)
+
+            await drive_fused(source, stages, step)
+            return acc[0]
+        return await self._run(lambda pipeline: reduce_sink(pipeline, reducer, initial))
+
+    async def to_file(
+        self,
+        path: PathLike,
+        format: str = "jsonl",
+        buffer_size: int = 1 << 20,
+        rotate_bytes: Optional[int] = None,
+        compress: Optional[str] = None,
+        batch_size: int = 1024,
+        fields: Optional[Sequence[str]] = None,
+    ) -> WriteStats:
+        """
+        Terminal operation that writes all items to a file. Serialization and
+        file I/O run in batches on a dedicated writer thread, overlapped with
+        the rest of the pipeline, so the event loop never blocks on the disk.
+
+        :param path: The file to write; numbered per part with `rotate_bytes`.
+        :param format: "jsonl", "csv" (sequence or dict rows) or "bytes".
+        :param buffer_size: The number of bytes buffered per write call.
+        :param rotate_bytes: Optional size, in uncompressed bytes, at which a
+            new file is started.
+        :param compress: Optional compression, "gzip".
+        :param batch_size: The number of items per batch handed to the writer.
+        :param fields: Optional CSV header (the column order for dict rows).
+        :return: A WriteStats with the items and bytes written and the files created.
+        """
+        return await self._run(
+            lambda pipeline: to_file_sink(
+                pipeline,
+                path,
+                format,
+                buffer_size,
+                rotate_bytes,
+                compress,
+                batch_size,
+                fields,
+            )
+        )
+
+    async def first(self, default: Optional[T] = None) -> Optional[T]:
+        """
+        Terminal operation that returns the first item and stops the pipeline
+        without consuming the rest of the source.
+
+        :param default: The value returned if the stream is empty.
+        :return: The first output item, or `default`.
+        """
+        return await self._run(lambda pipeline: first_sink(pipeline, default))
+
+    async def any(
+        self, predicate: Optional[Callable[[T], Union[bool, Awaitable[bool]]]] = None
+    ) -> bool:
+        """
+        Terminal operation that returns True as soon as an item satisfies the
+        predicate (or is truthy, without one), stopping the pipeline there.
+
+        :param predicate: An optional function (sync or async).
+        :return: Whether any item matched.
+        """
+        return await self._run(lambda pipeline: any_sink(pipeline, predicate))
+
+    async def all(
+        self, predicate: Optional[Callable[[T], Union[bool, Awaitable[bool]]]] = None
+    ) -> bool:
+        """
+        Terminal operation that returns False as soon as an item fails the
+        predicate (or is falsy, without one), stopping the pipeline there.
+
+        :param predicate: An optional function (sync or async).
+        :return: Whether every item matched.
+        """
+        return await self._run(lambda pipeline: all_sink(pipeline, predicate))
+
+    @classmethod
+    def from_file(
+        cls, path: PathLike, mode: str = "chunked", chunk_size: int = 1 << 20
+    ) -> Stream[memoryview]:
+        """
+        Creates a stream of memoryview chunks over a binary file, read without
+        copying them into `bytes`. Split it into records with `lines`,
+        `delimited` or `length_prefixed`.
+
+        In "chunked" mode each chunk gets a buffer of its own; in "mmap" mode
+        views are slices of a memory map. "reuse" reads into a single buffer,
+        so a view is only valid until the next chunk is read; opt into it only
+        when no stage holds on to views (see `file_source`).
+
+        :param path: The file to read.
+        :param mode: "chunked", "mmap" or "reuse".
+        :param chunk_size: The number of bytes per chunk.
+        :return: A new Stream of memoryviews.
+        """
+        return Stream(file_source(path, mode, chunk_size))
+
+    @classmethod
+    def merge(
+        cls,
+        *sources: Union[Stream[Any], IterableABC[Any], AsyncIterableABC[Any]],
+        max_concurrent_sources: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> Stream[Any]:
+        """
+        Creates a stream that pulls from several sources concurrently and
+        yields their items in arrival order. Remaining sources are cancelled
+        and closed when the consumer stops early.
+
+        :param sources: Streams, iterables or async iterables to merge.
+        :param max_concurrent_sources: Maximum number of sources pulled at once.
+        :param prefetch: Per-source number of items buffered ahead of the consumer.
+        :return: A Stream over the merged items.
+        """
+        return cls(
+            merge_sources(
+                [_as_async(source) for source in sources],
+                max_concurrent_sources,
+                prefetch,
+            )
+        )
+
+    @classmethod
+    def zip(
+        cls,
+        *sources: Union[Stream[Any], IterableABC[Any], AsyncIterableABC[Any]],
+        prefetch: int = 1,
+    ) -> Stream[Tuple[Any, ...]]:
+        """
+        Creates a stream of tuples pairing up the items of several sources,
+        which are pulled concurrently. Ends with the shortest source.
+
+        :param sources: Streams, iterables or async iterables to zip.
+        :param prefetch: Per-source number of items buffered ahead of the consumer.
+        :return: A Stream of tuples.
+        """
+        return Stream(zip_sources([_as_async(source) for source in sources], prefetch))
+
+    @classmethod
+    def interleave(
+        cls,
+        *sources: Union[Stream[Any], IterableABC[Any], AsyncIterableABC[Any]],
+        weights: Optional[Sequence[float]] = None,
+        prefetch: int = 1,
+    ) -> Stream[Any]:
+        """
+        Creates a stream that pulls from several sources concurrently and
+        interleaves their items by priority weight; sources with no item ready
+        never hold the others back.
+
+        :param sources: Streams, iterables or async iterables to interleave.
+        :param weights: Relative priority of each source. Defaults to equal weights.
+        :param prefetch: Per-source number of items buffered ahead of the consumer.
+        :return: A Stream over the interleaved items.
+        """
+        return cls(
+            interleave_sources(
+                [_as_async(source) for source in sources], weights, prefetch
+            )
+        )
 
     @classmethod
     def from_iterable(
@@ -204,11 +956,33 @@ class Stream(Generic[T]):
             return cls(iterable)
 
         if isinstance(iterable, IterableABC):  # Iterable
+            # Kept synchronous: adapted lazily in apply(), or run as a plain
+            # loop by the sinks when the whole pipeline is synchronous.
+            return cls(iterable)
 
-            async def gen() -> AsyncIterator[T]:
-                for item in iterable:
-                    yield item
+        raise TypeError("Provided input must be an iterable or async iterable.")
 
-            return cls(gen())
 
-        raise TypeError("Provided input must be an iterable or async iterable.")
+def _as_async(
+    source: Union[Stream[Any], IterableABC[Any], AsyncIterableABC[Any]],
+) -> AsyncIterable[Any]:
+    """
+    Turns a Stream, iterable or async iterable into an async iterable.
+    """
+    if isinstance(source, Stream):
+        return source.apply()
+    return Stream.from_iterable(source).apply()
+
+
+def _reduction(
+    reducer: Union[Callable[[U, T], U], Reducer[T, U]], initial: Optional[U]
+) -> Tuple[Callable[[U, T], U], U]:
+    """
+    Normalizes a reducer function or Reducer object to a (step, initial) pair.
+    Only a Reducer can supply its own initial value.
+    """
+    if isinstance(reducer, Reducer):
+        return reducer.step, reducer.initial() if initial is None else initial
+    if initial is None:
+        raise ValueError("A reducer function needs an initial value.")
+    return reducer, initial
@@ -0,0 +1,68 @@
+# corstream/errors.py
+
+import asyncio
+from typing import Any, Optional
+
+
+class CorstreamError(Exception):
+    """
+    Base class for errors raised by corstream itself.
+    """
+
+
+class StageTimeoutError(CorstreamError, asyncio.TimeoutError):
+    """
+    Raised when a single call in a stage takes longer than its `timeout`.
+
+    :param stage: The name of the stage (e.g. "map_async").
+    :param timeout: The timeout that was exceeded, in seconds.
+    :param item: The item being processed.
+    """
+
+    def __init__(self, stage: str, timeout: float, item: Any = None):
+        super().__init__(f"Stage {stage!r} timed out after {timeout}s")
+        self.stage = stage
+        self.timeout = timeout
+        self.item = item
+
+
+class DeadlineExceededError(CorstreamError, asyncio.TimeoutError):
+    """
+    Raised when a stream does not finish within its deadline. Outstanding work
+    has been cancelled and the pipeline closed by the time it is raised.
+
+    :param deadline: The deadline that was exceeded, in seconds.
+    :param stage: The stage the pipeline was waiting on when it expired,
+        as "<index>:<name>" (index 0 is the source), or "sink" if the
+        terminal operation itself was busy.
+    """
+
+    def __init__(self, deadline: float, stage: Optional[str] = None):
+        where = f"; stuck in stage {stage}" if stage is not None else ""
+        super().__init__(f"Stream deadline of {deadline}s exceeded{where}")
+        self.deadline = deadline
+        self.stage = stage
+
+
+class RetryDeadlineError(CorstreamError, asyncio.TimeoutError):
+    """
+    Raised when the retries of one item do not succeed within the `deadline`
+    of their RetryPolicy. The last failure is chained as `__cause__`.
+
+    :param deadline: The retry deadline that was exceeded, in seconds.
+    :param attempts: The number of attempts made.
+    """
+
+    def __init__(self, deadline: float, attempts: int):
+        super().__init__(
+            f"Retry deadline of {deadline}s exceeded after {attempts} attempts"
+        )
+        self.deadline = deadline
+        self.attempts = attempts
+
+
+class WorkerError(CorstreamError):
+    """
+    Raised when a worker process of `Stream.run_in_processes` dies, or fails
+    with an exception that cannot be sent back to the parent as is.
+    """
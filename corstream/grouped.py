@@ -0,0 +1,86 @@
+# corstream/grouped.py
+
+from __future__ import annotations
+
+from corstream.ops.aggregate.reducer import Reducer
+from corstream.ops.aggregate.window import WindowResult, window_op
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Hashable,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from corstream.core import Stream
+
+T = TypeVar("T")
+
+
+class GroupedStream(Generic[T]):
+    """
+    A Stream whose items are grouped by key, awaiting a windowed aggregation.
+    Created with `Stream.group_by(key)`.
+    """
+
+    def __init__(self, stream: Stream[T], key: Callable[[T], Hashable]):
+        self._stream = stream
+        self._key = key
+
+    def window(
+        self,
+        kind: str = "tumbling",
+        *,
+        size: Optional[float] = None,
+        slide: Optional[float] = None,
+        gap: Optional[float] = None,
+        reducer: Optional[Union[Callable[[Any, T], Any], Reducer[T, Any]]] = None,
+        initial: Any = None,
+        timestamp: Optional[Callable[[T], float]] = None,
+        allowed_lateness: float = 0.0,
+        on_late: Optional[Callable[[T], Union[None, Awaitable[None]]]] = None,
+        max_keys: Optional[int] = 100_000,
+        combine: Optional[Callable[[Any, Any], Any]] = None,
+    ) -> Stream[WindowResult]:
+        """
+        Aggregates each key over "tumbling", "sliding" or "session" windows and
+        emits a WindowResult(key, start, end, value, items) as each window closes.
+
+        :param kind: One of "tumbling", "sliding" or "session".
+        :param size: Window length in seconds (tumbling, sliding).
+        :param slide: Interval between window starts in seconds (sliding).
+        :param gap: Inactivity gap that closes a session, in seconds.
+        :param reducer: Function of (accumulator, item) -> new accumulator, or a
+            Reducer. Defaults to counting.
+        :param initial: Initial accumulator of every window (use an immutable value).
+        :param timestamp: Function returning an item's event time. Defaults to arrival time.
+        :param allowed_lateness: How far behind the newest timestamp items may still arrive.
+        :param on_late: Optional side output (sync or async) for late items; dropped otherwise.
+        :param max_keys: Bound on keys with open windows (None for none); the least
+            recently updated key is flushed early beyond it. Defaults to 100,000.
+        :param combine: Function merging two accumulators; needed to merge session
+            windows bridged by a late item when `reducer` is a plain function.
+        :return: A Stream of WindowResult items.
+        """
+        return self._stream._add_op(
+            window_op(
+                self._key,
+                kind,
+                size,
+                slide,
+                gap,
+                reducer,
+                initial,
+                timestamp,
+                allowed_lateness,
+                on_late,
+                max_keys,
+                combine,
+            )
+        )
@@ -1,20 +1,53 @@
 from .transform.map import map_op
 from .transform.filter import filter_op
 from .transform.batch import batch_op
+from .transform.fused import fused_op, fuse_operations
+
+from .chunked.chunk import chunk_op, unchunk_op
+from .chunked.map import chunked_map_op
+from .chunked.filter import chunked_filter_op
+from .chunked.batch import chunked_batch_op
 
 from .asyncflow.map_async import map_async_op
+from .asyncflow.partitioned import partitioned_map_op
+from .parallel.map_parallel import map_parallel_op
+from .binary.delimited import delimited_op, lines_op
+from .binary.length_prefixed import length_prefixed_op
+from .aggregate.window import window_op
+from .aggregate.scan import scan_op
 from .diagnostic.log import log_op
 from .control.catch import catch_op
 from .control.retry import retry_op
 from .control.throttle import throttle_op
+from .control.buffer import buffer_op
+from .control.take import take_op, take_while_op
+from .control.skip import skip_op
 
 __all__ = [
     "map_op",
     "filter_op",
     "batch_op",
+    "fused_op",
+    "fuse_operations",
+    "chunk_op",
+    "unchunk_op",
+    "chunked_map_op",
+    "chunked_filter_op",
+    "chunked_batch_op",
     "map_async_op",
+    "partitioned_map_op",
+    "map_parallel_op",
+    "delimited_op",
+    "lines_op",
+    "length_prefixed_op",
+    "window_op",
+    "scan_op",
     "log_op",
     "catch_op",
     "retry_op",
     "throttle_op",
+    "buffer_op",
+    "take_op",
+    "take_while_op",
+    "skip_op",
 ]
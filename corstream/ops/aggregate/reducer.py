@@ -0,0 +1,52 @@
+# corstream/ops/aggregate/reducer.py
+
+from abc import ABC, abstractmethod
+from functools import reduce
+from typing import Generic, Iterable, TypeVar
+
+T = TypeVar("T")
+A = TypeVar("A")
+
+
+class Reducer(ABC, Generic[T, A]):
+    """
+    A combinable reduction: `step` folds one item into an accumulator and
+    `combine` merges two accumulators built independently (e.g. by parallel
+    branches or `map_parallel` chunks). `combine` must be associative and
+    `initial()` must be its identity.
+
+    Partial results of chunks can be merged like so::
+
+        (stream.batch(1000)
+            .map_parallel(reducer.reduce_chunk, executor="process")
+            .reduce(reducer.combine, reducer.initial()))
+    """
+
+    @abstractmethod
+    def initial(self) -> A:
+        """Returns a fresh, empty accumulator."""
+
+    @abstractmethod
+    def step(self, acc: A, item: T) -> A:
+        """Folds one item into an accumulator."""
+
+    @abstractmethod
+    def combine(self, left: A, right: A) -> A:
+        """Merges two accumulators."""
+
+    def reduce_chunk(self, items: Iterable[T]) -> A:
+        """
+        Reduces a whole chunk of items into a partial accumulator.
+        """
+        return reduce(self.step, items, self.initial())
+
+
+def combine_partials(reducer: Reducer[T, A], partials: Iterable[A]) -> A:
+    """
+    Merges partial accumulators with `reducer.combine`.
+
+    :param reducer: The reducer that produced the partials.
+    :param partials: The partial accumulators, in order.
+    :return: The combined accumulator.
+    """
+    return reduce(reducer.combine, partials, reducer.initial())
@@ -0,0 +1,61 @@
+# corstream/ops/aggregate/scan.py
+
+from typing import AsyncIterable, AsyncIterator, Callable, Optional, TypeVar
+import copy
+import time
+
+from corstream.ops.closing import aclosing
+from corstream.ops.stage import describe
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+
+def scan_op(
+    reducer: Callable[[U, T], U],
+    initial: Callable[[], U],
+    emit_every: Optional[int] = None,
+    interval: Optional[float] = None,
+) -> Callable[[AsyncIterable[T]], AsyncIterable[U]]:
+    """
+    Creates an incremental reduce: folds items into a running accumulator and
+    emits snapshots of it as an intermediate stage.
+
+    A snapshot is emitted after every `emit_every` items and/or whenever
+    `interval` seconds have passed since the previous one (checked as items
+    arrive). The final accumulator is always emitted when the source ends,
+    unless it was just emitted. With neither option, every item emits.
+
+    Snapshots are shallow copies, so a reducer may update a mutable
+    accumulator in place without changing snapshots already emitted.
+
+    :param reducer: A function that takes (accumulator, item) and returns a new accumulator.
+    :param initial: A function returning the initial accumulator, called on every run.
+    :param emit_every: Emit a snapshot every this many items.
+    :param interval: Emit a snapshot at most every this many seconds.
+    :return: A transformation function to apply to an AsyncIterable.
+    """
+    if emit_every is not None and emit_every <= 0:
+        raise ValueError("emit_every must be >= 1")
+    if interval is not None and interval <= 0:
+        raise ValueError("interval must be positive.")
+    every = emit_every if emit_every is not None or interval is not None else 1
+
+    async def _inner(source: AsyncIterable[T]) -> AsyncIterator[U]:
+        acc = initial()
+        pending = 0
+        last_emit = time.monotonic()
+        async with aclosing(source) as items:
+            async for item in items:
+                acc = reducer(acc, item)
+                pending += 1
+                if (every is not None and pending >= every) or (
+                    interval is not None and time.monotonic() - last_emit >= interval
+                ):
+                    pending = 0
+                    last_emit = time.monotonic()
+                    yield copy.copy(acc)
+        if pending:
+            yield acc
+
+    return describe(_inner, "scan")
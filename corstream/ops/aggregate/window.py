@@ -0,0 +1,319 @@
+# corstream/ops/aggregate/window.py
+
+from collections import OrderedDict
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+import asyncio
+import heapq
+import itertools
+import math
+import operator
+
+from corstream.ops.aggregate.reducer import Reducer
+from corstream.ops.closing import aclosing
+from corstream.ops.stage import describe
+
+WINDOW_KINDS = ("tumbling", "sliding", "session")
+
+
+class WindowResult(NamedTuple):
+    """
+    The aggregate of one key over one closed window `[start, end)`.
+    """
+
+    key: Any
+    start: float
+    end: float
+    value: Any
+    items: int
+
+
+class _Window:
+    __slots__ = ("key", "start", "end", "acc", "count", "closed")
+
+    def __init__(self, key: Any, start: float, end: float, acc: Any):
+        self.key = key
+        self.start = start
+        self.end = end
+        self.acc = acc
+        self.count = 0
+        self.closed = False
+
+
+def window_op(
+    key: Callable[[Any], Hashable],
+    kind: str,
+    size: Optional[float] = None,
+    slide: Optional[float] = None,
+    gap: Optional[float] = None,
+    reducer: Optional[Union[Callable[[Any, Any], Any], Reducer[Any, Any]]] = None,
+    initial: Any = None,
+    timestamp: Optional[Callable[[Any], float]] = None,
+    allowed_lateness: float = 0.0,
+    on_late: Optional[Callable[[Any], Union[None, Awaitable[None]]]] = None,
+    max_keys: Optional[int] = 100_000,
+    combine: Optional[Callable[[Any, Any], Any]] = None,
+) -> Callable[[AsyncIterable[Any]], AsyncIterable[WindowResult]]:
+    """
+    Creates a keyed windowed aggregation operator.
+
+    Items are grouped by `key(item)` and assigned to windows by timestamp:
+    "tumbling" windows of `size` seconds, "sliding" windows of `size` seconds
+    starting every `slide` seconds, or "session" windows that close after
+    `gap` seconds without items for that key. Each window folds its items
+    incrementally with `reducer` from `initial` (use an immutable initial
+    value), and a WindowResult is emitted once the watermark (the highest
+    timestamp seen minus `allowed_lateness`) passes the window's end. In
+    processing time (without `timestamp`), the watermark follows the clock,
+    so windows are emitted when due even if no further items arrive.
+    Remaining windows are emitted when the source ends.
+
+    Items arriving for windows that are already closed are late: they are
+    passed to `on_late` (a side output) or dropped. To bound the state, the
+    windows of the least recently updated key are flushed early once more
+    than `max_keys` keys are open.
+
+    A late item can bridge two open sessions of a key; they are then merged
+    into one, their accumulators joined with `combine` (earlier session
+    first). Session windows with `allowed_lateness` therefore need `combine`
+    unless items are counted or `reducer` is a Reducer.
+
+    :param key: Function extracting the grouping key of an item.
+    :param kind: One of "tumbling", "sliding" or "session".
+    :param size: Window length in seconds (tumbling, sliding).
+    :param slide: Interval between window starts in seconds (sliding).
+    :param gap: Inactivity gap that closes a session, in seconds (session).
+    :param reducer: Function of (accumulator, item) -> new accumulator, or a
+        Reducer (providing `initial()` and `combine`). Defaults to counting items.
+    :param initial: Initial accumulator of every window.
+    :param timestamp: Function returning an item's event time in seconds.
+        Defaults to the arrival (processing) time.
+    :param allowed_lateness: How far behind the newest timestamp items may arrive.
+    :param on_late: Optional callback (sync or async) receiving late items.
+    :param max_keys: The maximum number of keys with open windows, or None
+        for no bound. Defaults to 100,000.
+    :param combine: Function merging two accumulators, used to merge sessions.
+    :return: A transformation function emitting WindowResult items.
+    """
+    if kind not in WINDOW_KINDS:
+        raise ValueError(f"kind must be one of {', '.join(WINDOW_KINDS)}")
+    if kind in ("tumbling", "sliding") and (size is None or size <= 0):
+        raise ValueError(f"{kind} windows need a positive size")
+    if kind == "sliding" and (slide is None or slide <= 0):
+        raise ValueError("sliding windows need a positive slide")
+    if kind == "session" and (gap is None or gap <= 0):
+        raise ValueError("session windows need a positive gap")
+    if allowed_lateness < 0:
+        raise ValueError("allowed_lateness must be >= 0")
+    if max_keys is not None and max_keys <= 0:
+        raise ValueError("max_keys must be >= 1")
+
+    fold: Callable[[Any, Any], Any]
+    merge: Optional[Callable[[Any, Any], Any]]
+    new_acc: Callable[[], Any]
+    if isinstance(reducer, Reducer):
+        fold, merge = reducer.step, combine or reducer.combine
+        new_acc = reducer.initial if initial is None else (lambda: initial)
+    elif reducer is not None:
+        fold, merge = reducer, combine
+        new_acc = lambda: initial  # noqa: E731
+    else:
+        fold, merge = (lambda acc, _: acc + 1), combine or operator.add
+        new_acc = lambda: 0 if initial is None else initial  # noqa: E731
+    if kind == "session" and allowed_lateness > 0 and merge is None:
+        raise ValueError(
+            "session windows with allowed_lateness need `combine` to merge sessions"
+        )
+
+    async def _inner(source: AsyncIterable[Any]) -> AsyncIterator[WindowResult]:
+        loop = asyncio.get_running_loop()
+        clock = timestamp or (lambda _: loop.time())
+        # Open windows per key, least recently updated key first.
+        keys: "OrderedDict[Any, Dict[Any, _Window]]" = OrderedDict()
+        deadlines: List[Tuple[float, int, _Window]] = []
+        sequence = itertools.count()
+        watermark = -math.inf
+
+        def open_window(
+            k: Any, windows: Dict[Any, _Window], start: float, end: float
+        ) -> _Window:
+            window = _Window(k, start, end, new_acc())
+            windows[id(window) if kind == "session" else start] = window
+            heapq.heappush(deadlines, (end, next(sequence), window))
+            return window
+
+        def assign(k: Any, ts: float) -> List[_Window]:
+            windows = keys.get(k)
+            if windows is None:
+                windows = keys[k] = {}
+            else:
+                keys.move_to_end(k)
+
+            if kind == "session":
+                assert gap is not None
+                touched = sorted(
+                    (w for w in windows.values() if w.start - gap <= ts < w.end),
+                    key=lambda w: w.start,
+                )
+                if not touched:
+                    if ts + gap <= watermark:
+                        return []
+                    return [open_window(k, windows, ts, ts + gap)]
+                window, bridged = touched[0], touched[1:]
+                end = max(ts + gap, *(w.end for w in touched))
+                for other in bridged:
+                    # The item joins sessions that were apart: merge them.
+                    assert merge is not None
+                    window.acc = merge(window.acc, other.acc)
+                    window.count += other.count
+                    other.closed = True
+                    del windows[id(other)]
+                if end > window.end:
+                    window.end = end
+                    heapq.heappush(deadlines, (window.end, next(sequence), window))
+                window.start = min(window.start, ts)
+                return [window]
+
+            assert size is not None
+            step = slide if kind == "sliding" else size
+            assert step is not None
+            first = math.floor((ts - size) / step) + 1
+            last = math.floor(ts / step)
+            assigned = []
+            for n in range(first, last + 1):
+                start = n * step
+                if start + size <= watermark:
+                    continue  # Already closed.
+                existing = windows.get(start)
+                if existing is None:
+                    existing = open_window(k, windows, start, start + size)
+                assigned.append(existing)
+            return assigned
+
+        def close(window: _Window) -> WindowResult:
+            window.closed = True
+            windows = keys.get(window.key)
+            if windows is not None:
+                windows.pop(id(window) if kind == "session" else window.start, None)
+                if not windows:
+                    del keys[window.key]
+            return WindowResult(
+                window.key, window.start, window.end, window.acc, window.count
+            )
+
+        def due(limit: float) -> List[WindowResult]:
+            results = []
+            while deadlines and deadlines[0][0] <= limit:
+                end, _, window = heapq.heappop(deadlines)
+                if not window.closed and window.end == end:
+                    results.append(close(window))
+            return results
+
+        def add(item: Any) -> Tuple[bool, List[WindowResult]]:
+            # Folds an item into its windows. Returns whether it was late and
+            # the windows of keys evicted beyond `max_keys`.
+            nonlocal watermark
+            ts = clock(item)
+            k = key(item)
+            watermark = max(watermark, ts - allowed_lateness)
+            windows = assign(k, ts)
+            if not windows and not keys[k]:
+                del keys[k]
+            for window in windows:
+                window.acc = fold(window.acc, item)
+                window.count += 1
+
+            evicted: List[WindowResult] = []
+            while max_keys is not None and len(keys) > max_keys:
+                _, flushed = keys.popitem(last=False)
+                for window in sorted(flushed.values(), key=lambda w: w.end):
+                    window.closed = True
+                    evicted.append(
+                        WindowResult(
+                            window.key,
+                            window.start,
+                            window.end,
+                            window.acc,
+                            window.count,
+                        )
+                    )
+            return not windows, evicted
+
+        async def late(item: Any) -> None:
+            if on_late is not None:
+                handled = on_late(item)
+                if asyncio.iscoroutine(handled):
+                    await handled
+
+        if timestamp is not None:
+            async with aclosing(source) as items:
+                async for item in items:
+                    is_late, evicted = add(item)
+                    if is_late:
+                        await late(item)
+                    for result in evicted:
+                        yield result
+                    for result in due(watermark):
+                        yield result
+            for result in due(math.inf):
+                yield result
+            return
+
+        # Processing time passes without items arriving: the upstream runs in
+        # its own task so that windows close on the clock, as they are due.
+        queue: "asyncio.Queue[Tuple[bool, Any]]" = asyncio.Queue(maxsize=1)
+
+        async def pump() -> None:
+            try:
+                async with aclosing(source) as items:
+                    async for item in items:
+                        await queue.put((True, item))
+            except Exception as e:
+                await queue.put((False, e))
+            else:
+                await queue.put((False, None))
+
+        task = asyncio.ensure_future(pump())
+        try:
+            while True:
+                try:
+                    if not deadlines:
+                        ok, value = await queue.get()
+                    else:
+                        wait = deadlines[0][0] + allowed_lateness - loop.time()
+                        if wait <= 0:
+                            raise asyncio.TimeoutError
+                        ok, value = await asyncio.wait_for(queue.get(), wait)
+                except asyncio.TimeoutError:
+                    watermark = max(watermark, loop.time() - allowed_lateness)
+                else:
+                    if not ok:
+                        if value is not None:
+                            raise value
+                        break
+                    is_late, evicted = add(value)
+                    if is_late:
+                        await late(value)
+                    for result in evicted:
+                        yield result
+                for result in due(watermark):
+                    yield result
+            for result in due(math.inf):
+                yield result
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    return describe(_inner, "window")
@@ -0,0 +1,111 @@
+# corstream/ops/asyncflow/adaptive.py
+
+from typing import Optional
+
+
+class AdaptiveConcurrency:
+    """
+    An AIMD (additive-increase, multiplicative-decrease) concurrency limit
+    for `map_async`.
+
+    Every healthy call raises the limit by `increase / limit`, so the limit
+    grows by about `increase` per window of calls. A failed call, or one
+    slower than `target_latency`, multiplies the limit by `backoff`. Without a
+    `target_latency`, a call counts as a latency spike when it is `tolerance`
+    times slower than the smoothed latency seen so far. The limit is backed
+    off at most once per window of calls: calls that were already in flight
+    when it dropped cannot trigger another decrease.
+
+    :param min_limit: The lowest allowed concurrency.
+    :param max_limit: The highest allowed concurrency.
+    :param initial: The starting concurrency. Defaults to `min_limit`.
+    :param target_latency: Optional latency, in seconds, above which calls count as spikes.
+    :param increase: Additive increase per window of healthy calls.
+    :param backoff: Multiplicative decrease factor, in (0, 1).
+    :param tolerance: Spike threshold relative to the smoothed latency.
+    """
+
+    def __init__(
+        self,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        initial: Optional[int] = None,
+        target_latency: Optional[float] = None,
+        increase: float = 1.0,
+        backoff: float = 0.5,
+        tolerance: float = 2.0,
+    ):
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= max_limit.")
+        if initial is not None and not min_limit <= initial <= max_limit:
+            raise ValueError("initial must be within [min_limit, max_limit].")
+        if target_latency is not None and target_latency <= 0:
+            raise ValueError("target_latency must be positive.")
+        if increase <= 0:
+            raise ValueError("increase must be positive.")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1.")
+        if tolerance <= 1:
+            raise ValueError("tolerance must be greater than 1.")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.target_latency = target_latency
+        self.increase = increase
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self._limit = float(initial if initial is not None else min_limit)
+        self._smoothed: Optional[float] = None
+        self._started = 0  # Sequence number of the next call.
+        self._decreased_at = 0  # Calls started before this saw the old limit.
+        self.decreases = 0
+
+    @property
+    def limit(self) -> int:
+        """
+        The current number of calls allowed in flight.
+        """
+        return int(self._limit)
+
+    def start(self) -> int:
+        """
+        Registers the start of a call.
+
+        :return: A token to pass to `on_success` or `on_error`.
+        """
+        self._started += 1
+        return self._started
+
+    def on_success(self, token: int, latency: float) -> None:
+        """
+        Records a completed call and its latency.
+
+        :param token: The token returned by `start`.
+        :param latency: How long the call took, in seconds.
+        """
+        if self._is_spike(latency):
+            self._decrease(token)
+            return
+        self._smoothed = (
+            latency if self._smoothed is None else 0.9 * self._smoothed + 0.1 * latency
+        )
+        self._limit = min(self.max_limit, self._limit + self.increase / self._limit)
+
+    def on_error(self, token: int) -> None:
+        """
+        Records a failed call.
+
+        :param token: The token returned by `start`.
+        """
+        self._decrease(token)
+
+    def _is_spike(self, latency: float) -> bool:
+        if self.target_latency is not None:
+            return latency > self.target_latency
+        return self._smoothed is not None and latency > self.tolerance * self._smoothed
+
+    def _decrease(self, token: int) -> None:
+        if token <= self._decreased_at:
+            return
+        self._decreased_at = self._started
+        self._limit = max(self.min_limit, self._limit * self.backoff)
+        self.decreases += 1
@@ -0,0 +1,143 @@
+# corstream/ops/asyncflow/cache.py
+
+from collections import OrderedDict
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+import asyncio
+import time
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+
+class Cache(Generic[T, U]):
+    """
+    A bounded LRU/TTL memo for async calls, with single-flight coalescing:
+    while a key is being computed, other callers for the same key await that
+    computation instead of starting their own.
+
+    Failures are never cached; callers coalesced onto a failed computation
+    receive its exception. Like RateLimiter, a Cache holds no event-loop
+    state until used, so one instance can be shared by several stages.
+
+    :param maxsize: The maximum number of stored results.
+    :param ttl: Optional number of seconds a result stays valid.
+    :param key: Optional function mapping an item to its cache key.
+        Defaults to the item itself, which must then be hashable.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        key: Optional[Callable[[T], Hashable]] = None,
+    ):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be >= 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._key = key
+        # key -> (value, expiry), least recently used first.
+        self._store: "OrderedDict[Hashable, Tuple[U, Optional[float]]]" = OrderedDict()
+        self._inflight: Dict[Hashable, "asyncio.Future[U]"] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def clear(self) -> None:
+        """
+        Drops every stored result. Computations in flight are not affected.
+        """
+        self._store.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the hit/miss counters and the current size.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "size": len(self._store),
+        }
+
+    def _lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        entry = self._store.get(key)
+        if entry is None:
+            return False, None
+        value, expires = entry
+        if expires is not None and expires <= time.monotonic():
+            del self._store[key]
+            return False, None
+        self._store.move_to_end(key)
+        return True, value
+
+    def _store_result(self, key: Hashable, value: U) -> None:
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._store[key] = (value, expires)
+        self._store.move_to_end(key)
+        while len(self._store) > self.maxsize:
+            self._store.popitem(last=False)
+            self.evictions += 1
+
+    async def call(self, fn: Callable[[T], Awaitable[U]], item: T) -> U:
+        """
+        Returns the cached result for `item`, awaits the computation already
+        in flight for its key, or computes it with `fn` and stores it.
+
+        :param fn: The async function computing a result.
+        :param item: The item to compute the result for.
+        :return: The (possibly cached) result.
+        """
+        key = self._key(item) if self._key is not None else item
+        while True:
+            found, value = self._lookup(key)
+            if found:
+                self.hits += 1
+                return value
+
+            flight = self._inflight.get(key)
+            if flight is None:
+                break
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                if not flight.cancelled():
+                    raise
+                # The computing caller was cancelled; take over the key.
+
+        self.misses += 1
+        flight = asyncio.get_running_loop().create_future()
+        self._inflight[key] = flight
+        try:
+            result = await fn(item)
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except Exception as e:
+            flight.set_exception(e)
+            flight.exception()  # Mark retrieved when nobody is coalesced onto it.
+            raise
+        else:
+            self._store_result(key, result)
+            flight.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
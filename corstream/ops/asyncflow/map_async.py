@@ -1,7 +1,28 @@
 # corstream/ops/asyncflow/map_async.py
 
-from typing import AsyncIterable, AsyncIterator, Callable, TypeVar, Awaitable, Tuple
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Optional,
+    Set,
+    TypeVar,
+)
 import asyncio
+import time
+from collections import deque
+
+from corstream.ops.asyncflow.adaptive import AdaptiveConcurrency
+from corstream.ops.asyncflow.cache import Cache
+from corstream.ops.control.limiter import RateLimiter
+from corstream.ops.control.retry import RetryPolicy
+from corstream.ops.control.timeout import timeout_call
+from corstream.ops.closing import aclose, aclosing
+from corstream.ops.stage import describe
 
 T = TypeVar("T")
 U = TypeVar("U")
@@ -10,57 +31,161 @@ AsyncMapFunc = Callable[[T], Awaitable[U]]
 
 
 def map_async_op(
-    fn: AsyncMapFunc[T, U], max_concurrent: int = 5
+    fn: AsyncMapFunc[T, U],
+    max_concurrent: int = 5,
+    ordered: bool = False,
+    limiter: Optional[RateLimiter] = None,
+    retry: Optional[RetryPolicy] = None,
+    cache: Optional[Cache[T, U]] = None,
+    adaptive: Optional[AdaptiveConcurrency] = None,
+    timeout: Optional[float] = None,
 ) -> Callable[[AsyncIterable[T]], AsyncIterable[U]]:
     """
     Applies an async function to items in the stream concurrently,
     with a bounded number of tasks in flight.
 
+    Items are pulled from the source only when a slot in the window frees up,
+    and each result is yielded as soon as it is available.
+
     :param fn: An async function to apply to each item.
     :param max_concurrent: The maximum number of concurrent tasks.
+    :param ordered: If True, results are yielded in input order; otherwise
+        they are yielded in completion order.
+    :param limiter: Optional shared RateLimiter; every call to `fn` takes one
+        unit from it first.
+    :param retry: Optional RetryPolicy used to re-invoke `fn` for an item that
+        failed. Backoff only delays that item; other tasks keep running.
+    :param cache: Optional Cache consulted before calling `fn`. Hits skip the
+        limiter and retries, and concurrent calls for one key are coalesced.
+    :param adaptive: Optional AdaptiveConcurrency controller. If given, it sets
+        the window size from the latency and errors of every call to `fn`,
+        and `max_concurrent` is ignored.
+    :param timeout: Optional maximum number of seconds per call to `fn`. A call
+        that takes longer is cancelled and raises StageTimeoutError, which
+        counts as a failure for `retry` and `adaptive`.
     :return: An operator that transforms the async iterable.
     """
     if max_concurrent <= 0:
         raise ValueError("max_concurrent must be >= 1")
 
+    timed = fn
+    if timeout is not None:
+        timed = timeout_call(fn, timeout, "map_async")
+
+    measured = timed
+    if adaptive is not None:
+
+        async def measured(item: T) -> U:
+            token = adaptive.start()
+            started = time.perf_counter()
+            try:
+                result = await timed(item)
+            except Exception:
+                adaptive.on_error(token)
+                raise
+            adaptive.on_success(token, time.perf_counter() - started)
+            return result
+
+    attempt = measured
+    if limiter is not None:
+
+        async def attempt(item: T) -> U:
+            await limiter.acquire()
+            return await measured(item)
+
+    call = attempt
+    if retry is not None:
+
+        async def call(item: T) -> U:
+            return await retry.call(attempt, item)
+
+    if cache is not None:
+        uncached = call
+
+        async def call(item: T) -> U:
+            return await cache.call(uncached, item)
+
     async def _inner(source: AsyncIterable[T]) -> AsyncIterator[U]:
-        async for result in _run_map_async(source, fn, max_concurrent):
-            yield result
+        async with aclosing(
+            _run_map_async(source, call, max_concurrent, ordered, adaptive)
+        ) as results:
+            async for result in results:
+                yield result
+
+    def gauges() -> Dict[str, Any]:
+        values: Dict[str, Any] = {}
+        if adaptive is not None:
+            values["concurrency_limit"] = adaptive.limit
+        if cache is not None:
+            values["cache"] = cache.stats()
+        return values
 
-    return _inner
+    if adaptive is None and cache is None:
+        return describe(_inner, "map_async", fn)
+    return describe(_inner, "map_async", fn, gauges)
 
 
 async def _run_map_async(
     source: AsyncIterable[T],
     fn: AsyncMapFunc[T, U],
     max_concurrent: int = 5,
+    ordered: bool = False,
+    adaptive: Optional[AdaptiveConcurrency] = None,
 ) -> AsyncIterator[U]:
-    semaphore = asyncio.Semaphore(max_concurrent)
-    queue: asyncio.Queue[Tuple[bool, U | Exception]] = asyncio.Queue()
-    tasks = []
+    iterator = source.__aiter__()
+    exhausted = False
+    pending: Set["asyncio.Future[U]"] = set()
+    # Reorder buffer: completed tasks waiting for their turn (ordered mode only).
+    indices: Dict["asyncio.Future[U]", int] = {}
+    ready: Dict[int, "asyncio.Future[U]"] = {}
+    finished: Deque["asyncio.Future[U]"] = deque()
+    next_index = 0
+    emit_index = 0
 
-    async def worker(item: T) -> None:
-        async with semaphore:
-            try:
-                result = await fn(item)
-                await queue.put((True, result))
-            except Exception as e:
-                await queue.put((False, e))
-
-    async for item in source:
-        task = asyncio.create_task(worker(item))
-        tasks.append(task)
-
-    # Wait for all tasks to complete
-    await asyncio.gather(*tasks)
-
-    # Drain the queue
-    while not queue.empty():
-        ok, value = await queue.get()
-        if ok:
-            assert not isinstance(value, Exception)
-            yield value
-        else:
-            raise (
-                value if isinstance(value, Exception) else Exception("Unknown error")
+    try:
+        while True:
+            # Fill the window. Completed-but-unemitted results count against it
+            # so the reorder buffer stays bounded as well.
+            window = adaptive.limit if adaptive is not None else max_concurrent
+            while not exhausted and len(pending) + len(ready) < window:
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                future: "asyncio.Future[U]" = asyncio.ensure_future(fn(item))
+                pending.add(future)
+                if ordered:
+                    indices[future] = next_index
+                    next_index += 1
+
+            if not pending:
+                break
+
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
             )
+
+            if not ordered:
+                finished.extend(done)
+                while finished:
+                    yield finished.popleft().result()
+                continue
+
+            for task in done:
+                ready[indices.pop(task)] = task
+            while emit_index in ready:
+                task = ready.pop(emit_index)
+                emit_index += 1
+                yield task.result()
+    finally:
+        # Stopped early or failed: cancel the work still in flight, then
+        # close the upstream so it stops producing as well.
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        for task in [*ready.values(), *finished]:
+            # Retrieve results so unobserved exceptions are not reported.
+            if not task.cancelled():
+                task.exception()
+        await aclose(iterator)
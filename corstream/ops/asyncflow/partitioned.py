@@ -0,0 +1,188 @@
+# corstream/ops/asyncflow/partitioned.py
+
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+import asyncio
+import time
+
+from corstream.ops.closing import aclosing
+from corstream.ops.control.retry import RetryPolicy
+from corstream.ops.control.timeout import timeout_call
+from corstream.ops.stage import describe
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+# A shard counts as hot once it has received this many times its fair share.
+HOT_SHARD_FACTOR = 2.0
+
+
+class ShardStats:
+    """
+    Per-shard load counters of one run of a partitioned stage.
+    """
+
+    def __init__(self, shards: int, queues: Sequence["asyncio.Queue[Any]"] = ()):
+        self.shards = shards
+        self.queues = list(queues)
+        self.items = [0] * self.shards
+        self.busy_time = [0.0] * self.shards
+
+    def snapshot(self) -> Dict[str, Any]:
+        total = sum(self.items)
+        mean = total / self.shards
+        skew = max(self.items) / mean if mean else 0.0
+        return {
+            "shards": [
+                {
+                    "items": self.items[index],
+                    "queued": self.queues[index].qsize() if self.queues else 0,
+                    "busy_time": self.busy_time[index],
+                }
+                for index in range(self.shards)
+            ],
+            "skew": skew,
+            "hot_shards": [
+                index
+                for index, items in enumerate(self.items)
+                if mean and items > HOT_SHARD_FACTOR * mean
+            ],
+        }
+
+
+def partitioned_map_op(
+    fn: Callable[[T], Awaitable[U]],
+    key: Callable[[T], Hashable],
+    shards: int = 4,
+    queue_size: int = 8,
+    ordered: bool = False,
+    retry: Optional[RetryPolicy] = None,
+    timeout: Optional[float] = None,
+) -> Callable[[AsyncIterable[T]], AsyncIterable[U]]:
+    """
+    Applies an async function with one sequential worker per shard: items are
+    routed by `hash(key(item)) % shards`, so items with the same key are
+    processed strictly one after another and in input order, while different
+    shards run concurrently.
+
+    Each shard has a bounded queue; a full queue holds back the router, and
+    with it the whole upstream. Results for one key are always yielded in
+    input order; `ordered` additionally restores the global input order.
+
+    :param fn: An async function to apply to each item.
+    :param key: Function extracting the partitioning key of an item.
+    :param shards: The number of shards (and concurrent workers).
+    :param queue_size: The maximum number of items waiting per shard.
+    :param ordered: If True, results are yielded in input order; otherwise
+        they are yielded in completion order.
+    :param retry: Optional RetryPolicy used to re-invoke `fn` for an item that failed.
+    :param timeout: Optional maximum number of seconds per call to `fn`.
+    :return: A transformation function to apply to an AsyncIterable.
+    """
+    if shards <= 0:
+        raise ValueError("shards must be >= 1")
+    if queue_size <= 0:
+        raise ValueError("queue_size must be >= 1")
+
+    timed: Callable[[T], Awaitable[U]] = fn
+    if timeout is not None:
+        timed = timeout_call(fn, timeout, "partitioned_map")
+
+    call = timed
+    if retry is not None:
+
+        async def call(item: T) -> U:
+            return await retry.call(timed, item)
+
+    # Counters are created per run, so concurrent runs don't share them; the
+    # gauges report the most recently started run.
+    latest = [ShardStats(shards)]
+    # Routed items not yet yielded; bounds the reorder buffer as well.
+    window = shards * (queue_size + 1)
+
+    async def _inner(source: AsyncIterable[T]) -> AsyncIterator[U]:
+        queues: List["asyncio.Queue[Optional[Tuple[int, T]]]"] = [
+            asyncio.Queue(maxsize=queue_size) for _ in range(shards)
+        ]
+        # (ok, value) entries: a (seq, result) pair, an error, or None when a
+        # worker has finished.
+        output: "asyncio.Queue[Tuple[bool, Any]]" = asyncio.Queue()
+        slots = asyncio.Semaphore(window)
+        stats = latest[0] = ShardStats(shards, queues)
+
+        async def route() -> None:
+            seq = 0
+            try:
+                async with aclosing(source) as items:
+                    async for item in items:
+                        shard = hash(key(item)) % shards
+                        await slots.acquire()
+                        stats.items[shard] += 1
+                        await queues[shard].put((seq, item))
+                        seq += 1
+            except Exception as e:
+                output.put_nowait((False, e))
+                return
+            for queue in queues:
+                await queue.put(None)
+
+        async def work(index: int) -> None:
+            queue = queues[index]
+            while True:
+                entry = await queue.get()
+                if entry is None:
+                    output.put_nowait((False, None))
+                    return
+                seq, item = entry
+                started = time.perf_counter()
+                try:
+                    result = await call(item)
+                except Exception as e:
+                    output.put_nowait((False, e))
+                    return
+                finally:
+                    stats.busy_time[index] += time.perf_counter() - started
+                output.put_nowait((True, (seq, result)))
+
+        tasks = [asyncio.ensure_future(route())]
+        tasks.extend(asyncio.ensure_future(work(index)) for index in range(shards))
+        ready: Dict[int, U] = {}
+        emit_seq = 0
+        running = shards
+        try:
+            while running:
+                ok, value = await output.get()
+                if not ok:
+                    if value is not None:
+                        raise value
+                    running -= 1
+                    continue
+                seq, result = value
+                if not ordered:
+                    slots.release()
+                    yield result
+                    continue
+                ready[seq] = result
+                while emit_seq in ready:
+                    result = ready.pop(emit_seq)
+                    emit_seq += 1
+                    slots.release()
+                    yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    return describe(_inner, "partitioned_map", fn, lambda: latest[0].snapshot())
@@ -0,0 +1,82 @@
+# corstream/ops/binary/delimited.py
+
+from typing import AsyncIterable, AsyncIterator, Callable, Union
+import re
+
+from corstream.ops.closing import aclosing
+from corstream.ops.stage import describe
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def delimited_op(
+    delimiter: bytes, keep_ends: bool = False
+) -> Callable[[AsyncIterable[Buffer]], AsyncIterable[memoryview]]:
+    """
+    Creates an operator that splits a stream of byte chunks into records
+    separated by `delimiter`.
+
+    Records that lie within one chunk are yielded as `memoryview` slices of
+    it, without copying. Only records straddling a chunk boundary are copied
+    into a new buffer. A final record without a trailing delimiter is
+    yielded as well.
+
+    :param delimiter: The non-empty byte string separating records.
+    :param keep_ends: Whether records include their trailing delimiter.
+    :return: A transformation function to apply to an AsyncIterable.
+    """
+    if not delimiter:
+        raise ValueError("delimiter must not be empty.")
+    pattern = re.compile(re.escape(delimiter))
+    width = len(delimiter)
+    tail = width - 1  # Bytes of a delimiter that can hang over a chunk edge.
+
+    async def _inner(source: AsyncIterable[Buffer]) -> AsyncIterator[memoryview]:
+        carry = bytearray()
+        async with aclosing(source) as chunks:
+            async for chunk in chunks:
+                view = memoryview(chunk)
+                start = 0
+                if carry and tail:
+                    # The delimiter itself may straddle the boundary.
+                    kept = min(tail, len(carry))
+                    joint = bytes(carry[-kept:]) + bytes(view[:tail])
+                    found = joint.find(delimiter)
+                    if 0 <= found < kept:
+                        start = found + width - kept
+                        end = len(carry) - kept + found
+                        record = carry[:end]
+                        if keep_ends:
+                            record += delimiter
+                        carry = bytearray()
+                        yield memoryview(record)
+                match = pattern.search(view, start)
+                while match is not None:
+                    end = match.end() if keep_ends else match.start()
+                    if carry:
+                        carry += view[start:end]
+                        record, carry = carry, bytearray()
+                        yield memoryview(record)
+                    else:
+                        yield view[start:end]
+                    start = match.end()
+                    match = pattern.search(view, start)
+                if start < len(view):
+                    carry += view[start:]
+        if carry:
+            yield memoryview(carry)
+
+    return describe(_inner, "delimited")
+
+
+def lines_op(
+    keep_ends: bool = False,
+) -> Callable[[AsyncIterable[Buffer]], AsyncIterable[memoryview]]:
+    """
+    Creates an operator that splits a stream of byte chunks into lines
+    (separated by b"\\n"), with the same zero-copy behavior as `delimited_op`.
+
+    :param keep_ends: Whether lines include their trailing newline.
+    :return: A transformation function to apply to an AsyncIterable.
+    """
+    return describe(delimited_op(b"\n", keep_ends), "lines")
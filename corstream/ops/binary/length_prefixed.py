@@ -0,0 +1,64 @@
+# corstream/ops/binary/length_prefixed.py
+
+from typing import AsyncIterable, AsyncIterator, Callable, Literal, Union
+
+from corstream.ops.closing import aclosing
+from corstream.ops.stage import describe
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def length_prefixed_op(
+    prefix_size: int = 4, byteorder: str = "big"
+) -> Callable[[AsyncIterable[Buffer]], AsyncIterable[memoryview]]:
+    """
+    Creates an operator that splits a stream of byte chunks into records,
+    each preceded by its length as an unsigned integer of `prefix_size` bytes.
+
+    Records that lie within one chunk are yielded as `memoryview` slices of
+    it, without copying. Only records straddling a chunk boundary are copied.
+
+    :param prefix_size: The size of the length prefix in bytes (1, 2, 4 or 8).
+    :param byteorder: The byte order of the prefix, "big" or "little".
+    :return: A transformation function to apply to an AsyncIterable.
+    """
+    if prefix_size not in (1, 2, 4, 8):
+        raise ValueError("prefix_size must be 1, 2, 4 or 8.")
+    if byteorder not in ("big", "little"):
+        raise ValueError('byteorder must be "big" or "little".')
+    order: Literal["big", "little"] = "big" if byteorder == "big" else "little"
+
+    async def _inner(source: AsyncIterable[Buffer]) -> AsyncIterator[memoryview]:
+        carry = bytearray()
+        async with aclosing(source) as chunks:
+            async for chunk in chunks:
+                view = memoryview(chunk)
+                size = len(view)
+                pos = 0
+                if carry:
+                    if len(carry) < prefix_size:
+                        pos = min(prefix_size - len(carry), size)
+                        carry += view[:pos]
+                        if len(carry) < prefix_size:
+                            continue
+                    total = prefix_size + int.from_bytes(carry[:prefix_size], order)
+                    taken = min(total - len(carry), size - pos)
+                    carry += view[pos : pos + taken]
+                    pos += taken
+                    if len(carry) < total:
+                        continue
+                    record, carry = carry, bytearray()
+                    yield memoryview(record)[prefix_size:]
+                while pos + prefix_size <= size:
+                    begin = pos + prefix_size
+                    end = begin + int.from_bytes(view[pos:begin], order)
+                    if end > size:
+                        break
+                    yield view[begin:end]
+                    pos = end
+                if pos < size:
+                    carry = bytearray(view[pos:])
+        if carry:
+            raise ValueError("Stream ended in the middle of a length-prefixed record.")
+
+    return describe(_inner, "length_prefixed")
@@ -0,0 +1,39 @@
+# corstream/ops/chunked/batch.py
+
+from typing import AsyncIterable, AsyncIterator, Callable, List, Sequence, TypeVar
+
+from corstream.ops.closing import aclosing
+from corstream.ops.stage import describe
+
+T = TypeVar("T")
+
+
+def chunked_batch_op(
+    size: int = 1,
+) -> Callable[[AsyncIterable[Sequence[T]]], AsyncIterable[List[List[T]]]]:
+    """
+    Creates a batching operator for chunked streams. Each incoming chunk is
+    sliced into fixed-size batches; items left over are carried into the next
+    chunk. The final batch may contain fewer than `size` items.
+
+    :param size: The number of items per batch. Defaults to 1.
+    :return: A transformation function to apply to an AsyncIterable of chunks.
+    """
+    if size <= 0:
+        raise ValueError("Batch size must be a positive integer.")
+
+    async def _inner(
+        source: AsyncIterable[Sequence[T]],
+    ) -> AsyncIterator[List[List[T]]]:
+        carry: List[T] = []
+        async with aclosing(source) as chunks:
+            async for chunk in chunks:
+                carry.extend(chunk)
+                full = len(carry) - len(carry) % size
+                if full:
+                    yield [carry[i : i + size] for i in range(0, full, size)]
+                    carry = carry[full:]
+        if carry:
+            yield [carry]
+
+    return describe(_inner, "chunked_batch")
@@ -0,0 +1,71 @@
+# corstream/ops/chunked/chunk.py
+
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    TypeVar,
+)
+import itertools
+
+from corstream.ops.closing import aclosing
+from corstream.ops.stage import describe
+
+T = TypeVar("T")
+
+
+def chunk_op(size: int) -> Callable[[AsyncIterable[T]], AsyncIterable[List[T]]]:
+    """
+    Creates an operator that switches a stream into chunked mode by grouping
+    items into lists of up to `size` items.
+
+    :param size: The maximum number of items per chunk.
+    :return: A transformation function to apply to an AsyncIterable.
+    """
+    if size <= 0:
+        raise ValueError("Chunk size must be a positive integer.")
+
+    async def _inner(source: AsyncIterable[T]) -> AsyncIterator[List[T]]:
+        chunk: List[T] = []
+        append = chunk.append
+        async with aclosing(source) as items:
+            async for item in items:
+                append(item)
+                if len(chunk) == size:
+                    yield chunk
+                    chunk = []
+                    append = chunk.append
+        if chunk:
+            yield chunk
+
+    def _chunks(iterable: Iterable[T]) -> Iterator[List[T]]:
+        # Used by the pipeline in place of `_inner` on a synchronous source,
+        # which is then awaited once per chunk instead of once per item.
+        iterator = iter(iterable)
+        chunk = list(itertools.islice(iterator, size))
+        while chunk:
+            yield chunk
+            chunk = list(itertools.islice(iterator, size))
+
+    return describe(_inner, "chunk", fn=_chunks)
+
+
+def unchunk_op() -> Callable[[AsyncIterable[Sequence[T]]], AsyncIterable[T]]:
+    """
+    Creates an operator that leaves chunked mode by yielding the items
+    of each chunk one by one.
+
+    :return: A transformation function to apply to an AsyncIterable.
+    """
+
+    async def _inner(source: AsyncIterable[Sequence[T]]) -> AsyncIterator[T]:
+        async with aclosing(source) as chunks:
+            async for chunk in chunks:
+                for item in chunk:
+                    yield item
+
+    return describe(_inner, "unchunk")
@@ -0,0 +1,44 @@
+# corstream/ops/chunked/filter.py
+
+from itertools import compress
+from typing import Any, AsyncIterable, AsyncIterator, Callable, List, Sequence, TypeVar
+import asyncio
+
+from corstream.ops.closing import aclosing
+from corstream.ops.stage import describe
+
+T = TypeVar("T")
+
+
+def chunked_filter_op(
+    predicate: Callable[..., Any], vectorized: bool = False
+) -> Callable[[AsyncIterable[Sequence[T]]], AsyncIterable[List[T]]]:
+    """
+    Creates a filter operator for chunked streams. Empty chunks are dropped.
+
+    By default `predicate` is called on every item of a chunk. With
+    `vectorized=True`, it receives the whole chunk and must return a
+    sequence of booleans (a mask) of the same length.
+
+    :param predicate: A per-item predicate, or a batch-aware mask function if vectorized.
+    :param vectorized: Whether `predicate` operates on whole chunks.
+    :return: A transformation function to apply to an AsyncIterable of chunks.
+    """
+
+    async def _inner(source: AsyncIterable[Sequence[T]]) -> AsyncIterator[List[T]]:
+        async with aclosing(source) as chunks:
+            async for chunk in chunks:
+                if vectorized:
+                    mask = predicate(chunk)
+                    if asyncio.iscoroutine(mask):
+                        mask = await mask
+                    kept = list(compress(chunk, mask))
+                else:
+                    flags = [predicate(item) for item in chunk]
+                    if flags and asyncio.iscoroutine(flags[0]):
+                        flags = [await flag for flag in flags]
+                    kept = list(compress(chunk, flags))
+                if kept:
+                    yield kept
+
+    return describe(_inner, "chunked_filter", predicate)
@@ -0,0 +1,43 @@
+# corstream/ops/chunked/map.py
+
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Sequence, TypeVar
+import asyncio
+
+from corstream.ops.closing import aclosing
+from corstream.ops.stage import describe
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+
+def chunked_map_op(
+    fn: Callable[..., Any], vectorized: bool = False
+) -> Callable[[AsyncIterable[Sequence[T]]], AsyncIterable[Sequence[U]]]:
+    """
+    Creates a mapping operator for chunked streams.
+
+    By default `fn` is applied to every item of a chunk with a list
+    comprehension. With `vectorized=True`, `fn` receives the whole chunk and
+    must return a sequence of results (e.g. a NumPy ufunc on an array).
+
+    :param fn: A per-item function, or a batch-aware function if vectorized.
+    :param vectorized: Whether `fn` operates on whole chunks.
+    :return: A transformation function to apply to an AsyncIterable of chunks.
+    """
+
+    async def _inner(source: AsyncIterable[Sequence[T]]) -> AsyncIterator[Any]:
+        async with aclosing(source) as chunks:
+            async for chunk in chunks:
+                if vectorized:
+                    result = fn(chunk)
+                    if asyncio.iscoroutine(result):
+                        result = await result
+                    yield result
+                    continue
+
+                results = [fn(item) for item in chunk]
+                if results and asyncio.iscoroutine(results[0]):
+                    results = [await r for r in results]
+                yield results
+
+    return describe(_inner, "chunked_map", fn)
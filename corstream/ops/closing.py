@@ -0,0 +1,32 @@
+# corstream/ops/closing.py
+
+from typing import Any, AsyncIterable, AsyncIterator, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+async def aclose(iterator: Any) -> None:
+    """
+    Closes an async iterator if it supports it (async generators do).
+    """
+    close = getattr(iterator, "aclose", None)
+    if close is not None:
+        await close()
+
+
+class aclosing(Generic[T]):
+    """
+    Async context manager that iterates `source` and closes the iterator on
+    exit. Operators wrap their upstream in it so that stopping early (or
+    failing) closes the whole chain right away, instead of whenever the
+    abandoned generators happen to be garbage collected.
+    """
+
+    def __init__(self, source: AsyncIterable[T]):
+        self._iterator = source.__aiter__()
+
+    async def __aenter__(self) -> AsyncIterator[T]:
+        return self._iterator
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await aclose(self._iterator)
@@ -0,0 +1,82 @@
+# corstream/ops/control/buffer.py
+
+from collections import deque
+from typing import AsyncIterable, AsyncIterator, Callable, Deque, Optional, TypeVar
+import asyncio
+
+from corstream.ops.closing import aclosing
+from corstream.ops.stage import describe
+
+T = TypeVar("T")
+
+BUFFER_POLICIES = ("block", "drop_oldest", "drop_newest")
+
+
+def buffer_op(
+    size: int, policy: str = "block"
+) -> Callable[[AsyncIterable[T]], AsyncIterable[T]]:
+    """
+    Decouples the upstream from the downstream with a bounded buffer.
+
+    The upstream is consumed by its own task, so it keeps producing while the
+    downstream is busy. When the buffer is full, `policy` decides what happens:
+    "block" pauses the upstream (backpressure), "drop_oldest" evicts the oldest
+    buffered item, and "drop_newest" discards the incoming item.
+
+    :param size: The maximum number of buffered items.
+    :param policy: One of "block", "drop_oldest" or "drop_newest".
+    :return: A buffered async iterable.
+    """
+    if size <= 0:
+        raise ValueError("Buffer size must be a positive integer.")
+    if policy not in BUFFER_POLICIES:
+        raise ValueError(f"policy must be one of {', '.join(BUFFER_POLICIES)}")
+
+    async def _inner(source: AsyncIterable[T]) -> AsyncIterator[T]:
+        buffer: Deque[T] = deque()
+        readable = asyncio.Event()
+        writable = asyncio.Event()
+        finished = False
+        error: Optional[BaseException] = None
+
+        async def pump() -> None:
+            nonlocal finished, error
+            try:
+                async with aclosing(source) as items:
+                    async for item in items:
+                        if len(buffer) >= size:
+                            if policy == "drop_newest":
+                                continue
+                            if policy == "drop_oldest":
+                                buffer.popleft()
+                            else:
+                                while len(buffer) >= size:
+                                    writable.clear()
+                                    await writable.wait()
+                        buffer.append(item)
+                        readable.set()
+            except Exception as e:
+                error = e
+            finally:
+                finished = True
+                readable.set()
+
+        task = asyncio.ensure_future(pump())
+        try:
+            while True:
+                if buffer:
+                    item = buffer.popleft()
+                    writable.set()
+                    yield item
+                    continue
+                if finished:
+                    if error is not None:
+                        raise error
+                    return
+                readable.clear()
+                await readable.wait()
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    return describe(_inner, "buffer")
@@ -2,6 +2,9 @@
 
 from typing import AsyncIterable, AsyncIterator, Callable, TypeVar, Optional
 
+from corstream.ops.closing import aclosing
+from corstream.ops.stage import describe
+
 T = TypeVar("T")
 
 
@@ -17,13 +20,14 @@ def catch_op(
     """
 
     async def _inner(source: AsyncIterable[T]) -> AsyncIterator[T]:
-        async for item in source:
-            try:
-                yield item
-            except Exception as e:
-                fallback = handler(e)
-                if fallback is not None:
-                    yield fallback
-                # else: item is skipped silently
-
-    return _inner
+        async with aclosing(source) as items:
+            async for item in items:
+                try:
+                    yield item
+                except Exception as e:
+                    fallback = handler(e)
+                    if fallback is not None:
+                        yield fallback
+                    # else: item is skipped silently
+
+    return describe(_inner, "catch", handler)
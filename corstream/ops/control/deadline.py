@@ -0,0 +1,72 @@
+# corstream/ops/control/deadline.py
+
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Optional, TypeVar
+import asyncio
+
+from corstream.errors import DeadlineExceededError
+from corstream.ops.closing import aclosing
+
+R = TypeVar("R")
+
+
+class StageTracker:
+    """
+    Records which stage of a pipeline run was stuck when it was cancelled.
+    """
+
+    def __init__(self) -> None:
+        self.stuck: Optional[str] = None
+
+    def trace(self, source: AsyncIterable[Any], stage: str) -> AsyncIterator[Any]:
+        """
+        Passes `source` through, noting `stage` if cancellation reaches the
+        pipeline while waiting on it. Cancellation unwinds from the innermost
+        await outwards, so the first stage to see it is the stuck one.
+
+        :param source: The output of the stage.
+        :param stage: The label reported for the stage.
+        """
+
+        async def _inner() -> AsyncIterator[Any]:
+            async with aclosing(source) as items:
+                try:
+                    async for item in items:
+                        yield item
+                except asyncio.CancelledError:
+                    if self.stuck is None:
+                        self.stuck = stage
+                    raise
+
+        return _inner()
+
+
+async def run_with_deadline(
+    work: Awaitable[R], deadline: float, tracker: Optional[StageTracker] = None
+) -> R:
+    """
+    Runs a terminal operation, cancelling it if it has not finished within
+    `deadline` seconds. Cancellation unwinds the sink, which closes every
+    generator of the pipeline and cancels outstanding tasks.
+
+    :param work: The terminal operation to run.
+    :param deadline: The maximum number of seconds.
+    :param tracker: The tracker of the pipeline, used to report the stuck stage.
+    :return: The result of `work`.
+    """
+    task = asyncio.ensure_future(work)
+    try:
+        done, _ = await asyncio.wait({task}, timeout=deadline)
+    except BaseException:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        raise
+    if not done:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        if task.cancelled():
+            stage = None
+            if tracker is not None:
+                # No stage saw the cancellation: the sink itself was busy.
+                stage = tracker.stuck if tracker.stuck is not None else "sink"
+            raise DeadlineExceededError(deadline, stage)
+    return task.result()
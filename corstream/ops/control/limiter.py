@@ -0,0 +1,90 @@
+# corstream/ops/control/limiter.py
+
+import asyncio
+import time
+
+# Below this many seconds, sleeping is finished by yielding to the event loop
+# instead of trusting the loop's (millisecond-granular) timer.
+_SPIN_THRESHOLD = 0.002
+
+
+class RateLimiter:
+    """
+    A token-bucket rate limiter implemented with the Generic Cell Rate
+    Algorithm (GCRA).
+
+    Allows `rate` units of cost per `per_seconds` on average, with up to
+    `burst` units admitted back-to-back when the limiter has been idle.
+    The limiter holds no event-loop state, so one instance can be shared by
+    several streams, `throttle` stages and `map_async` workers that draw
+    from the same quota.
+    """
+
+    def __init__(self, rate: float, per_seconds: float = 1.0, burst: float = 1):
+        if rate <= 0 or per_seconds <= 0:
+            raise ValueError("Rate and per_seconds must be positive values.")
+        if burst < 1:
+            raise ValueError("burst must be >= 1")
+        self.rate = rate
+        self.per_seconds = per_seconds
+        self.burst = burst
+        self._interval = per_seconds / rate
+        self._tolerance = burst * self._interval
+        self._tat = 0.0  # Theoretical arrival time of the next request.
+
+    def _reserve(self, cost: float, now: float) -> float:
+        tat = max(self._tat, now)
+        self._tat = tat + cost * self._interval
+        return self._tat - self._tolerance
+
+    def try_acquire(self, cost: float = 1) -> bool:
+        """
+        Takes `cost` units if they are available right now, without waiting.
+
+        :param cost: The weight of the request.
+        :return: True if the request was admitted.
+        """
+        now = time.monotonic()
+        tat = max(self._tat, now)
+        if tat + cost * self._interval - self._tolerance > now:
+            return False
+        self._tat = tat + cost * self._interval
+        return True
+
+    async def acquire(self, cost: float = 1) -> None:
+        """
+        Waits until `cost` units are available and takes them. Requests are
+        admitted in the order they call `acquire`; a request cancelled while
+        waiting gives its units back.
+
+        :param cost: The weight of the request. Requests costing more than
+            `burst` wait for the excess even on an idle limiter.
+        """
+        if cost < 0:
+            raise ValueError("cost must be >= 0")
+        deadline = self._reserve(cost, time.monotonic())
+        try:
+            await sleep_until(deadline)
+        except asyncio.CancelledError:
+            # Never admitted: hand the units back. Waiters booked after this
+            # one keep their deadlines, which only makes them conservative.
+            self._tat -= cost * self._interval
+            raise
+
+
+async def sleep_until(deadline: float) -> None:
+    """
+    Sleeps until `time.monotonic()` reaches `deadline` without oversleeping:
+    the loop timer is used for the bulk of the wait and the last couple of
+    milliseconds are spent yielding to other tasks.
+
+    :param deadline: The target time, on the `time.monotonic()` clock.
+    """
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        if remaining > _SPIN_THRESHOLD:
+            await asyncio.sleep(remaining - _SPIN_THRESHOLD)
+        else:
+            await asyncio.sleep(0)
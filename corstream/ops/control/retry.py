@@ -1,9 +1,131 @@
 # corstream/ops/control/retry.py
 
-from typing import AsyncIterable, AsyncIterator, Callable, TypeVar
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 import asyncio
+import random
+
+from corstream.errors import RetryDeadlineError
+from corstream.ops.closing import aclosing
+from corstream.ops.stage import describe
 
 T = TypeVar("T")
+U = TypeVar("U")
+
+RetryFilter = Union[
+    Type[BaseException],
+    Tuple[Type[BaseException], ...],
+    Callable[[BaseException], bool],
+]
+
+
+class RetryPolicy:
+    """
+    Describes how a stage re-invokes its function for an item that failed.
+
+    Delays grow exponentially from `base_delay` by `multiplier` up to
+    `max_delay`. With `jitter` in [0, 1], each delay is drawn uniformly from
+    [delay * (1 - jitter), delay], so concurrent retries don't synchronize.
+
+    :param attempts: Total number of attempts per item, including the first.
+    :param base_delay: Delay in seconds before the first retry.
+    :param max_delay: Upper bound for any single delay.
+    :param multiplier: Growth factor applied to the delay after every retry.
+    :param jitter: Fraction of each delay that is randomized.
+    :param retry_on: Exception type(s), or a predicate, selecting retryable errors.
+    :param deadline: Optional time budget in seconds for all attempts of one item;
+        exceeding it raises RetryDeadlineError.
+    """
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        base_delay: float = 0.1,
+        max_delay: float = 10.0,
+        multiplier: float = 2.0,
+        jitter: float = 1.0,
+        retry_on: RetryFilter = Exception,
+        deadline: Optional[float] = None,
+    ):
+        if attempts < 1:
+            raise ValueError("attempts must be >= 1")
+        if base_delay < 0 or max_delay < 0:
+            raise ValueError("Delays must be non-negative.")
+        if multiplier < 1:
+            raise ValueError("multiplier must be >= 1")
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1")
+        if deadline is not None and deadline <= 0:
+            raise ValueError("deadline must be positive.")
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.retry_on = retry_on
+        self.deadline = deadline
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """
+        Returns True if `error` should be retried under this policy.
+        """
+        if isinstance(self.retry_on, (type, tuple)):
+            return isinstance(error, self.retry_on)
+        return self.retry_on(error)
+
+    def backoff(self, retry: int) -> float:
+        """
+        Returns the delay in seconds before the given retry (1-based).
+        """
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** (retry - 1))
+        return delay - delay * self.jitter * random.random()
+
+    async def call(self, fn: Callable[[T], Union[U, Awaitable[U]]], item: T) -> U:
+        """
+        Calls `fn(item)` (sync or async), retrying failures under this policy.
+        Only the current item waits during a backoff.
+
+        :param fn: The function to apply.
+        :param item: The item to apply it to.
+        :return: The result of the first successful attempt.
+        """
+        loop = asyncio.get_running_loop()
+        expires = None if self.deadline is None else loop.time() + self.deadline
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                result: Any = fn(item)
+                if asyncio.iscoroutine(result):
+                    if expires is None:
+                        result = await result
+                    else:
+                        result = await asyncio.wait_for(result, expires - loop.time())
+                return cast(U, result)
+            except Exception as e:
+                if not self.is_retryable(e):
+                    raise
+                if expires is not None and loop.time() >= expires:
+                    assert self.deadline is not None
+                    raise RetryDeadlineError(self.deadline, attempt) from e
+                if attempt >= self.attempts:
+                    raise
+                delay = self.backoff(attempt)
+                if expires is not None and loop.time() + delay >= expires:
+                    assert self.deadline is not None
+                    raise RetryDeadlineError(self.deadline, attempt) from e
+            await asyncio.sleep(delay)
 
 
 def retry_op(
@@ -13,23 +135,27 @@ def retry_op(
     Wraps the previous operator in the stream with retry logic.
     Retries the item up to `retries` times with optional delay between attempts.
 
+    This cannot re-run work done upstream; to retry a failed call for a
+    single item, pass a RetryPolicy to `map_op` or `map_async_op` instead.
+
     :param retries: Number of retries before giving up.
     :param delay: Delay in seconds between retries.
     :return: A retry-enabled async iterable.
     """
 
     async def _inner(source: AsyncIterable[T]) -> AsyncIterator[T]:
-        async for item in source:
-            attempt = 0
-            while True:
-                try:
-                    yield item
-                    break  # Success
-                except Exception:
-                    attempt += 1
-                    if attempt > retries:
-                        raise
-                    if delay > 0:
-                        await asyncio.sleep(delay)
-
-    return _inner
+        async with aclosing(source) as items:
+            async for item in items:
+                attempt = 0
+                while True:
+                    try:
+                        yield item
+                        break  # Success
+                    except Exception:
+                        attempt += 1
+                        if attempt > retries:
+                            raise
+                        if delay > 0:
+                            await asyncio.sleep(delay)
+
+    return describe(_inner, "retry")
@@ -0,0 +1,31 @@
+# corstream/ops/control/skip.py
+
+from typing import AsyncIterable, AsyncIterator, Callable, TypeVar
+
+from corstream.ops.closing import aclosing
+from corstream.ops.stage import describe
+
+T = TypeVar("T")
+
+
+def skip_op(n: int) -> Callable[[AsyncIterable[T]], AsyncIterable[T]]:
+    """
+    Creates an operator that drops the first `n` items and passes through
+    the rest.
+
+    :param n: The number of items to skip.
+    :return: A transformation function to apply to an AsyncIterable.
+    """
+    if n < 0:
+        raise ValueError("n must be >= 0")
+
+    async def _inner(source: AsyncIterable[T]) -> AsyncIterator[T]:
+        skipped = 0
+        async with aclosing(source) as items:
+            async for item in items:
+                if skipped < n:
+                    skipped += 1
+                    continue
+                yield item
+
+    return describe(_inner, "skip")
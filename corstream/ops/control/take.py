@@ -0,0 +1,59 @@
+# corstream/ops/control/take.py
+
+from typing import AsyncIterable, AsyncIterator, Awaitable, Callable, TypeVar, Union
+import asyncio
+
+from corstream.ops.closing import aclosing
+from corstream.ops.stage import describe
+
+T = TypeVar("T")
+Predicate = Callable[[T], Union[bool, Awaitable[bool]]]
+
+
+def take_op(n: int) -> Callable[[AsyncIterable[T]], AsyncIterable[T]]:
+    """
+    Creates an operator that passes through the first `n` items and then
+    stops, closing the upstream chain so no further items are produced.
+
+    :param n: The number of items to take.
+    :return: A transformation function to apply to an AsyncIterable.
+    """
+    if n < 0:
+        raise ValueError("n must be >= 0")
+
+    async def _inner(source: AsyncIterable[T]) -> AsyncIterator[T]:
+        if n == 0:
+            return
+        taken = 0
+        async with aclosing(source) as items:
+            async for item in items:
+                yield item
+                taken += 1
+                if taken >= n:
+                    return
+
+    return describe(_inner, "take")
+
+
+def take_while_op(
+    predicate: Predicate[T],
+) -> Callable[[AsyncIterable[T]], AsyncIterable[T]]:
+    """
+    Creates an operator that passes items through while the predicate holds,
+    and stops at the first item for which it does not (that item is dropped).
+
+    :param predicate: A boolean function (sync or async).
+    :return: A transformation function to apply to an AsyncIterable.
+    """
+
+    async def _inner(source: AsyncIterable[T]) -> AsyncIterator[T]:
+        async with aclosing(source) as items:
+            async for item in items:
+                result = predicate(item)
+                if asyncio.iscoroutine(result):
+                    result = await result
+                if not result:
+                    return
+                yield item
+
+    return describe(_inner, "take_while", predicate)
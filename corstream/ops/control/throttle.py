@@ -1,35 +1,46 @@
 # corstream/ops/control/throttle.py
 
-from typing import AsyncIterable, AsyncIterator, Callable, TypeVar
-import asyncio
-import time
+from typing import AsyncIterable, AsyncIterator, Callable, Optional, TypeVar
+
+from corstream.ops.control.limiter import RateLimiter
+from corstream.ops.closing import aclosing
+from corstream.ops.stage import describe
 
 T = TypeVar("T")
 
 
 def throttle_op(
-    rate: int, per_seconds: float
+    rate: Optional[float] = None,
+    per_seconds: float = 1.0,
+    burst: float = 1,
+    cost: Optional[Callable[[T], float]] = None,
+    limiter: Optional[RateLimiter] = None,
 ) -> Callable[[AsyncIterable[T]], AsyncIterable[T]]:
     """
-    Limits the flow of items to a maximum of `rate` items per `per_seconds` seconds.
+    Limits the flow of items to a maximum of `rate` items per `per_seconds` seconds,
+    using a token bucket that allows bursts of up to `burst` items.
 
-    :param rate: The maximum number of items to emit.
+    :param rate: The maximum number of items (or units of cost) to emit per window.
     :param per_seconds: The time window in seconds for the rate limit.
+    :param burst: How many units may be emitted back-to-back after an idle period.
+    :param cost: Optional function giving the weight of each item. Defaults to 1.
+    :param limiter: A shared RateLimiter to draw from instead of `rate`/`per_seconds`.
     :return: Throttled async iterable.
     """
-    if rate <= 0 or per_seconds <= 0:
-        raise ValueError("Rate and per_seconds must be positive values.")
-
-    interval = per_seconds / rate
+    if limiter is None:
+        if rate is None:
+            raise ValueError("Either rate or limiter must be provided.")
+        # Validates the arguments up front; each run gets its own bucket.
+        RateLimiter(rate, per_seconds, burst)
 
     async def _inner(source: AsyncIterable[T]) -> AsyncIterator[T]:
-        last_emit = 0.0
-        async for item in source:
-            now = time.perf_counter()
-            wait_time = last_emit + interval - now
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
-            last_emit = time.perf_counter()
-            yield item
-
-    return _inner
+        bucket = limiter
+        if bucket is None:
+            assert rate is not None
+            bucket = RateLimiter(rate, per_seconds, burst)
+        async with aclosing(source) as items:
+            async for item in items:
+                await bucket.acquire(cost(item) if cost is not None else 1)
+                yield item
+
+    return describe(_inner, "throttle")
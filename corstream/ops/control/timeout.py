@@ -0,0 +1,39 @@
+# corstream/ops/control/timeout.py
+
+from typing import Any, Awaitable, Callable, TypeVar, Union
+import asyncio
+
+from corstream.errors import StageTimeoutError
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+
+def timeout_call(
+    fn: Callable[[T], Union[U, Awaitable[U]]], timeout: float, stage: str
+) -> Callable[[T], Awaitable[U]]:
+    """
+    Wraps a function so that awaiting its result for one item takes at most
+    `timeout` seconds. The pending work is cancelled on expiry. Synchronous
+    results are returned as they are, since they cannot be interrupted.
+
+    :param fn: A function (sync or async) to wrap.
+    :param timeout: The maximum number of seconds per call.
+    :param stage: The stage name reported in the StageTimeoutError.
+    :return: An async function with the same behavior plus the timeout.
+    """
+    if timeout <= 0:
+        raise ValueError("timeout must be positive.")
+
+    async def call(item: T) -> Any:
+        result = fn(item)
+        if not asyncio.iscoroutine(result):
+            return result
+        try:
+            return await asyncio.wait_for(result, timeout)
+        except asyncio.TimeoutError as e:
+            if isinstance(e, StageTimeoutError):
+                raise
+            raise StageTimeoutError(stage, timeout, item) from None
+
+    return call
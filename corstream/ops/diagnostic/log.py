@@ -1,26 +1,252 @@
 # corstream/ops/diagnostic/log.py
 
-from typing import AsyncIterable, AsyncIterator, TypeVar, Optional, Callable
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+import asyncio
+import logging
+import queue
+import random
+import threading
+import time
+
+from corstream.ops.closing import aclosing
+from corstream.ops.stage import describe
 
 T = TypeVar("T")
 
+LogSink = Union[logging.Logger, Callable[[str], Any]]
+
+
+class LogWriter:
+    """
+    Writes log records to a sink from a background daemon thread, so a slow
+    sink (a terminal, a file, a network handler) never blocks the event loop.
+
+    Records wait in a bounded queue; when it is full, new records are dropped
+    and counted instead of holding back the stream. The thread is started on
+    the first record and exits once no run of the stage is open any more and
+    the queue has been written out.
+    """
+
+    def __init__(self, sink: Optional[LogSink] = None, queue_size: int = 1024):
+        if queue_size <= 0:
+            raise ValueError("queue_size must be >= 1")
+        if isinstance(sink, logging.Logger):
+            self._write: Callable[[str], Any] = sink.info
+        elif sink is not None:
+            self._write = sink
+        else:
+            # Looked up on every write, so a redirected stdout is honoured.
+            self._write = lambda record: print(record)
+        # None entries only wake the thread up to check whether it may exit.
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._runs = 0
+        # Futures of `flush` calls, resolved once the queue is written out.
+        self._waiters: List[
+            Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]
+        ] = []
+        self.written = 0
+        self.dropped = 0
+        self.errors = 0
+
+    def submit(self, record: str) -> None:
+        """
+        Queues a record without blocking; drops it if the queue is full.
+        """
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def open(self) -> None:
+        """
+        Registers a run of the stage; the thread stays up while one is open.
+        """
+        with self._lock:
+            self._runs += 1
+
+    def close(self) -> None:
+        """
+        Unregisters a run. Without any left, the thread writes out the queue
+        and exits; it is not waited for.
+        """
+        with self._lock:
+            self._runs -= 1
+            if self._runs or self._thread is None:
+                return
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass  # The thread checks again after the next record.
+
+    async def flush(self, timeout: Optional[float] = None) -> None:
+        """
+        Waits until every queued record is written, without blocking the loop
+        or tying up an executor thread.
+
+        :param timeout: Optional maximum number of seconds to wait. Records
+            still queued by then are discarded and counted as dropped.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if not self._queue.unfinished_tasks:
+                return
+            future: "asyncio.Future[None]" = loop.create_future()
+            self._waiters.append((loop, future))
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            self._discard()
+
+    def _discard(self) -> None:
+        # A record the thread is writing right now is still counted by it.
+        while True:
+            try:
+                record = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if record is not None:
+                self.dropped += 1
+            self._queue.task_done()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="corstream-log", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            record = self._queue.get()
+            try:
+                if record is not None:
+                    self._write(record)
+                    self.written += 1
+            except Exception:
+                # A failing sink must not take the pipeline down with it.
+                self.errors += 1
+            finally:
+                self._queue.task_done()
+            with self._lock:
+                waiters: List[Tuple[asyncio.AbstractEventLoop, Any]] = []
+                if not self._queue.unfinished_tasks:
+                    waiters, self._waiters = self._waiters, []
+                exiting = not self._runs and self._queue.empty()
+                if exiting:
+                    self._thread = None
+            for loop, future in waiters:
+                try:
+                    loop.call_soon_threadsafe(_resolve, future)
+                except RuntimeError:
+                    pass  # The loop is closed; nobody is waiting any more.
+            if exiting:
+                return
+
+    def stats(self) -> Dict[str, int]:
+        return {"written": self.written, "dropped": self.dropped, "errors": self.errors}
+
+
+def _resolve(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
 
 def log_op(
     label: Optional[str] = None,
+    sample: float = 1.0,
+    rate_limit: Optional[float] = None,
+    formatter: Optional[Callable[[T], str]] = None,
+    sink: Optional[LogSink] = None,
+    queue_size: int = 1024,
+    flush_timeout: Optional[float] = 1.0,
 ) -> Callable[[AsyncIterable[T]], AsyncIterable[T]]:
     """
-    Logs each item in the stream with an optional label, for debugging purposes.
+    Logs items in the stream with an optional label, for debugging and
+    production diagnostics. Items pass through unchanged.
+
+    Only sampled items within the rate limit are formatted; the records are
+    written by a background thread (see LogWriter), and the stage waits up to
+    `flush_timeout` for them to be written when the stream completes.
 
     :param label: A string prefix to include in log output.
+    :param sample: The fraction of items to log, in (0, 1].
+    :param rate_limit: Optional maximum number of records per second.
+    :param formatter: Optional function turning an item into a log record.
+        Defaults to "[label] item".
+    :param sink: A logging.Logger (records go to `info`) or a callable taking
+        the record. Defaults to printing to stdout.
+    :param queue_size: The maximum number of records waiting to be written.
+    :param flush_timeout: The maximum number of seconds a completed stream
+        waits for its records (None waits for all of them); the records not
+        written by then are dropped and counted.
     :return: A passthrough async iterable that logs items.
     """
+    if not 0 < sample <= 1:
+        raise ValueError("sample must be in (0, 1].")
+    if rate_limit is not None and rate_limit <= 0:
+        raise ValueError("rate_limit must be positive.")
+    if flush_timeout is not None and flush_timeout < 0:
+        raise ValueError("flush_timeout must be non-negative.")
+
+    if formatter is not None:
+        format_item: Callable[[T], str] = formatter
+    elif label:
+        format_item = lambda item: f"[{label}] {item}"  # noqa: E731
+    else:
+        format_item = str
+
+    writer = LogWriter(sink, queue_size)
+    limited = 0
+    # Token bucket shared by every run, since they share the sink.
+    capacity = max(1.0, rate_limit or 0.0)
+    tokens = capacity
+    refilled = time.monotonic()
+
+    def admit() -> bool:
+        nonlocal tokens, refilled, limited
+        assert rate_limit is not None
+        now = time.monotonic()
+        tokens = min(capacity, tokens + (now - refilled) * rate_limit)
+        refilled = now
+        if tokens < 1:
+            limited += 1
+            return False
+        tokens -= 1
+        return True
 
     async def _inner(source: AsyncIterable[T]) -> AsyncIterator[T]:
-        async for item in source:
-            if label:
-                print(f"[{label}] {item}")
-            else:
-                print(item)
-            yield item
-
-    return _inner
+        writer.open()
+        try:
+            async with aclosing(source) as items:
+                async for item in items:
+                    if (sample >= 1 or random.random() < sample) and (
+                        rate_limit is None or admit()
+                    ):
+                        writer.submit(format_item(item))
+                    yield item
+            # Only a completed stream waits for its records; closing early or
+            # being cancelled leaves them to the writer thread.
+            await writer.flush(flush_timeout)
+        finally:
+            writer.close()
+
+    def gauges() -> Dict[str, Any]:
+        return {**writer.stats(), "rate_limited": limited}
+
+    return describe(_inner, "log", gauges=gauges)
@@ -0,0 +1,175 @@
+# corstream/ops/diagnostic/metrics.py
+
+from bisect import bisect_left
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+import time
+
+from corstream.ops.closing import aclose, aclosing
+from corstream.ops.stage import describe, stage_info
+
+Operator = Callable[[AsyncIterable[Any]], AsyncIterable[Any]]
+
+# Upper bounds (in seconds) of the latency histogram buckets.
+LATENCY_BUCKETS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, 10.0, float("inf"))
+
+
+class StageMetrics:
+    """
+    Counters and timings recorded for a single instrumented stage.
+
+    `wait_time` is the time spent waiting on the upstream stage, `busy_time`
+    the time spent in the stage's own work, and `latency_histogram` counts
+    the own-work time taken to produce each output item. `gauges`, if set,
+    is polled for live values reported by the operator itself.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        name: str,
+        gauges: Optional[Callable[[], Dict[str, Any]]] = None,
+    ):
+        self.index = index
+        self.name = name
+        self.gauges = gauges
+        self.items_in = 0
+        self.items_out = 0
+        self.errors = 0
+        self.wait_time = 0.0
+        self.busy_time = 0.0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.histogram = [0] * len(LATENCY_BUCKETS)
+        self._upstream_failed = False
+
+    @property
+    def wall_time(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return end - self.started_at
+
+    def record_latency(self, seconds: float) -> None:
+        self.histogram[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns the current values as a plain dictionary.
+        """
+        return {
+            "index": self.index,
+            "name": self.name,
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "errors": self.errors,
+            "wall_time": self.wall_time,
+            "wait_time": self.wait_time,
+            "busy_time": self.busy_time,
+            "running": self.started_at is not None and self.finished_at is None,
+            "latency_histogram": dict(zip(LATENCY_BUCKETS, self.histogram)),
+            "gauges": self.gauges() if self.gauges is not None else {},
+        }
+
+
+class PipelineMetrics:
+    """
+    The metrics of every instrumented stage of one pipeline run.
+    """
+
+    def __init__(self, stages: List[StageMetrics]):
+        self.stages = stages
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns a structured snapshot of all stages. Safe to call while the
+        pipeline is running.
+        """
+        return {"stages": [stage.snapshot() for stage in self.stages]}
+
+
+def instrument_op(op: Operator, stats: StageMetrics) -> Operator:
+    """
+    Wraps an operator so that it records its activity into `stats`.
+
+    :param op: The operator to instrument.
+    :param stats: The metrics object to record into.
+    :return: An operator with the same behavior plus instrumentation.
+    """
+
+    async def _upstream(source: AsyncIterable[Any]) -> AsyncIterator[Any]:
+        async with aclosing(source) as iterator:
+            while True:
+                started = time.perf_counter()
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    stats.wait_time += time.perf_counter() - started
+                    return
+                except BaseException:
+                    stats._upstream_failed = True
+                    raise
+                stats.wait_time += time.perf_counter() - started
+                stats.items_in += 1
+                yield item
+
+    async def _inner(source: AsyncIterable[Any]) -> AsyncIterator[Any]:
+        iterator = op(_upstream(source)).__aiter__()
+        stats.started_at = time.perf_counter()
+        try:
+            while True:
+                started = time.perf_counter()
+                waited = stats.wait_time
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    stats.busy_time += (
+                        time.perf_counter() - started - (stats.wait_time - waited)
+                    )
+                    return
+                except Exception:
+                    if not stats._upstream_failed:
+                        stats.errors += 1
+                    raise
+                own = time.perf_counter() - started - (stats.wait_time - waited)
+                stats.busy_time += own
+                stats.items_out += 1
+                stats.record_latency(own)
+                yield item
+        finally:
+            stats.finished_at = time.perf_counter()
+            await aclose(iterator)
+
+    # No `fn` on purpose: an instrumented stage must never be fused away.
+    return describe(_inner, stats.name)
+
+
+def instrument_operations(
+    operations: List[Operator],
+) -> Tuple[List[Operator], PipelineMetrics]:
+    """
+    Instruments every operator of a chain.
+
+    :param operations: The operators to instrument, in order.
+    :return: The instrumented operators and the metrics they record into.
+    """
+    stages: List[StageMetrics] = []
+    instrumented: List[Operator] = []
+    for index, op in enumerate(operations):
+        info = stage_info(op)
+        stats = StageMetrics(
+            index,
+            info.name if info else getattr(op, "__name__", "op"),
+            info.gauges if info else None,
+        )
+        stages.append(stats)
+        instrumented.append(instrument_op(op, stats))
+    return instrumented, PipelineMetrics(stages)
@@ -0,0 +1,73 @@
+# corstream/ops/fanin/feed.py
+
+from typing import Any, AsyncIterable, Callable, Optional, Tuple
+import asyncio
+
+
+class SourceFeed:
+    """
+    Pulls one source in its own task into a bounded queue of `prefetch` items.
+
+    Queue entries are `(True, item)` for items, then a final `(False, None)`
+    when the source is exhausted or `(False, error)` when it failed.
+    `on_ready` is called with the feed after every entry is queued.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        source: AsyncIterable[Any],
+        prefetch: int = 1,
+        on_ready: Optional[Callable[["SourceFeed"], None]] = None,
+    ):
+        self.index = index
+        self._iterator = source.__aiter__()
+        self._prefetch = prefetch
+        self._on_ready = on_ready
+        self._queue: Optional["asyncio.Queue[Tuple[bool, Any]]"] = None
+        self._task: Optional["asyncio.Future[None]"] = None
+
+    @property
+    def queue(self) -> "asyncio.Queue[Tuple[bool, Any]]":
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._prefetch)
+        return self._queue
+
+    @property
+    def started(self) -> bool:
+        return self._task is not None
+
+    def start(self) -> None:
+        self._task = asyncio.ensure_future(self._run())
+
+    async def _put(self, entry: Tuple[bool, Any]) -> None:
+        await self.queue.put(entry)
+        if self._on_ready is not None:
+            self._on_ready(self)
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                try:
+                    item = await self._iterator.__anext__()
+                except StopAsyncIteration:
+                    break
+                await self._put((True, item))
+        except Exception as e:
+            await self._put((False, e))
+        else:
+            await self._put((False, None))
+
+    async def close(self) -> None:
+        """
+        Stops the feed and closes its source, whether or not it was started.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        aclose = getattr(self._iterator, "aclose", None)
+        if aclose is not None:
+            try:
+                await aclose()
+            except Exception:
+                pass
@@ -0,0 +1,84 @@
+# corstream/ops/fanin/interleave.py
+
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+)
+import asyncio
+
+from corstream.ops.fanin.feed import SourceFeed
+
+
+def interleave_sources(
+    sources: Sequence[AsyncIterable[Any]],
+    weights: Optional[Sequence[float]] = None,
+    prefetch: int = 1,
+) -> AsyncIterator[Any]:
+    """
+    Pulls from several sources concurrently and interleaves their items by
+    priority weight, using smooth weighted round-robin among the sources that
+    have an item ready. A source with twice the weight of another gets twice
+    as many turns while both have items; an idle source never blocks the others.
+
+    :param sources: The async iterables to interleave.
+    :param weights: Relative priority of each source. Defaults to equal weights.
+    :param prefetch: Per-source number of buffered items.
+    :return: An async iterator over the interleaved items.
+    """
+    if prefetch <= 0:
+        raise ValueError("prefetch must be >= 1")
+    shares = list(weights) if weights is not None else [1.0] * len(sources)
+    if len(shares) != len(sources):
+        raise ValueError("weights must have one entry per source")
+    if any(w <= 0 for w in shares):
+        raise ValueError("weights must be positive")
+    return _interleave(sources, shares, prefetch)
+
+
+async def _interleave(
+    sources: Sequence[AsyncIterable[Any]], shares: List[float], prefetch: int
+) -> AsyncIterator[Any]:
+
+    wakeup = asyncio.Event()
+    feeds = [
+        SourceFeed(i, source, prefetch, lambda _: wakeup.set())
+        for i, source in enumerate(sources)
+    ]
+    credit: Dict[int, float] = {feed.index: 0.0 for feed in feeds}
+    active: List[SourceFeed] = list(feeds)
+    try:
+        for feed in feeds:
+            feed.start()
+        while active:
+            candidates = [feed for feed in active if not feed.queue.empty()]
+            if len(candidates) < len(active):
+                # Give feeds that are about to refill their queue a turn, so
+                # weights aren't skewed by whichever pump happened to run last.
+                await asyncio.sleep(0)
+                candidates = [feed for feed in active if not feed.queue.empty()]
+            if not candidates:
+                wakeup.clear()
+                await wakeup.wait()
+                continue
+
+            total = 0.0
+            for feed in candidates:
+                credit[feed.index] += shares[feed.index]
+                total += shares[feed.index]
+            chosen = max(candidates, key=lambda feed: credit[feed.index])
+            credit[chosen.index] -= total
+
+            ok, value = chosen.queue.get_nowait()
+            if ok:
+                yield value
+            elif value is not None:
+                raise value
+            else:
+                active.remove(chosen)
+    finally:
+        await asyncio.gather(*(feed.close() for feed in feeds))
@@ -0,0 +1,77 @@
+# corstream/ops/fanin/merge.py
+
+from collections import deque
+from typing import Any, AsyncIterable, AsyncIterator, Deque, List, Optional, Sequence
+import asyncio
+
+from corstream.ops.fanin.feed import SourceFeed
+
+
+def merge_sources(
+    sources: Sequence[AsyncIterable[Any]],
+    max_concurrent_sources: Optional[int] = None,
+    prefetch: int = 1,
+) -> AsyncIterator[Any]:
+    """
+    Pulls from several sources concurrently and yields items in arrival order.
+
+    At most `max_concurrent_sources` sources are consumed at a time; the next
+    one starts as soon as an active source is exhausted. Each active source
+    runs at most `prefetch` items ahead of the consumer. When the consumer
+    stops early or a source fails, every remaining source is cancelled and closed.
+
+    :param sources: The async iterables to merge.
+    :param max_concurrent_sources: Maximum number of sources pulled at once.
+        Defaults to all of them.
+    :param prefetch: Per-source number of buffered items.
+    :return: An async iterator over the merged items.
+    """
+    if max_concurrent_sources is not None and max_concurrent_sources <= 0:
+        raise ValueError("max_concurrent_sources must be >= 1")
+    if prefetch <= 0:
+        raise ValueError("prefetch must be >= 1")
+    return _merge(sources, max_concurrent_sources, prefetch)
+
+
+async def _merge(
+    sources: Sequence[AsyncIterable[Any]],
+    max_concurrent_sources: Optional[int],
+    prefetch: int,
+) -> AsyncIterator[Any]:
+
+    ready: Deque[SourceFeed] = deque()
+    wakeup = asyncio.Event()
+
+    def on_ready(feed: SourceFeed) -> None:
+        ready.append(feed)
+        wakeup.set()
+
+    feeds: List[SourceFeed] = [
+        SourceFeed(i, source, prefetch, on_ready) for i, source in enumerate(sources)
+    ]
+    waiting = deque(feeds)
+    limit = max_concurrent_sources or len(feeds)
+    active = 0
+    try:
+        while waiting and active < limit:
+            waiting.popleft().start()
+            active += 1
+
+        while active:
+            if not ready:
+                wakeup.clear()
+                await wakeup.wait()
+                continue
+            feed = ready.popleft()
+            ok, value = feed.queue.get_nowait()
+            if ok:
+                yield value
+            elif value is not None:
+                raise value
+            else:
+                active -= 1
+                if waiting:
+                    waiting.popleft().start()
+                    active += 1
+    finally:
+        await asyncio.gather(*(feed.close() for feed in feeds))
@@ -0,0 +1,45 @@
+# corstream/ops/fanin/zip.py
+
+from typing import Any, AsyncIterable, AsyncIterator, Sequence, Tuple
+import asyncio
+
+from corstream.ops.fanin.feed import SourceFeed
+
+
+def zip_sources(
+    sources: Sequence[AsyncIterable[Any]], prefetch: int = 1
+) -> AsyncIterator[Tuple[Any, ...]]:
+    """
+    Pulls from several sources concurrently and yields tuples of their
+    items, position by position. Stops as soon as the shortest source ends,
+    cancelling and closing the others.
+
+    :param sources: The async iterables to zip.
+    :param prefetch: Per-source number of buffered items.
+    :return: An async iterator over the tuples.
+    """
+    if prefetch <= 0:
+        raise ValueError("prefetch must be >= 1")
+    return _zip(sources, prefetch)
+
+
+async def _zip(
+    sources: Sequence[AsyncIterable[Any]], prefetch: int
+) -> AsyncIterator[Tuple[Any, ...]]:
+
+    feeds = [SourceFeed(i, source, prefetch) for i, source in enumerate(sources)]
+    try:
+        for feed in feeds:
+            feed.start()
+        while feeds:
+            row = []
+            for feed in feeds:
+                ok, value = await feed.queue.get()
+                if not ok:
+                    if value is not None:
+                        raise value
+                    return
+                row.append(value)
+            yield tuple(row)
+    finally:
+        await asyncio.gather(*(feed.close() for feed in feeds))
@@ -0,0 +1,176 @@
+# corstream/ops/fanout/tee.py
+
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Deque,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
+import asyncio
+
+T = TypeVar("T")
+
+
+class _Broadcast:
+    """
+    Shares a single pass over `source` between several branches.
+
+    Items live in one buffer indexed by sequence number; each branch keeps its
+    own cursor. The source only advances while the slowest non-lossy branch is
+    less than `max_lag` items behind, so that branch applies backpressure.
+    Lossy branches never hold the source back: when they fall out of the
+    retained window they skip ahead to the oldest item still buffered.
+
+    The source is advanced in a task of its own, so a branch that is cancelled
+    while waiting for the next item cannot end the source for the others.
+    """
+
+    def __init__(self, source: AsyncIterable[Any], lossy: Sequence[bool], max_lag: int):
+        self._iterator = source.__aiter__()
+        self._lossy = list(lossy)
+        self._max_lag = max_lag
+        self._buffer: Deque[Any] = deque()
+        self._base = 0  # Sequence number of self._buffer[0].
+        self._cursors = [0] * len(lossy)
+        self._active = [True] * len(lossy)
+        self._finished = False
+        self._error: Optional[BaseException] = None
+        self._pull: "Optional[asyncio.Future[Any]]" = None
+        self._changed: Optional[asyncio.Event] = None
+        self.dropped = [0] * len(lossy)
+
+    @property
+    def _head(self) -> int:
+        return self._base + len(self._buffer)
+
+    def _strict_min(self) -> int:
+        cursors = [
+            c
+            for c, active, lossy in zip(self._cursors, self._active, self._lossy)
+            if active and not lossy
+        ]
+        return min(cursors, default=self._head)
+
+    def _notify(self) -> None:
+        if self._changed is not None:
+            self._changed.set()
+            self._changed = None
+
+    async def _wait(self) -> None:
+        if self._changed is None:
+            self._changed = asyncio.Event()
+        await self._changed.wait()
+
+    def _trim(self) -> None:
+        cursors = [c for c, active in zip(self._cursors, self._active) if active]
+        new_base = max(min(cursors, default=self._head), self._head - self._max_lag)
+        while self._base < new_base:
+            self._buffer.popleft()
+            self._base += 1
+
+    async def next(self, index: int) -> Any:
+        while True:
+            cursor = self._cursors[index]
+            if cursor < self._base:
+                # Only lossy branches can fall behind the retained window.
+                self.dropped[index] += self._base - cursor
+                cursor = self._base
+            if cursor < self._head:
+                self._cursors[index] = cursor + 1
+                item = self._buffer[cursor - self._base]
+                self._trim()
+                self._notify()
+                return item
+            if self._finished:
+                if self._error is not None:
+                    raise self._error
+                raise StopAsyncIteration
+            if self._pull is not None or (
+                self._head - self._strict_min() >= self._max_lag
+            ):
+                await self._wait()
+                continue
+
+            pull = self._pull = asyncio.ensure_future(self._iterator.__anext__())
+            pull.add_done_callback(self._pulled)
+            try:
+                # Shielded: cancelling this branch leaves the pull to the others.
+                await asyncio.shield(pull)
+            except Exception:
+                pass  # Recorded by _pulled, and raised to every branch above.
+
+    def _pulled(self, pull: "asyncio.Future[Any]") -> None:
+        self._pull = None
+        error = asyncio.CancelledError() if pull.cancelled() else pull.exception()
+        if isinstance(error, StopAsyncIteration):
+            self._finished = True
+        elif error is not None:
+            # Any failure of the source, even a BaseException, ends every branch.
+            self._finished = True
+            self._error = error
+        else:
+            self._buffer.append(pull.result())
+            self._trim()
+        self._notify()
+
+    async def detach(self, index: int) -> None:
+        self._active[index] = False
+        self._trim()
+        self._notify()
+        if not any(self._active) and not self._finished:
+            self._finished = True
+            if self._pull is not None:
+                self._pull.cancel()
+                await asyncio.gather(self._pull, return_exceptions=True)
+            aclose = getattr(self._iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    async def branch(self, index: int) -> AsyncIterator[Any]:
+        try:
+            while True:
+                try:
+                    item = await self.next(index)
+                except StopAsyncIteration:
+                    return
+                yield item
+        finally:
+            await self.detach(index)
+
+
+def tee_sources(
+    source: AsyncIterable[T],
+    n: int = 2,
+    max_lag: int = 1024,
+    lossy: Union[bool, Sequence[bool]] = False,
+) -> List[AsyncIterator[T]]:
+    """
+    Splits one async iterable into `n` branches fed from a single pass over it.
+
+    All non-lossy branches must be consumed concurrently: the source only runs
+    `max_lag` items ahead of the slowest of them.
+
+    :param source: The async iterable to share.
+    :param n: Number of branches.
+    :param max_lag: Maximum number of items buffered between the fastest and
+        slowest non-lossy branch.
+    :param lossy: Whether branches may drop items instead of applying
+        backpressure; a single flag or one per branch.
+    :return: The branch iterators.
+    """
+    if n <= 0:
+        raise ValueError("n must be >= 1")
+    if max_lag <= 0:
+        raise ValueError("max_lag must be >= 1")
+    flags = [lossy] * n if isinstance(lossy, bool) else list(lossy)
+    if len(flags) != n:
+        raise ValueError("lossy must be a bool or have one entry per branch")
+
+    broadcast = _Broadcast(source, flags, max_lag)
+    return [broadcast.branch(i) for i in range(n)]
@@ -0,0 +1,93 @@
+# corstream/ops/parallel/codec.py
+
+from typing import Any, Tuple, Union
+import pickle
+import struct
+
+from corstream.errors import WorkerError
+
+# Frame tags. Primitive payloads get a compact encoding; anything else is pickled.
+NONE = 0
+BYTES = 1
+STR = 2
+INT = 3
+FLOAT = 4
+PICKLE = 5
+END = 6
+ERROR = 7
+
+Payload = Union[bytes, memoryview]
+
+_INT = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+_INT_MIN = -(1 << 63)
+_INT_MAX = (1 << 63) - 1
+
+
+def encode(item: Any) -> Tuple[int, Payload]:
+    """
+    Encodes an item as a (tag, payload) frame. Bytes-like items are passed
+    through without copying, and decode as `bytes`.
+
+    :param item: The item to encode.
+    :return: The frame tag and payload.
+    """
+    kind = type(item)
+    if kind is bytes:
+        return BYTES, item
+    if kind is memoryview or kind is bytearray:
+        return BYTES, memoryview(item).cast("B")
+    if kind is str:
+        return STR, item.encode("utf-8", "surrogatepass")
+    if kind is int and _INT_MIN <= item <= _INT_MAX:
+        return INT, _INT.pack(item)
+    if kind is float:
+        return FLOAT, _FLOAT.pack(item)
+    if item is None:
+        return NONE, b""
+    return PICKLE, pickle.dumps(item, pickle.HIGHEST_PROTOCOL)
+
+
+def decode(tag: int, payload: bytes) -> Any:
+    """
+    Decodes an item frame produced by `encode`.
+
+    :param tag: The frame tag.
+    :param payload: The frame payload.
+    :return: The item.
+    """
+    if tag == BYTES:
+        return payload
+    if tag == STR:
+        return payload.decode("utf-8", "surrogatepass")
+    if tag == INT:
+        return _INT.unpack(payload)[0]
+    if tag == FLOAT:
+        return _FLOAT.unpack(payload)[0]
+    if tag == NONE:
+        return None
+    if tag == PICKLE:
+        return pickle.loads(payload)
+    raise ValueError(f"Not an item frame: {tag}")
+
+
+def encode_error(error: BaseException) -> Tuple[int, Payload]:
+    """
+    Encodes an exception as an ERROR frame, replacing it with a WorkerError
+    carrying its description if it cannot be pickled.
+    """
+    try:
+        payload = pickle.dumps(error, pickle.HIGHEST_PROTOCOL)
+        pickle.loads(payload)
+    except Exception:
+        payload = pickle.dumps(WorkerError(f"{type(error).__name__}: {error}"))
+    return ERROR, payload
+
+
+def decode_error(payload: bytes) -> BaseException:
+    """
+    Decodes an ERROR frame produced by `encode_error`.
+    """
+    error = pickle.loads(payload)
+    assert isinstance(error, BaseException)
+    return error
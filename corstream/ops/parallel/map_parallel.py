@@ -0,0 +1,97 @@
+# corstream/ops/parallel/map_parallel.py
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+import asyncio
+import os
+
+from corstream.ops.asyncflow.map_async import _run_map_async
+from corstream.ops.chunked.chunk import chunk_op
+from corstream.ops.closing import aclosing
+from corstream.ops.stage import describe
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+ExecutorSpec = Union[str, Executor]
+
+
+def _apply_chunk(fn: Callable[[T], U], chunk: List[T]) -> List[U]:
+    # Module-level so it can be pickled and shipped to worker processes.
+    return [fn(item) for item in chunk]
+
+
+def map_parallel_op(
+    fn: Callable[[T], U],
+    executor: ExecutorSpec = "thread",
+    workers: Optional[int] = None,
+    chunksize: int = 1,
+    ordered: bool = True,
+    max_pending: Optional[int] = None,
+) -> Callable[[AsyncIterable[T]], AsyncIterable[U]]:
+    """
+    Applies a synchronous function to items in a `concurrent.futures` pool,
+    keeping the event loop free for CPU-bound or blocking work.
+
+    Items are shipped to the pool in chunks of `chunksize`; at most
+    `max_pending` chunks are in flight at once, so a slow pool applies
+    backpressure to the source.
+
+    :param fn: A sync function to apply to each item. Must be picklable
+        when `executor="process"`.
+    :param executor: "thread", "process", or an existing Executor instance
+        (which is left running when the stream ends).
+    :param workers: Pool size for "thread"/"process". Defaults to the CPU count.
+    :param chunksize: Number of items sent to a worker per call.
+    :param ordered: If True, preserve input order; otherwise yield chunks
+        in completion order.
+    :param max_pending: Maximum number of chunks in flight. Defaults to twice
+        the number of workers.
+    :return: An operator that transforms the async iterable.
+    """
+    if isinstance(executor, str) and executor not in ("thread", "process"):
+        raise ValueError('executor must be "thread", "process" or an Executor')
+    if workers is not None and workers <= 0:
+        raise ValueError("workers must be >= 1")
+    if chunksize <= 0:
+        raise ValueError("chunksize must be >= 1")
+    if max_pending is not None and max_pending <= 0:
+        raise ValueError("max_pending must be >= 1")
+
+    pool_size = workers or os.cpu_count() or 1
+    window = max_pending or pool_size * 2
+    to_chunks = chunk_op(chunksize)
+
+    async def _inner(source: AsyncIterable[T]) -> AsyncIterator[U]:
+        owned: Optional[Executor] = None
+        if executor == "thread":
+            owned = ThreadPoolExecutor(max_workers=pool_size)
+        elif executor == "process":
+            owned = ProcessPoolExecutor(max_workers=pool_size)
+        pool = owned or executor
+        assert isinstance(pool, Executor)
+        loop = asyncio.get_running_loop()
+
+        async def run_chunk(chunk: List[T]) -> List[U]:
+            return await loop.run_in_executor(pool, _apply_chunk, fn, chunk)
+
+        try:
+            async with aclosing(
+                _run_map_async(to_chunks(source), run_chunk, window, ordered)
+            ) as batches:
+                async for results in batches:
+                    for result in results:
+                        yield result
+        finally:
+            if owned is not None:
+                owned.shutdown(wait=False, cancel_futures=True)
+
+    return describe(_inner, "map_parallel", fn)
@@ -0,0 +1,214 @@
+# corstream/ops/parallel/process_pipeline.py
+
+from multiprocessing.context import BaseContext
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+import asyncio
+import multiprocessing
+
+from corstream.errors import WorkerError
+from corstream.ops.closing import aclosing
+from corstream.ops.parallel.codec import (
+    END,
+    ERROR,
+    Payload,
+    decode,
+    decode_error,
+    encode,
+    encode_error,
+)
+from corstream.ops.parallel.ring import RingBuffer
+from corstream.ops.stage import describe
+
+if TYPE_CHECKING:
+    from corstream.core import Stream
+
+StageGroup = Callable[["Stream[Any]"], "Stream[Any]"]
+
+# How long a blocked side sleeps before re-checking for shutdown, in seconds.
+_POLL = 0.05
+_JOIN_TIMEOUT = 5.0
+
+
+class _Shutdown(Exception):
+    """
+    Raised inside a runner when the pipeline is being torn down.
+    """
+
+
+async def _send(ring: RingBuffer, frame: Tuple[int, Payload], cancelled: Any) -> None:
+    tag, payload = frame
+    if ring.try_put(tag, payload):
+        return
+    size = ring.frame_size(payload)
+    loop = asyncio.get_running_loop()
+    while not ring.try_put(tag, payload):
+        if cancelled.is_set():
+            raise _Shutdown
+        await loop.run_in_executor(None, ring.wait_writable, size, _POLL)
+
+
+async def _receive(
+    ring: RingBuffer,
+    cancelled: Any,
+    processes: Sequence[Any] = (),
+) -> Tuple[int, bytes]:
+    frame = ring.try_get()
+    loop = asyncio.get_running_loop()
+    while frame is None:
+        if cancelled.is_set():
+            raise _Shutdown
+        for index, process in enumerate(processes):
+            if process.exitcode not in (None, 0):
+                raise WorkerError(
+                    f"Worker process {index} exited with code {process.exitcode}"
+                )
+        await loop.run_in_executor(None, ring.wait_readable, _POLL)
+        frame = ring.try_get()
+    return frame
+
+
+async def _serve_group(
+    group: StageGroup, inbox: RingBuffer, outbox: RingBuffer, cancelled: Any
+) -> None:
+    # Imported here: this module sits below corstream.core in the package.
+    from corstream.core import Stream
+
+    async def items() -> AsyncIterator[Any]:
+        while True:
+            tag, payload = await _receive(inbox, cancelled)
+            if tag == END:
+                return
+            if tag == ERROR:
+                raise decode_error(payload)
+            yield decode(tag, payload)
+
+    async def forward(item: Any) -> None:
+        await _send(outbox, encode(item), cancelled)
+
+    try:
+        try:
+            await group(Stream(items())).for_each(forward)
+        except _Shutdown:
+            return
+        except Exception as e:
+            await _send(outbox, encode_error(e), cancelled)
+            return
+        await _send(outbox, (END, b""), cancelled)
+    except _Shutdown:
+        return
+
+
+def _run_group(
+    group: StageGroup, inbox: RingBuffer, outbox: RingBuffer, cancelled: Any
+) -> None:
+    """
+    Entry point of a worker process: runs one group of stages on its own
+    event loop, from one ring to the next.
+    """
+    try:
+        asyncio.run(_serve_group(group, inbox, outbox, cancelled))
+    finally:
+        inbox.close()
+        outbox.close()
+
+
+def _join(processes: List[Any]) -> None:
+    for process in processes:
+        process.join(_JOIN_TIMEOUT)
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+            process.join()
+
+
+def process_pipeline_op(
+    groups: Sequence[StageGroup],
+    capacity: int = 1 << 20,
+    context: Optional[BaseContext] = None,
+) -> Callable[[AsyncIterable[Any]], AsyncIterable[Any]]:
+    """
+    Creates an operator that runs each group of stages in its own worker
+    process, connected by shared-memory ring buffers.
+
+    A group is a function that adds stages to a Stream, e.g.
+    `lambda s: s.map(parse).filter(valid)`. Items travel between processes
+    in a compact encoding for bytes, str, int, float and None, and pickled
+    otherwise. A full ring blocks its writer, so a slow group holds back the
+    groups before it. The first error in any process (or the source) is
+    passed along the rings and re-raised by the consumer; stopping early or
+    failing shuts down every worker process.
+
+    With a start method other than "fork", the groups (and everything they
+    reference) must be picklable.
+
+    :param groups: The stage groups, one worker process each, in order.
+    :param capacity: The size of each ring buffer in bytes; bounds the largest item.
+    :param context: The multiprocessing context. Defaults to the default context.
+    :return: A transformation function to apply to an AsyncIterable.
+    """
+    if not groups:
+        raise ValueError("At least one group of stages is required.")
+
+    async def feed(
+        source: AsyncIterable[Any], ring: RingBuffer, cancelled: Any
+    ) -> None:
+        try:
+            try:
+                async with aclosing(source) as items:
+                    async for item in items:
+                        await _send(ring, encode(item), cancelled)
+            except _Shutdown:
+                return
+            except Exception as e:
+                await _send(ring, encode_error(e), cancelled)
+                return
+            await _send(ring, (END, b""), cancelled)
+        except _Shutdown:
+            return
+
+    async def _inner(source: AsyncIterable[Any]) -> AsyncIterator[Any]:
+        ctx: Any = context or multiprocessing.get_context()
+        rings = [RingBuffer(capacity, ctx) for _ in range(len(groups) + 1)]
+        cancelled = ctx.Event()
+        processes = [
+            ctx.Process(
+                target=_run_group,
+                args=(group, rings[index], rings[index + 1], cancelled),
+                daemon=True,
+            )
+            for index, group in enumerate(groups)
+        ]
+        feeder: Optional["asyncio.Future[None]"] = None
+        try:
+            for process in processes:
+                process.start()
+            feeder = asyncio.ensure_future(feed(source, rings[0], cancelled))
+            while True:
+                tag, payload = await _receive(rings[-1], cancelled, processes)
+                if tag == END:
+                    break
+                if tag == ERROR:
+                    raise decode_error(payload)
+                yield decode(tag, payload)
+        finally:
+            cancelled.set()
+            if feeder is not None:
+                feeder.cancel()
+                await asyncio.gather(feeder, return_exceptions=True)
+            started = [process for process in processes if process.pid is not None]
+            await asyncio.get_running_loop().run_in_executor(None, _join, started)
+            for ring in rings:
+                ring.close()
+                ring.unlink()
+
+    return describe(_inner, "run_in_processes")
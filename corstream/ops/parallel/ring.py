@@ -0,0 +1,193 @@
+# corstream/ops/parallel/ring.py
+
+from multiprocessing.context import BaseContext
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Optional, Tuple
+import multiprocessing
+import struct
+
+from corstream.ops.parallel.codec import Payload
+
+_POSITION = struct.Struct("<Q")
+_WRITE_AT = 0  # Total number of bytes ever written.
+_READ_AT = 8  # Total number of bytes ever consumed.
+_WAITERS_AT = 16  # Number of processes blocked in wait_*.
+_DATA_AT = 24
+_FRAME = struct.Struct("<IB")  # Payload length, tag.
+
+
+class RingBuffer:
+    """
+    A single-producer, single-consumer queue of (tag, payload) frames in a
+    shared-memory ring, for passing items between processes.
+
+    Payloads are copied straight into and out of shared memory. Only the
+    positions are guarded by a lock; each side caches the other side's
+    position and reads it again only when the cached value says the ring is
+    full (writer) or empty (reader), and the condition is only notified when
+    someone is blocked on it. A full ring blocks the writer, which is what
+    gives a multi-process pipeline its backpressure.
+
+    :param capacity: The size of the ring in bytes; bounds the largest frame.
+    :param context: The multiprocessing context used to create the lock.
+    """
+
+    def __init__(self, capacity: int = 1 << 20, context: Optional[BaseContext] = None):
+        if capacity <= _FRAME.size:
+            raise ValueError(f"capacity must be larger than {_FRAME.size} bytes.")
+        ctx: Any = context or multiprocessing.get_context()
+        self.capacity = capacity
+        self._shm = SharedMemory(create=True, size=_DATA_AT + capacity)
+        self._cond = ctx.Condition()
+        self._attach()
+        for offset in (_WRITE_AT, _READ_AT, _WAITERS_AT):
+            _POSITION.pack_into(self._buf, offset, 0)
+        self._written = self._read = 0
+        self._written_seen = self._read_seen = 0
+
+    def _attach(self) -> None:
+        buf = self._shm.buf
+        assert buf is not None
+        self._buf = buf
+        self._written = self._position(_WRITE_AT)
+        self._read = self._position(_READ_AT)
+        self._written_seen = self._written  # Reader's view of the writer.
+        self._read_seen = self._read  # Writer's view of the reader.
+
+    def __getstate__(self) -> Tuple[str, int, Any]:
+        return self._shm.name, self.capacity, self._cond
+
+    def __setstate__(self, state: Tuple[str, int, Any]) -> None:
+        # Worker processes share the parent's resource tracker, so attaching
+        # here doesn't take ownership; the creating process unlinks.
+        name, self.capacity, self._cond = state
+        self._shm = SharedMemory(name=name)
+        self._attach()
+
+    def _position(self, offset: int) -> int:
+        value: int = _POSITION.unpack_from(self._buf, offset)[0]
+        return value
+
+    def _publish(self, offset: int, value: int) -> None:
+        with self._cond:
+            _POSITION.pack_into(self._buf, offset, value)
+            if self._position(_WAITERS_AT):
+                self._cond.notify_all()
+
+    def _wait(self, predicate: Callable[[], bool], timeout: float) -> None:
+        with self._cond:
+            if predicate():
+                return
+            _POSITION.pack_into(self._buf, _WAITERS_AT, self._position(_WAITERS_AT) + 1)
+            try:
+                self._cond.wait_for(predicate, timeout)
+            finally:
+                _POSITION.pack_into(
+                    self._buf, _WAITERS_AT, self._position(_WAITERS_AT) - 1
+                )
+
+    def _copy_in(self, position: int, data: Payload) -> None:
+        start = position % self.capacity
+        first = min(len(data), self.capacity - start)
+        self._buf[_DATA_AT + start : _DATA_AT + start + first] = data[:first]
+        if first < len(data):
+            self._buf[_DATA_AT : _DATA_AT + len(data) - first] = data[first:]
+
+    def _copy_out(self, position: int, size: int) -> bytes:
+        start = position % self.capacity
+        first = min(size, self.capacity - start)
+        data = bytes(self._buf[_DATA_AT + start : _DATA_AT + start + first])
+        if first < size:
+            data += bytes(self._buf[_DATA_AT : _DATA_AT + size - first])
+        return data
+
+    def frame_size(self, payload: Payload) -> int:
+        """
+        Returns the number of bytes a frame takes in the ring.
+
+        :raises ValueError: If the frame can never fit.
+        """
+        size = _FRAME.size + len(payload)
+        if size > self.capacity:
+            raise ValueError(
+                f"Frame of {size} bytes does not fit a ring of {self.capacity} bytes."
+            )
+        return size
+
+    def try_put(self, tag: int, payload: Payload) -> bool:
+        """
+        Writes a frame if there is room for it right now.
+
+        :return: True if the frame was written.
+        """
+        size = self.frame_size(payload)
+        if self.capacity - (self._written - self._read_seen) < size:
+            with self._cond:
+                self._read_seen = self._position(_READ_AT)
+            if self.capacity - (self._written - self._read_seen) < size:
+                return False
+        start = self._written % self.capacity
+        if start + size <= self.capacity:
+            at = _DATA_AT + start
+            _FRAME.pack_into(self._buf, at, len(payload), tag)
+            self._buf[at + _FRAME.size : at + size] = payload
+        else:
+            self._copy_in(self._written, _FRAME.pack(len(payload), tag))
+            self._copy_in(self._written + _FRAME.size, payload)
+        self._written += size
+        self._publish(_WRITE_AT, self._written)
+        return True
+
+    def try_get(self) -> Optional[Tuple[int, bytes]]:
+        """
+        Reads the next frame if one is available right now.
+
+        :return: The (tag, payload) frame, or None.
+        """
+        if self._written_seen == self._read:
+            with self._cond:
+                self._written_seen = self._position(_WRITE_AT)
+            if self._written_seen == self._read:
+                return None
+        start = self._read % self.capacity
+        if start + _FRAME.size <= self.capacity:
+            length, tag = _FRAME.unpack_from(self._buf, _DATA_AT + start)
+        else:
+            length, tag = _FRAME.unpack(self._copy_out(self._read, _FRAME.size))
+        size = _FRAME.size + length
+        if start + size <= self.capacity:
+            at = _DATA_AT + start + _FRAME.size
+            payload = bytes(self._buf[at : at + length])
+        else:
+            payload = self._copy_out(self._read + _FRAME.size, length)
+        self._read += size
+        self._publish(_READ_AT, self._read)
+        return tag, payload
+
+    def wait_writable(self, size: int, timeout: float) -> None:
+        """
+        Blocks until `size` bytes are free or `timeout` seconds have passed.
+        """
+        self._wait(
+            lambda: self.capacity - (self._written - self._position(_READ_AT)) >= size,
+            timeout,
+        )
+
+    def wait_readable(self, timeout: float) -> None:
+        """
+        Blocks until a frame is available or `timeout` seconds have passed.
+        """
+        self._wait(lambda: self._position(_WRITE_AT) != self._read, timeout)
+
+    def close(self) -> None:
+        """
+        Detaches from the shared memory.
+        """
+        del self._buf
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """
+        Frees the shared memory. Only the creating process should call this.
+        """
+        self._shm.unlink()
@@ -0,0 +1,49 @@
+# corstream/ops/stage.py
+
+from typing import Any, Callable, Dict, NamedTuple, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_STAGE_ATTR = "__corstream_stage__"
+
+
+class StageInfo(NamedTuple):
+    """
+    Metadata attached to an operator so the pipeline compiler can reason about it.
+
+    :param name: The operator name (e.g. "map", "filter").
+    :param fn: The user function applied by the operator, if any. For "chunk",
+        the synchronous chunker used in its place on a synchronous source.
+    :param gauges: Optional callable returning live values (e.g. a current
+        concurrency limit) to include in the stage's metrics.
+    """
+
+    name: str
+    fn: Optional[Callable[..., Any]] = None
+    gauges: Optional[Callable[[], Dict[str, Any]]] = None
+
+
+def describe(
+    op: F,
+    name: str,
+    fn: Optional[Callable[..., Any]] = None,
+    gauges: Optional[Callable[[], Dict[str, Any]]] = None,
+) -> F:
+    """
+    Attaches stage metadata to an operator and returns it unchanged.
+
+    :param op: The operator to describe.
+    :param name: The operator name.
+    :param fn: The user function applied by the operator, if any.
+    :param gauges: Optional callable returning live values for metrics.
+    :return: The same operator.
+    """
+    setattr(op, _STAGE_ATTR, StageInfo(name, fn, gauges))
+    return op
+
+
+def stage_info(op: Callable[..., Any]) -> Optional[StageInfo]:
+    """
+    Returns the metadata attached to an operator, or None if it has none.
+    """
+    return getattr(op, _STAGE_ATTR, None)
@@ -1,28 +1,127 @@
 # corstream/ops/batch.py
 
-from typing import AsyncIterable, AsyncIterator, Callable, List, TypeVar
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+import asyncio
+
+from corstream.ops.closing import aclosing
+from corstream.ops.stage import describe
 
 T = TypeVar("T")
 
 
-def batch_op(size: int = 1) -> Callable[[AsyncIterable[T]], AsyncIterable[List[T]]]:
+def batch_op(
+    size: int = 1,
+    max_wait: Optional[float] = None,
+    target_latency: Optional[float] = None,
+    min_size: int = 1,
+    max_size: Optional[int] = None,
+) -> Callable[[AsyncIterable[T]], AsyncIterable[List[T]]]:
     """
     Creates a batching operator that groups items into fixed-size lists.
 
-    :param size: The number of items per batch. Defaults to 1.
+    With `max_wait`, a partial batch is flushed once its first item has waited
+    that many seconds, so a trickling source never holds items back forever.
+    With `target_latency`, the batch size adapts after every batch: it grows
+    while the downstream handles a batch faster than the target and shrinks
+    when it is slower, staying within [`min_size`, `max_size`].
+
+    :param size: The number of items per batch (the initial size if adaptive). Defaults to 1.
+    :param max_wait: Optional maximum number of seconds a batch may stay open.
+    :param target_latency: Optional target downstream processing time per batch, in seconds.
+    :param min_size: Lower bound for the adaptive batch size.
+    :param max_size: Upper bound for the adaptive batch size. Defaults to 16 * size.
     :return: A transformation function to apply to an AsyncIterable.
     """
     if size <= 0:
         raise ValueError("Batch size must be a positive integer.")
+    if max_wait is not None and max_wait <= 0:
+        raise ValueError("max_wait must be positive.")
+    if target_latency is not None and target_latency <= 0:
+        raise ValueError("target_latency must be positive.")
+    upper = max_size if max_size is not None else size * 16
+    if not 1 <= min_size <= size <= upper:
+        raise ValueError("Batch sizes must satisfy 1 <= min_size <= size <= max_size.")
 
     async def _inner(source: AsyncIterable[T]) -> AsyncIterator[List[T]]:
         batch: List[T] = []
-        async for item in source:
-            batch.append(item)
-            if len(batch) == size:
-                yield batch
-                batch = []
+        async with aclosing(source) as items:
+            async for item in items:
+                batch.append(item)
+                if len(batch) == size:
+                    yield batch
+                    batch = []
         if batch:
             yield batch
 
-    return _inner
+    def resize(limit: int, elapsed: float) -> int:
+        assert target_latency is not None
+        factor = 2.0 if elapsed <= 0 else target_latency / elapsed
+        factor = min(2.0, max(0.5, factor))
+        return min(upper, max(min_size, round(limit * factor)))
+
+    async def _dynamic(source: AsyncIterable[T]) -> AsyncIterator[List[T]]:
+        # The upstream runs in its own task so a deadline can fire while it is idle.
+        queue: "asyncio.Queue[Tuple[bool, Any]]" = asyncio.Queue(maxsize=upper)
+        loop = asyncio.get_running_loop()
+
+        async def pump() -> None:
+            try:
+                async with aclosing(source) as items:
+                    async for item in items:
+                        await queue.put((True, item))
+            except Exception as e:
+                await queue.put((False, e))
+            else:
+                await queue.put((False, None))
+
+        task = asyncio.ensure_future(pump())
+        limit = size
+        batch: List[T] = []
+        deadline = 0.0
+        try:
+            while True:
+                try:
+                    if not batch or max_wait is None:
+                        ok, value = await queue.get()
+                    elif deadline <= loop.time():
+                        raise asyncio.TimeoutError
+                    else:
+                        ok, value = await asyncio.wait_for(
+                            queue.get(), deadline - loop.time()
+                        )
+                except asyncio.TimeoutError:
+                    pass  # Deadline hit: flush the partial batch.
+                else:
+                    if not ok:
+                        if value is not None:
+                            raise value
+                        break
+                    if not batch and max_wait is not None:
+                        deadline = loop.time() + max_wait
+                    batch.append(value)
+                    if len(batch) < limit:
+                        continue
+
+                out, batch = batch, []
+                started = loop.time()
+                yield out
+                if target_latency is not None:
+                    limit = resize(limit, loop.time() - started)
+            if batch:
+                yield batch
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    if max_wait is None and target_latency is None:
+        return describe(_inner, "batch")
+    return describe(_dynamic, "batch")
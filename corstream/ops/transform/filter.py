@@ -1,29 +1,47 @@
 # corstream/ops/filter.py
 
-from typing import AsyncIterable, AsyncIterator, Callable, TypeVar, Union, Awaitable
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Optional,
+    TypeVar,
+    Union,
+    Awaitable,
+)
 import asyncio
 
+from corstream.ops.closing import aclosing
+from corstream.ops.control.timeout import timeout_call
+from corstream.ops.stage import describe
+
 T = TypeVar("T")
 Predicate = Callable[[T], Union[bool, Awaitable[bool]]]
 
 
 def filter_op(
     predicate: Predicate[T],
+    timeout: Optional[float] = None,
 ) -> Callable[[AsyncIterable[T]], AsyncIterable[T]]:
     """
     Creates a filter operator that passes through only items
     for which the predicate returns True.
 
     :param predicate: A boolean function (sync or async).
+    :param timeout: Optional maximum number of seconds to await the predicate
+        for one item; raises StageTimeoutError on expiry.
     :return: A transformation function to apply to an AsyncIterable.
     """
+    if timeout is not None:
+        predicate = timeout_call(predicate, timeout, "filter")
 
     async def _inner(source: AsyncIterable[T]) -> AsyncIterator[T]:
-        async for item in source:
-            result = predicate(item)
-            if asyncio.iscoroutine(result):
-                result = await result
-            if result:
-                yield item
-
-    return _inner
+        async with aclosing(source) as items:
+            async for item in items:
+                result = predicate(item)
+                if asyncio.iscoroutine(result):
+                    result = await result
+                if result:
+                    yield item
+
+    return describe(_inner, "filter", predicate)
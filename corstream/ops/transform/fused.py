@@ -0,0 +1,260 @@
+# corstream/ops/transform/fused.py
+
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
+import asyncio
+import inspect
+
+from corstream.ops.closing import aclosing
+from corstream.ops.stage import describe, stage_info
+
+Operator = Callable[[AsyncIterable[Any]], AsyncIterable[Any]]
+
+# (is_filter, fn) pairs, applied in order to every item.
+FusedStages = Tuple[Tuple[bool, Callable[[Any], Any]], ...]
+
+_FUSABLE = {"map": False, "filter": True}
+
+
+def fused_op(stages: FusedStages) -> Operator:
+    """
+    Creates a single operator that applies a run of synchronous map/filter
+    stages with plain function calls, instead of nesting one async generator
+    per stage.
+
+    :param stages: The (is_filter, fn) pairs to apply, in order.
+    :return: A transformation function to apply to an AsyncIterable.
+    """
+    apply = _compose(stages)
+
+    async def _inner(source: AsyncIterable[Any]) -> AsyncIterator[Any]:
+        async with aclosing(source) as items:
+            iterator = items.__aiter__()
+            kinds = _unknown_kinds(stages)
+            async for item in iterator:
+                item = await _settle(stages, kinds, item)
+                if item is not _SKIP:
+                    yield item
+                if None not in kinds:
+                    break
+            if any(kinds):
+                async for item in iterator:
+                    item = await _settle(stages, kinds, item)
+                    if item is not _SKIP:
+                        yield item
+            else:
+                async for item in iterator:
+                    item = apply(item)
+                    if item is not _SKIP:
+                        yield item
+
+    return describe(_inner, "fused")
+
+
+# Returned by the helpers below for an item that a filter stage dropped.
+_SKIP = object()
+
+
+def _compose(stages: FusedStages) -> Callable[[Any], Any]:
+    """
+    Returns a function applying synchronous stages to one item with direct
+    calls; it returns _SKIP for an item that is filtered out.
+    """
+
+    def apply(item: Any) -> Any:
+        for is_filter, fn in stages:
+            if is_filter:
+                if not fn(item):
+                    return _SKIP
+            else:
+                item = fn(item)
+        return item
+
+    return apply
+
+
+def _chain(iterator: Iterator[Any], stages: FusedStages) -> Iterator[Any]:
+    """
+    Applies synchronous stages lazily with the builtin map and filter.
+    """
+    for is_filter, fn in stages:
+        iterator = filter(fn, iterator) if is_filter else map(fn, iterator)
+    return iterator
+
+
+def _unknown_kinds(stages: FusedStages) -> List[Optional[bool]]:
+    # Sync callables may still hand back a coroutine (e.g. a lambda wrapping
+    # an async call), which keeps map/filter semantics. Whether a stage does
+    # is found out on its first call, per run: True if it does, False if not.
+    return [None] * len(stages)
+
+
+async def _settle(stages: FusedStages, kinds: List[Optional[bool]], item: Any) -> Any:
+    """
+    Applies the stages to one item, awaiting the results of the stages that
+    hand back coroutines and recording that for stages not called before.
+    Returns _SKIP for an item that is filtered out.
+    """
+    for index, (is_filter, fn) in enumerate(stages):
+        result = fn(item)
+        kind = kinds[index]
+        if kind is None:
+            kind = kinds[index] = asyncio.iscoroutine(result)
+        if kind:
+            result = await result
+        if is_filter:
+            if not result:
+                return _SKIP
+        else:
+            item = result
+    return item
+
+
+def fusable_stage(op: Operator) -> Optional[Tuple[bool, Callable[[Any], Any]]]:
+    """
+    Returns the (is_filter, fn) pair for an operator that can be fused,
+    or None if the operator must stay a boundary.
+    """
+    info = stage_info(op)
+    if info is None or info.name not in _FUSABLE or info.fn is None:
+        return None
+    if inspect.iscoroutinefunction(info.fn):
+        return None
+    return _FUSABLE[info.name], info.fn
+
+
+def split_fusable_prefix(
+    operations: Sequence[Operator],
+) -> Tuple[FusedStages, List[Operator]]:
+    """
+    Splits an operator chain into its leading run of fusable stages and the
+    remaining operators.
+
+    :param operations: The registered operators, in order.
+    :return: The (is_filter, fn) pairs of the prefix and the remaining operators.
+    """
+    stages: List[Tuple[bool, Callable[[Any], Any]]] = []
+    for op in operations:
+        stage = fusable_stage(op)
+        if stage is None:
+            break
+        stages.append(stage)
+    return tuple(stages), list(operations[len(stages) :])
+
+
+async def iterate_fused(
+    iterable: Iterable[Any], stages: FusedStages
+) -> AsyncIterator[Any]:
+    """
+    Adapts a synchronous iterable into an async iterable, applying a run of
+    fused stages inside the same loop.
+
+    :param iterable: The synchronous source.
+    :param stages: The (is_filter, fn) pairs to apply, in order.
+    """
+    iterator = iter(iterable)
+    kinds = _unknown_kinds(stages)
+    for item in iterator:
+        item = await _settle(stages, kinds, item)
+        if item is not _SKIP:
+            yield item
+        if None not in kinds:
+            break
+    if any(kinds):
+        for item in iterator:
+            item = await _settle(stages, kinds, item)
+            if item is not _SKIP:
+                yield item
+    else:
+        for item in _chain(iterator, stages):
+            yield item
+
+
+async def drive_fused(
+    iterable: Iterable[Any],
+    stages: FusedStages,
+    consume: Callable[[Any], Optional[Awaitable[Any]]],
+) -> None:
+    """
+    Runs a fully synchronous pipeline as a plain loop, with no async generator
+    in between the source, the stages and the consumer. Once every stage and
+    the consumer turn out to be synchronous, the rest of the source runs
+    through the builtin map and filter.
+
+    :param iterable: The synchronous source.
+    :param stages: The (is_filter, fn) pairs to apply, in order.
+    :param consume: Called with every surviving item (may be async).
+    """
+    iterator = iter(iterable)
+    kinds = _unknown_kinds(stages)
+    wait = True if inspect.iscoroutinefunction(consume) else None
+    for item in iterator:
+        item = await _settle(stages, kinds, item)
+        if item is _SKIP:
+            continue
+        result = consume(item)
+        if wait is None:
+            wait = asyncio.iscoroutine(result)
+        if wait:
+            await cast(Awaitable[Any], result)
+        if wait is not None and None not in kinds:
+            break
+
+    if any(kinds):
+        for item in iterator:
+            item = await _settle(stages, kinds, item)
+            if item is not _SKIP:
+                result = consume(item)
+                if wait:
+                    await cast(Awaitable[Any], result)
+    elif wait:
+        for item in _chain(iterator, stages):
+            await cast(Awaitable[Any], consume(item))
+    else:
+        for item in _chain(iterator, stages):
+            consume(item)
+
+
+def fuse_operations(operations: Sequence[Operator]) -> List[Operator]:
+    """
+    Compiles an operator chain by collapsing every run of two or more
+    synchronous map/filter stages into one fused operator. Async stages
+    and every other operator are kept as boundaries.
+
+    :param operations: The registered operators, in order.
+    :return: The compiled operator chain.
+    """
+    compiled: List[Operator] = []
+    run: List[Operator] = []
+    stages: List[Tuple[bool, Callable[[Any], Any]]] = []
+
+    def flush() -> None:
+        if len(run) > 1:
+            compiled.append(fused_op(tuple(stages)))
+        else:
+            compiled.extend(run)
+        run.clear()
+        stages.clear()
+
+    for op in operations:
+        stage = fusable_stage(op)
+        if stage is not None:
+            run.append(op)
+            stages.append(stage)
+        else:
+            flush()
+            compiled.append(op)
+    flush()
+    return compiled
@@ -1,28 +1,50 @@
 # corstream/ops/map.py
 
-from typing import AsyncIterable, Callable, TypeVar, Union, Awaitable, cast
+from typing import AsyncIterable, Callable, Optional, TypeVar, Union, Awaitable, cast
 import asyncio
 
+from corstream.ops.control.retry import RetryPolicy
+from corstream.ops.control.timeout import timeout_call
+from corstream.ops.closing import aclosing
+from corstream.ops.stage import describe
+
 T = TypeVar("T")
 U = TypeVar("U")
 
 MapFunction = Callable[[T], Union[U, Awaitable[U]]]
 
 
-def map_op(fn: MapFunction[T, U]) -> Callable[[AsyncIterable[T]], AsyncIterable[U]]:
+def map_op(
+    fn: MapFunction[T, U],
+    retry: Optional[RetryPolicy] = None,
+    timeout: Optional[float] = None,
+) -> Callable[[AsyncIterable[T]], AsyncIterable[U]]:
     """
     Creates a mapping operator that applies a function to each item
     in the stream. Supports both sync and async functions.
 
     :param fn: A function (sync or async) to apply to each element.
+    :param retry: Optional RetryPolicy used to re-invoke `fn` for an item that failed.
+    :param timeout: Optional maximum number of seconds to await `fn` for one item;
+        raises StageTimeoutError on expiry (retried like any error with `retry`).
     :return: A transformation function to apply to an AsyncIterable.
     """
+    timed: MapFunction[T, U] = fn
+    if timeout is not None:
+        timed = timeout_call(fn, timeout, "map")
 
-    async def __inner(source: AsyncIterable[T]) -> AsyncIterable[U]:
-        async for item in source:
-            result = fn(item)
-            if asyncio.iscoroutine(result):
-                result = await result
-            yield cast(U, result)
+    call: MapFunction[T, U] = timed
+    if retry is not None:
 
-    return __inner
+        async def call(item: T) -> U:
+            return await retry.call(timed, item)
+
+    async def __inner(source: AsyncIterable[T]) -> AsyncIterable[U]:
+        async with aclosing(source) as items:
+            async for item in items:
+                result = call(item)
+                if asyncio.iscoroutine(result):
+                    result = await result
+                yield cast(U, result)
+
+    return describe(__inner, "map", call)
@@ -0,0 +1,74 @@
+# corstream/partitioned.py
+
+from __future__ import annotations
+
+from corstream.ops.asyncflow.partitioned import partitioned_map_op
+from corstream.ops.control.retry import RetryPolicy
+
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Generic,
+    Hashable,
+    Optional,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    from corstream.core import Stream
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+
+class PartitionedStream(Generic[T]):
+    """
+    A Stream whose items are hash-partitioned by key into shards, so that a
+    following stage runs shards concurrently but each key strictly in order.
+    Created with `Stream.partition_by(key, shards)`.
+    """
+
+    def __init__(
+        self,
+        stream: Stream[T],
+        key: Callable[[T], Hashable],
+        shards: int,
+        queue_size: int,
+    ):
+        self._stream = stream
+        self._key = key
+        self._shards = shards
+        self._queue_size = queue_size
+
+    def map_async(
+        self,
+        fn: Callable[[T], Awaitable[U]],
+        ordered: bool = False,
+        retry: Optional[RetryPolicy] = None,
+        timeout: Optional[float] = None,
+    ) -> Stream[U]:
+        """
+        Applies an async function with one sequential worker per shard.
+        Items with the same key are processed, and their results yielded, in
+        input order. Per-shard load shows up in the stage's metrics gauges,
+        including the shards receiving more than twice their fair share.
+
+        :param fn: An async function to map over each item.
+        :param ordered: If True, preserve the global input order; otherwise
+            yield in completion order (still ordered per key).
+        :param retry: Optional RetryPolicy to re-invoke `fn` for items that fail.
+        :param timeout: Optional maximum number of seconds per call to `fn`.
+        :return: A Stream with transformed output.
+        """
+        return self._stream._add_op(
+            partitioned_map_op(
+                fn,
+                self._key,
+                self._shards,
+                self._queue_size,
+                ordered,
+                retry,
+                timeout,
+            )
+        )
@@ -0,0 +1,130 @@
+# corstream/plan.py
+
+from __future__ import annotations
+
+import copy
+
+from corstream.core import CompiledChain, Operator, Stream
+from corstream.ops.transform.fused import FusedStages
+
+from typing import (
+    Any,
+    AsyncIterable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+T = TypeVar("T")
+
+_NO_SOURCE = "A Pipeline has no source; compile() it and run it on one."
+
+
+class Pipeline(Stream[T]):
+    """
+    An immutable, source-less Stream template.
+
+    Every fluent method returns a new Pipeline and leaves the original as it
+    was, so a template can be shared and extended safely. Call `compile()` to
+    get a CompiledPipeline that runs the chain on any number of sources.
+    Created with `corstream.pipeline()`.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(())
+
+    def _copy(self) -> Pipeline[T]:
+        clone = copy.copy(self)
+        clone._operations = list(self._operations)
+        return clone
+
+    def _add_op(self, op: Operator) -> Pipeline[Any]:
+        clone = self._copy()
+        clone._operations.append(op)
+        return clone
+
+    def with_metrics(
+        self, on_run: Optional[Callable[[Dict[str, Any]], Any]] = None
+    ) -> Pipeline[T]:
+        return cast(Pipeline[T], Stream.with_metrics(self._copy(), on_run))
+
+    def with_deadline(self, seconds: float) -> Pipeline[T]:
+        return cast(Pipeline[T], Stream.with_deadline(self._copy(), seconds))
+
+    def prefetch(self, depth: int = 1) -> Pipeline[T]:
+        return cast(Pipeline[T], Stream.prefetch(self._copy(), depth))
+
+    def apply(self) -> AsyncIterable[Any]:
+        raise TypeError(_NO_SOURCE)
+
+    def _sync_plan(self) -> Optional[Tuple[Iterable[Any], FusedStages]]:
+        raise TypeError(_NO_SOURCE)
+
+    def compile(self) -> CompiledPipeline:
+        """
+        Fuses and compiles the operator chain once, for both synchronous and
+        asynchronous sources.
+
+        :return: A CompiledPipeline that can be run on many sources.
+        """
+        return CompiledPipeline(self)
+
+
+class CompiledPipeline:
+    """
+    A precompiled operator chain that runs on many sources, concurrently if
+    need be. Operators build their per-run state (queues, tasks, counters)
+    on every run, so runs never share state; only objects passed in
+    explicitly, such as a Cache or a RateLimiter, are shared by design.
+    """
+
+    def __init__(self, pipeline: Pipeline[Any]):
+        self._operations = tuple(pipeline._operations)
+        self._instrumented = pipeline._instrumented
+        self._on_run = pipeline._on_run
+        self._prefetch = pipeline._prefetch
+        self._deadline = pipeline._deadline
+        self._compiled: Dict[bool, CompiledChain] = {
+            sync_source: pipeline._compile(list(self._operations), sync_source)
+            for sync_source in (False, True)
+        }
+
+    def stream(self, source: Union[AsyncIterable[Any], Iterable[Any]]) -> Stream[Any]:
+        """
+        Binds the compiled chain to a source, without compiling it again.
+
+        :param source: A synchronous or asynchronous iterable.
+        :return: A Stream ready for any terminal operation.
+        """
+        stream: Stream[Any] = Stream(source)
+        stream._operations = list(self._operations)
+        stream._instrumented = self._instrumented
+        stream._on_run = self._on_run
+        stream._prefetch = self._prefetch
+        stream._deadline = self._deadline
+        stream._compiled = self._compiled
+        return stream
+
+    async def run(self, source: Union[AsyncIterable[Any], Iterable[Any]]) -> List[Any]:
+        """
+        Runs the compiled chain on a source and collects the results.
+
+        :param source: A synchronous or asynchronous iterable.
+        :return: A list of all output items.
+        """
+        return await self.stream(source).to_list()
+
+
+def pipeline() -> Pipeline[Any]:
+    """
+    Starts an empty Pipeline template.
+
+    :return: A Pipeline with no operators.
+    """
+    return Pipeline()
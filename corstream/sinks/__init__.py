@@ -1,9 +1,22 @@
 from .terminal.for_each import for_each_sink
 from .terminal.to_list import to_list_sink
 from .terminal.reduce import reduce_sink
+from .terminal.first import first_sink
+from .terminal.any import any_sink
+from .terminal.all import all_sink
+from .terminal.to_file import to_file_sink
+
+from .chunked.to_list import chunked_to_list_sink
+from .chunked.reduce import chunked_reduce_sink
 
 __all__ = [
     "for_each_sink",
     "to_list_sink",
     "reduce_sink",
+    "first_sink",
+    "any_sink",
+    "all_sink",
+    "to_file_sink",
+    "chunked_to_list_sink",
+    "chunked_reduce_sink",
 ]
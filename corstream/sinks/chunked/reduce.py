@@ -0,0 +1,28 @@
+# corstream/sinks/chunked/reduce.py
+
+from functools import reduce
+from typing import AsyncIterable, Callable, Sequence, TypeVar
+
+from corstream.ops.closing import aclosing
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+
+async def chunked_reduce_sink(
+    source: AsyncIterable[Sequence[T]], reducer: Callable[[U, T], U], initial: U
+) -> U:
+    """
+    Terminal sink that reduces a chunked stream to a single value, folding
+    each chunk with `functools.reduce`.
+
+    :param source: The async iterable of chunks to consume.
+    :param reducer: A function that takes (accumulator, item) and returns a new accumulator.
+    :param initial: The initial value for the accumulator.
+    :return: Final reduced value.
+    """
+    acc = initial
+    async with aclosing(source) as chunks:
+        async for chunk in chunks:
+            acc = reduce(reducer, chunk, acc)
+    return acc
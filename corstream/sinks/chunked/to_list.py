@@ -0,0 +1,21 @@
+# corstream/sinks/chunked/to_list.py
+
+from typing import AsyncIterable, List, Sequence, TypeVar
+
+from corstream.ops.closing import aclosing
+
+T = TypeVar("T")
+
+
+async def chunked_to_list_sink(source: AsyncIterable[Sequence[T]]) -> List[T]:
+    """
+    Terminal sink that collects all items of a chunked stream into a flat list.
+
+    :param source: The async iterable of chunks to consume.
+    :return: A list of all stream items.
+    """
+    result: List[T] = []
+    async with aclosing(source) as chunks:
+        async for chunk in chunks:
+            result.extend(chunk)
+    return result
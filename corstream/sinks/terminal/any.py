@@ -0,0 +1,30 @@
+# corstream/sinks/terminal/any.py
+
+from typing import AsyncIterable, Awaitable, Callable, Optional, TypeVar, Union
+import asyncio
+
+from corstream.ops.closing import aclosing
+
+T = TypeVar("T")
+Predicate = Callable[[T], Union[bool, Awaitable[bool]]]
+
+
+async def any_sink(
+    source: AsyncIterable[T], predicate: Optional[Predicate[T]] = None
+) -> bool:
+    """
+    Terminal sink that returns True as soon as an item satisfies the predicate
+    (or is truthy, without one), closing the rest of the pipeline.
+
+    :param source: The async iterable to consume.
+    :param predicate: An optional boolean function (sync or async).
+    :return: Whether any item matched.
+    """
+    async with aclosing(source) as items:
+        async for item in items:
+            result = predicate(item) if predicate is not None else item
+            if asyncio.iscoroutine(result):
+                result = await result
+            if result:
+                return True
+    return False
@@ -0,0 +1,24 @@
+# corstream/sinks/terminal/first.py
+
+from typing import AsyncIterable, Optional, TypeVar
+
+from corstream.ops.closing import aclosing
+
+T = TypeVar("T")
+
+
+async def first_sink(
+    source: AsyncIterable[T], default: Optional[T] = None
+) -> Optional[T]:
+    """
+    Terminal sink that returns the first item of the stream and closes the
+    rest of the pipeline without consuming it.
+
+    :param source: The async iterable to consume.
+    :param default: The value returned if the stream is empty.
+    :return: The first item, or `default`.
+    """
+    async with aclosing(source) as items:
+        async for item in items:
+            return item
+    return default
@@ -3,6 +3,8 @@
 from typing import AsyncIterable, Callable, Awaitable, TypeVar, Union
 import asyncio
 
+from corstream.ops.closing import aclosing
+
 T = TypeVar("T")
 Consumer = Callable[[T], Union[None, Awaitable[None]]]
 
@@ -15,7 +17,8 @@ async def for_each_sink(source: AsyncIterable[T], fn: Consumer[T]) -> None:
     :param source: The async iterable to consume.
     :param fn: The function to apply to each item (may be async).
     """
-    async for item in source:
-        result = fn(item)
-        if asyncio.iscoroutine(result):
-            await result
+    async with aclosing(source) as items:
+        async for item in items:
+            result = fn(item)
+            if asyncio.iscoroutine(result):
+                await result
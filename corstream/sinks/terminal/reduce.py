@@ -2,6 +2,8 @@
 
 from typing import AsyncIterable, Callable, TypeVar
 
+from corstream.ops.closing import aclosing
+
 T = TypeVar("T")
 U = TypeVar("U")
 
@@ -18,6 +20,7 @@ async def reduce_sink(
     :return: Final reduced value.
     """
     acc = initial
-    async for item in source:
-        acc = reducer(acc, item)
+    async with aclosing(source) as items:
+        async for item in items:
+            acc = reducer(acc, item)
     return acc
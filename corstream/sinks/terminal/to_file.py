@@ -0,0 +1,236 @@
+# corstream/sinks/terminal/to_file.py
+
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import (
+    Any,
+    AsyncIterable,
+    IO,
+    Callable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+import asyncio
+import csv
+import gzip
+import json
+import os
+
+from corstream.ops.closing import aclosing
+from corstream.sources.file import PathLike
+
+FILE_FORMATS = ("jsonl", "csv", "bytes")
+COMPRESSIONS = ("gzip",)
+
+
+class WriteStats(NamedTuple):
+    """
+    The outcome of a `to_file` run. `bytes` counts uncompressed bytes.
+    """
+
+    items: int
+    bytes: int
+    files: List[str]
+
+
+def part_path(path: PathLike, index: int) -> str:
+    """
+    Returns the name of the `index`-th rotated file: "out.jsonl.gz" becomes
+    "out.00000.jsonl.gz", "out.00001.jsonl.gz", ...
+    """
+    directory, name = os.path.split(os.fspath(path))
+    stem, dot, extension = name.partition(".")
+    return os.path.join(directory, f"{stem}.{index:05d}{dot}{extension}")
+
+
+class _FileWriter:
+    """
+    Serializes batches of items and writes them out. Only ever used from the
+    sink's writer thread.
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        format: str,
+        buffer_size: int,
+        rotate_bytes: Optional[int],
+        compress: Optional[str],
+        fields: Optional[Sequence[str]],
+    ):
+        self._path = path
+        self._buffer_size = buffer_size
+        self._rotate_bytes = rotate_bytes
+        self._compress = compress
+        self._fields = list(fields) if fields is not None else None
+        self._encode: Callable[[List[Any]], Iterator[bytes]] = getattr(
+            self, f"_{format}"
+        )
+        self._rows: Optional[Tuple[Any, List[str]]] = None
+        self._header = b""
+        if fields is not None:
+            rows: List[str] = []
+            csv.writer(SimpleNamespace(write=rows.append)).writerow(fields)
+            self._header = rows[0].encode()
+        self._file: Optional[Union[IO[bytes], gzip.GzipFile]] = None
+        self._file_bytes = 0
+        self._buffer = bytearray()
+        self.items = 0
+        self.bytes = 0
+        self.files: List[str] = []
+
+    def write(self, batch: List[Any]) -> None:
+        for record in self._encode(batch):
+            if self._file is None:
+                self._open()
+            self._buffer += record
+            self._file_bytes += len(record)
+            if (
+                self._rotate_bytes is not None
+                and self._file_bytes >= self._rotate_bytes
+            ):
+                self._close()
+            elif len(self._buffer) >= self._buffer_size:
+                self._flush()
+        self.items += len(batch)
+
+    def finish(self, batch: List[Any]) -> WriteStats:
+        self.write(batch)
+        if not self.files:
+            self._open()  # An empty stream still produces a (header-only) file.
+        self._close()
+        return WriteStats(self.items, self.bytes, self.files)
+
+    def _open(self) -> None:
+        if self._rotate_bytes is None:
+            name = os.fspath(self._path)
+        else:
+            name = part_path(self._path, len(self.files))
+        if self._compress == "gzip":
+            self._file = gzip.open(name, "wb")
+        else:
+            self._file = open(name, "wb")
+        self.files.append(name)
+        self._file_bytes = len(self._header)
+        self._buffer += self._header
+
+    def _flush(self) -> None:
+        if self._file is not None and self._buffer:
+            self._file.write(self._buffer)
+            self.bytes += len(self._buffer)
+            self._buffer.clear()
+
+    def _close(self) -> None:
+        if self._file is not None:
+            try:
+                self._flush()
+            finally:
+                self._file.close()
+                self._file = None
+                self._buffer.clear()
+
+    def _jsonl(self, batch: List[Any]) -> Iterator[bytes]:
+        dumps = json.dumps
+        for item in batch:
+            yield (dumps(item) + "\n").encode()
+
+    def _csv(self, batch: List[Any]) -> Iterator[bytes]:
+        if self._rows is None:
+            if not batch:
+                return
+            self._rows = self._csv_writer(batch[0])
+        writer, rows = self._rows
+        for item in batch:
+            writer.writerow(item)
+            yield rows.pop().encode()
+
+    def _csv_writer(self, first: Any) -> Tuple[Any, List[str]]:
+        rows: List[str] = []
+        target = SimpleNamespace(write=rows.append)
+        if not isinstance(first, dict):
+            return csv.writer(target), rows
+        writer = csv.DictWriter(target, self._fields or list(first))
+        if not self._header:
+            writer.writeheader()
+            self._header = rows.pop().encode()
+        return writer, rows
+
+    def _bytes(self, batch: List[Any]) -> Iterator[bytes]:
+        return iter(batch)
+
+
+async def to_file_sink(
+    source: AsyncIterable[Any],
+    path: PathLike,
+    format: str = "jsonl",
+    buffer_size: int = 1 << 20,
+    rotate_bytes: Optional[int] = None,
+    compress: Optional[str] = None,
+    batch_size: int = 1024,
+    fields: Optional[Sequence[str]] = None,
+) -> WriteStats:
+    """
+    Terminal sink that writes all items of the stream to a file.
+
+    Items are handed over in batches to a dedicated writer thread, which
+    serializes and writes them while the event loop fills the next batch;
+    if the writer falls behind, the stream waits for it (double buffering).
+
+    :param source: The async iterable to consume.
+    :param path: The file to write. With `rotate_bytes`, the name of every
+        part gets a sequence number (see `part_path`).
+    :param format: "jsonl" (one JSON document per item), "csv" (each item a
+        row, given as a sequence or a dict) or "bytes" (bytes-like items,
+        written as-is).
+    :param buffer_size: The number of bytes buffered per write call.
+    :param rotate_bytes: Optional size, in uncompressed bytes, after which the
+        current file is closed and a new one started.
+    :param compress: Optional compression, "gzip".
+    :param batch_size: The number of items per batch handed to the writer.
+    :param fields: Optional CSV header; the column order for dict rows, which
+        defaults to the keys of the first row.
+    :return: A WriteStats with the number of items and bytes written and the
+        files created.
+    """
+    if format not in FILE_FORMATS:
+        raise ValueError(f"format must be one of {', '.join(FILE_FORMATS)}")
+    if compress is not None and compress not in COMPRESSIONS:
+        raise ValueError(f"compress must be one of {', '.join(COMPRESSIONS)}")
+    if buffer_size <= 0 or batch_size <= 0:
+        raise ValueError("buffer_size and batch_size must be positive integers.")
+    if rotate_bytes is not None and rotate_bytes <= 0:
+        raise ValueError("rotate_bytes must be positive.")
+
+    loop = asyncio.get_running_loop()
+    writer = _FileWriter(path, format, buffer_size, rotate_bytes, compress, fields)
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="corstream-file")
+    pending: "Optional[asyncio.Future[None]]" = None
+    batch: List[Any] = []
+    try:
+        async with aclosing(source) as items:
+            async for item in items:
+                if format == "bytes" and not isinstance(item, bytes):
+                    # Views may point into a reused buffer; copy before handing over.
+                    item = bytes(item)
+                batch.append(item)
+                if len(batch) >= batch_size:
+                    if pending is not None:
+                        await pending
+                    pending = loop.run_in_executor(executor, writer.write, batch)
+                    batch = []
+        if pending is not None:
+            await pending
+            pending = None
+        return await loop.run_in_executor(executor, writer.finish, batch)
+    finally:
+        if pending is not None:
+            # Stopped early: retrieve the outcome so it is not reported as unhandled.
+            pending.add_done_callback(lambda f: f.cancelled() or f.exception())
+        # Queued after any write still running, so files are always closed.
+        executor.submit(writer._close)
+        executor.shutdown(wait=False)
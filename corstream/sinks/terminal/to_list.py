@@ -2,6 +2,8 @@
 
 from typing import AsyncIterable, TypeVar, List
 
+from corstream.ops.closing import aclosing
+
 T = TypeVar("T")
 
 
@@ -13,6 +15,7 @@ async def to_list_sink(source: AsyncIterable[T]) -> List[T]:
     :return: A list of all stream items.
     """
     result: List[T] = []
-    async for item in source:
-        result.append(item)
+    async with aclosing(source) as items:
+        async for item in items:
+            result.append(item)
     return result
@@ -0,0 +1,5 @@
+from .file import file_source
+
+__all__ = [
+    "file_source",
+]
@@ -0,0 +1,68 @@
+# corstream/sources/file.py
+
+from typing import Iterator, Union
+import mmap
+import os
+
+FILE_MODES = ("chunked", "mmap", "reuse")
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+def file_source(
+    path: PathLike, mode: str = "chunked", chunk_size: int = 1 << 20
+) -> Iterator[memoryview]:
+    """
+    Reads a binary file as a sequence of `memoryview` chunks, without
+    copying the data into a new `bytes` object per chunk.
+
+    In "chunked" mode every chunk is read into a buffer of its own, and in
+    "mmap" mode the views are slices of a read-only memory map; either way,
+    views (and records sliced from them) stay valid while referenced, and
+    keep their whole chunk or map alive. "reuse" reads every chunk into one
+    reused buffer, so each view is only valid until the next chunk is
+    requested: only use it when every stage consumes a chunk before asking
+    for the next one (no `buffer`, `prefetch`, `batch`, `map_async`, ...)
+    or copies what it keeps (`bytes(view)`).
+
+    :param path: The file to read.
+    :param mode: "chunked", "mmap" or "reuse".
+    :param chunk_size: The number of bytes per chunk.
+    :return: An iterator of memoryviews over the file contents.
+    """
+    if mode not in FILE_MODES:
+        raise ValueError(f"mode must be one of {', '.join(FILE_MODES)}")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer.")
+    if mode == "mmap":
+        return _mapped(path, chunk_size)
+    return _chunked(path, chunk_size, mode == "reuse")
+
+
+def _chunked(path: PathLike, chunk_size: int, reuse: bool) -> Iterator[memoryview]:
+    buffer = bytearray(chunk_size)
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                return
+            yield memoryview(buffer)[:n]
+            if not reuse:
+                buffer = bytearray(chunk_size)
+
+
+def _mapped(path: PathLike, chunk_size: int) -> Iterator[memoryview]:
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return  # Empty files cannot be mapped.
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    try:
+        for start in range(0, len(view), chunk_size):
+            yield view[start : start + chunk_size]
+    finally:
+        view.release()
+        try:
+            mapped.close()
+        except BufferError:
+            pass  # Views are still referenced; the map closes once they are gone.
@@ -0,0 +1,76 @@
+# tests/test_adaptive.py
+
+import asyncio
+import pytest
+
+from corstream import AdaptiveConcurrency, Stream
+
+
+def test_additive_increase_within_bounds():
+    controller = AdaptiveConcurrency(min_limit=1, max_limit=4)
+    for _ in range(20):
+        controller.on_success(controller.start(), 0.01)
+    assert controller.limit == 4
+
+
+def test_multiplicative_decrease_once_per_window():
+    controller = AdaptiveConcurrency(min_limit=1, max_limit=32, initial=16)
+    tokens = [controller.start() for _ in range(4)]
+    for token in tokens:
+        controller.on_error(token)
+    assert controller.limit == 8
+    assert controller.decreases == 1
+    controller.on_error(controller.start())
+    assert controller.limit == 4
+
+
+def test_latency_spikes_back_off():
+    targeted = AdaptiveConcurrency(max_limit=32, initial=10, target_latency=0.1)
+    targeted.on_success(targeted.start(), 0.5)
+    assert targeted.limit == 5
+
+    relative = AdaptiveConcurrency(max_limit=32, initial=10)
+    for _ in range(5):
+        relative.on_success(relative.start(), 0.01)
+    relative.on_success(relative.start(), 0.05)
+    assert relative.limit == 5
+
+
+def test_adaptive_rejects_bad_options():
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(min_limit=4, max_limit=2)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(initial=100)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(backoff=1)
+
+
+@pytest.mark.asyncio
+async def test_map_async_adapts_to_backend_capacity():
+    capacity = 4
+    active = 0
+    peak = 0
+
+    async def backend(x):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        try:
+            # Slows down sharply once more than `capacity` calls overlap.
+            await asyncio.sleep(0.001 if active <= capacity else 0.02)
+        finally:
+            active -= 1
+        return x
+
+    controller = AdaptiveConcurrency(min_limit=1, max_limit=64, target_latency=0.01)
+    stream = (
+        Stream.from_iterable(range(300))
+        .with_metrics()
+        .map_async(backend, adaptive=controller, ordered=True)
+    )
+    assert await stream.to_list() == list(range(300))
+    assert controller.decreases > 0
+    assert peak < 20
+    gauges = stream.metrics()["stages"][0]["gauges"]
+    assert gauges == {"concurrency_limit": controller.limit}
+    assert 1 <= controller.limit <= 64
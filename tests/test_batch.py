@@ -1,6 +1,8 @@
 # tests/test_batch.py
 
 import pytest
+import asyncio
+import time
 from corstream import Stream
 
 @pytest.mark.asyncio
@@ -36,4 +38,73 @@ async def test_batch_uneven():
 @pytest.mark.asyncio
 async def test_batch_invalid_size():
     with pytest.raises(ValueError):
-        Stream.from_iterable([1, 2, 3]).batch(0)
\ No newline at end of file
+        Stream.from_iterable([1, 2, 3]).batch(0)
+
+@pytest.mark.asyncio
+async def test_batch_max_wait_flushes_partial_batch():
+    async def trickle():
+        yield 1
+        yield 2
+        await asyncio.sleep(0.1)
+        yield 3
+
+    start = time.perf_counter()
+    flushed = []
+
+    async def collect(batch):
+        flushed.append((batch, time.perf_counter() - start))
+
+    await Stream.from_iterable(trickle()).batch(10, max_wait=0.02).for_each(collect)
+
+    assert [b for b, _ in flushed] == [[1, 2], [3]]
+    assert flushed[0][1] < 0.08
+
+
+@pytest.mark.asyncio
+async def test_batch_adaptive_grows_for_fast_downstream():
+    result = await (
+        Stream.from_iterable(range(200))
+        .batch(2, target_latency=0.05, max_size=32)
+        .to_list()
+    )
+
+    sizes = [len(b) for b in result]
+    assert [x for b in result for x in b] == list(range(200))
+    assert sizes[0] == 2
+    assert max(sizes) == 32
+
+
+@pytest.mark.asyncio
+async def test_batch_adaptive_shrinks_for_slow_downstream():
+    sizes = []
+
+    async def slow_write(batch):
+        sizes.append(len(batch))
+        await asyncio.sleep(0.004 * len(batch))
+
+    await (
+        Stream.from_iterable(range(60))
+        .batch(16, target_latency=0.01, min_size=2)
+        .for_each(slow_write)
+    )
+
+    assert sizes[0] == 16
+    assert sizes[-2] < 16
+
+
+@pytest.mark.asyncio
+async def test_batch_dynamic_propagates_errors():
+    async def failing():
+        yield 1
+        raise ValueError("upstream failed")
+
+    with pytest.raises(ValueError, match="upstream failed"):
+        await Stream.from_iterable(failing()).batch(4, max_wait=0.01).to_list()
+
+
+def test_batch_invalid_bounds():
+    with pytest.raises(ValueError):
+        Stream.from_iterable([1]).batch(4, max_wait=0)
+
+    with pytest.raises(ValueError):
+        Stream.from_iterable([1]).batch(8, target_latency=0.1, max_size=4)
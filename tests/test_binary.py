@@ -0,0 +1,79 @@
+# tests/test_binary.py
+
+import pytest
+
+from corstream import Stream
+
+
+def chunks_of(data, size):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 100])
+async def test_delimited_multibyte_across_chunks(size):
+    data = b"a||bb||||ccc||d"
+    result = (
+        await Stream.from_iterable(chunks_of(data, size))
+        .delimited(b"||")
+        .map(bytes)
+        .to_list()
+    )
+    assert result == [b"a", b"bb", b"", b"ccc", b"d"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [1, 2, 4, 100])
+async def test_delimited_keep_ends(size):
+    data = b"x\r\ny\r\n"
+    result = (
+        await Stream.from_iterable(chunks_of(data, size))
+        .delimited(b"\r\n", keep_ends=True)
+        .map(bytes)
+        .to_list()
+    )
+    assert result == [b"x\r\n", b"y\r\n"]
+
+
+@pytest.mark.asyncio
+async def test_lines_copy_only_straddling_records():
+    chunk_a = bytearray(b"one\ntw")
+    chunk_b = bytearray(b"o\nthree")
+    views = await Stream.from_iterable([chunk_a, chunk_b]).lines().to_list()
+    assert [bytes(view) for view in views] == [b"one", b"two", b"three"]
+    assert views[0].obj is chunk_a
+    assert views[1].obj is not chunk_a and views[1].obj is not chunk_b
+
+
+def encode(records, prefix_size=4, byteorder="big"):
+    return b"".join(
+        len(record).to_bytes(prefix_size, byteorder) + record for record in records
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [1, 2, 3, 6, 1000])
+async def test_length_prefixed(size):
+    records = [b"hello", b"", b"x" * 300, b"end"]
+    data = encode(records, 2, "little")
+    result = (
+        await Stream.from_iterable(chunks_of(data, size))
+        .length_prefixed(prefix_size=2, byteorder="little")
+        .map(bytes)
+        .to_list()
+    )
+    assert result == records
+
+
+@pytest.mark.asyncio
+async def test_length_prefixed_truncated():
+    data = encode([b"hello"])[:-1]
+    with pytest.raises(ValueError):
+        await Stream.from_iterable([data]).length_prefixed().to_list()
+
+
+def test_binary_ops_reject_bad_options():
+    with pytest.raises(ValueError):
+        Stream.from_iterable([]).delimited(b"")
+    with pytest.raises(ValueError):
+        Stream.from_iterable([]).length_prefixed(prefix_size=3)
@@ -0,0 +1,90 @@
+# tests/test_buffer.py
+
+import pytest
+import asyncio
+import time
+from corstream import Stream
+
+
+async def burst(n):
+    for i in range(n):
+        yield i
+
+
+async def slow_source(n, delay):
+    for i in range(n):
+        await asyncio.sleep(delay)
+        yield i
+
+
+@pytest.mark.asyncio
+async def test_buffer_block_keeps_every_item():
+    result = await Stream.from_iterable(burst(10)).buffer(2).to_list()
+
+    assert result == list(range(10))
+
+
+@pytest.mark.asyncio
+async def test_buffer_drop_policies():
+    newest = await (
+        Stream.from_iterable(burst(10)).buffer(2, policy="drop_newest").to_list()
+    )
+    oldest = await (
+        Stream.from_iterable(burst(10)).buffer(2, policy="drop_oldest").to_list()
+    )
+
+    assert newest == [0, 1]
+    assert oldest == [8, 9]
+
+
+@pytest.mark.asyncio
+async def test_buffer_overlaps_upstream_and_downstream():
+    async def slow_sink(x):
+        await asyncio.sleep(0.02)
+
+    start = time.perf_counter()
+    await Stream.from_iterable(slow_source(5, 0.02)).buffer(5).for_each(slow_sink)
+    elapsed = time.perf_counter() - start
+
+    # Fully serial execution would take ~0.2s.
+    assert elapsed < 0.17
+
+
+@pytest.mark.asyncio
+async def test_buffer_propagates_upstream_errors():
+    async def failing():
+        yield 1
+        raise ValueError("upstream failed")
+
+    with pytest.raises(ValueError, match="upstream failed"):
+        await Stream.from_iterable(failing()).buffer(4).to_list()
+
+
+@pytest.mark.asyncio
+async def test_prefetch_buffers_every_stage():
+    async def slow_double(x):
+        await asyncio.sleep(0.02)
+        return x * 2
+
+    start = time.perf_counter()
+    result = await (
+        Stream.from_iterable(slow_source(5, 0.02))
+        .prefetch(2)
+        .map(slow_double)
+        .to_list()
+    )
+    elapsed = time.perf_counter() - start
+
+    assert result == [0, 2, 4, 6, 8]
+    assert elapsed < 0.17
+
+
+def test_buffer_invalid_arguments():
+    with pytest.raises(ValueError):
+        Stream.from_iterable([1]).buffer(0)
+
+    with pytest.raises(ValueError):
+        Stream.from_iterable([1]).buffer(1, policy="lossy")
+
+    with pytest.raises(ValueError):
+        Stream.from_iterable([1]).prefetch(0)
@@ -0,0 +1,113 @@
+# tests/test_cache.py
+
+import asyncio
+import pytest
+
+from corstream import Cache, Stream
+
+
+@pytest.mark.asyncio
+async def test_map_async_cache_coalesces_concurrent_duplicates():
+    calls = []
+
+    async def lookup(x):
+        calls.append(x)
+        await asyncio.sleep(0.01)
+        return x * 10
+
+    cache = Cache(maxsize=16)
+    result = (
+        await Stream.from_iterable([1, 2, 1, 1, 2, 3, 1])
+        .map_async(lookup, max_concurrent=8, ordered=True, cache=cache)
+        .to_list()
+    )
+    assert result == [10, 20, 10, 10, 20, 30, 10]
+    assert sorted(calls) == [1, 2, 3]
+    assert cache.stats() == {
+        "hits": 0,
+        "misses": 3,
+        "coalesced": 4,
+        "evictions": 0,
+        "size": 3,
+    }
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_and_lru_eviction():
+    calls = []
+
+    async def lookup(x):
+        calls.append(x)
+        return x
+
+    cache = Cache(maxsize=2)
+    for x in [1, 2, 1, 3, 2, 1]:
+        await cache.call(lookup, x)
+    # 1 and 2 stored, 1 hit, 3 evicts 2, 2 evicts 1, 1 evicts 3.
+    assert calls == [1, 2, 3, 2, 1]
+    assert cache.hits == 1
+    assert cache.evictions == 3
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_ttl_and_key():
+    calls = []
+
+    async def lookup(record):
+        calls.append(record["id"])
+        return record["id"]
+
+    cache = Cache(ttl=0.02, key=lambda record: record["id"])
+    await cache.call(lookup, {"id": 1, "v": "a"})
+    await cache.call(lookup, {"id": 1, "v": "b"})
+    assert calls == [1]
+    await asyncio.sleep(0.03)
+    await cache.call(lookup, {"id": 1, "v": "c"})
+    assert calls == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_cache_does_not_store_failures():
+    attempts = []
+
+    async def flaky(x):
+        attempts.append(x)
+        await asyncio.sleep(0.01)
+        if len(attempts) == 1:
+            raise RuntimeError("boom")
+        return x
+
+    cache = Cache()
+    first, second = await asyncio.gather(
+        cache.call(flaky, 1), cache.call(flaky, 1), return_exceptions=True
+    )
+    assert isinstance(first, RuntimeError) and isinstance(second, RuntimeError)
+    assert await cache.call(flaky, 1) == 1
+    assert attempts == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_cache_survives_cancelled_computation():
+    started = asyncio.Event()
+
+    async def slow(x):
+        started.set()
+        await asyncio.sleep(0.01)
+        return x
+
+    cache = Cache()
+    leader = asyncio.ensure_future(cache.call(slow, 1))
+    await started.wait()
+    follower = asyncio.ensure_future(cache.call(slow, 1))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await follower == 1
+    assert leader.cancelled()
+
+
+def test_cache_rejects_bad_options():
+    with pytest.raises(ValueError):
+        Cache(maxsize=0)
+    with pytest.raises(ValueError):
+        Cache(ttl=0)
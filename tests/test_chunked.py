@@ -0,0 +1,106 @@
+# tests/test_chunked.py
+
+import pytest
+from corstream import Stream
+from corstream.ops import chunk_op
+from corstream.ops.stage import stage_info
+
+
+@pytest.mark.asyncio
+async def test_chunked_map_filter_to_list():
+    result = await (
+        Stream.from_iterable(range(10))
+        .chunked(3)
+        .map(lambda x: x * 2)
+        .filter(lambda x: x % 4 == 0)
+        .to_list()
+    )
+
+    assert result == [0, 4, 8, 12, 16]
+
+
+@pytest.mark.asyncio
+async def test_chunked_vectorized_functions():
+    chunk_sizes = []
+
+    def square_all(chunk):
+        chunk_sizes.append(len(chunk))
+        return [x * x for x in chunk]
+
+    result = await (
+        Stream.from_iterable(range(7))
+        .chunked(4)
+        .map(square_all, vectorized=True)
+        .filter(lambda chunk: [x > 1 for x in chunk], vectorized=True)
+        .to_list()
+    )
+
+    assert result == [4, 9, 16, 25, 36]
+    assert chunk_sizes == [4, 3]
+
+
+@pytest.mark.asyncio
+async def test_chunked_async_predicate_is_awaited():
+    async def even(x):
+        return x % 2 == 0
+
+    result = await Stream.from_iterable(range(6)).chunked(4).filter(even).to_list()
+
+    assert result == [0, 2, 4]
+
+
+@pytest.mark.asyncio
+async def test_chunked_batch_carries_across_chunks():
+    result = await Stream.from_iterable(range(7)).chunked(3).batch(2).to_list()
+
+    assert result == [[0, 1], [2, 3], [4, 5], [6]]
+
+
+@pytest.mark.asyncio
+async def test_chunked_reduce():
+    result = await (
+        Stream.from_iterable(range(100)).chunked(16).reduce(lambda acc, x: acc + x, 0)
+    )
+
+    assert result == 4950
+
+
+@pytest.mark.asyncio
+async def test_unchunk_returns_to_item_mode():
+    result = await (
+        Stream.from_iterable(range(5))
+        .chunked(2)
+        .map(lambda x: x + 1)
+        .unchunk()
+        .map(lambda x: x * 10)
+        .to_list()
+    )
+
+    assert result == [10, 20, 30, 40, 50]
+
+
+@pytest.mark.asyncio
+async def test_chunked_invalid_size():
+    with pytest.raises(ValueError):
+        Stream.from_iterable([1]).chunked(0)
+
+
+@pytest.mark.asyncio
+async def test_chunked_sync_source_is_sliced_in_bulk():
+    pulled = []
+
+    def source():
+        for i in range(7):
+            pulled.append(i)
+            yield i
+
+    def sizes(chunk):
+        return [len(pulled)] * len(chunk)
+
+    result = await (
+        Stream.from_iterable(source()).chunked(3).map(sizes, vectorized=True).to_list()
+    )
+
+    # Every chunk is complete before the next stage sees it.
+    assert result == [3, 3, 3, 6, 6, 6, 7]
+    assert list(stage_info(chunk_op(3)).fn(range(7))) == [[0, 1, 2], [3, 4, 5], [6]]
@@ -28,3 +28,51 @@ async def test_from_iterable_async():
     await Stream.from_iterable(gen()).for_each(collect)
 
     assert result == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_sync_pipeline_runs_as_plain_loop():
+    stream = (
+        Stream.from_iterable(range(10))
+        .map(lambda x: x * 2)
+        .filter(lambda x: x % 3 == 0)
+    )
+
+    assert stream._sync_plan() is not None
+    assert await stream.to_list() == [0, 6, 12, 18]
+
+
+@pytest.mark.asyncio
+async def test_sync_pipeline_reduce_and_for_each():
+    total = await (
+        Stream.from_iterable(x for x in range(5))
+        .map(lambda x: x + 1)
+        .reduce(lambda acc, x: acc + x, 0)
+    )
+
+    seen = []
+    await Stream.from_iterable([1, 2]).for_each(seen.append)
+
+    assert total == 15
+    assert seen == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_sync_source_with_async_boundary():
+    async def triple(x):
+        return x * 3
+
+    stream = (
+        Stream.from_iterable([1, 2, 3, 4])
+        .filter(lambda x: x != 2)
+        .map_async(triple, ordered=True)
+        .map(lambda x: x + 1)
+    )
+
+    assert stream._sync_plan() is None
+    assert await stream.to_list() == [4, 10, 13]
+
+
+def test_from_iterable_rejects_non_iterables():
+    with pytest.raises(TypeError):
+        Stream.from_iterable(42)
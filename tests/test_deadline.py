@@ -0,0 +1,105 @@
+# tests/test_deadline.py
+
+import asyncio
+import itertools
+import pytest
+
+from corstream import DeadlineExceededError, Stream
+
+
+@pytest.mark.asyncio
+async def test_deadline_not_reached():
+    result = (
+        await Stream.from_iterable(range(5))
+        .map(lambda x: x * 2)
+        .with_deadline(1)
+        .to_list()
+    )
+    assert result == [0, 2, 4, 6, 8]
+
+
+@pytest.mark.asyncio
+async def test_deadline_cancels_and_closes_the_pipeline():
+    state = {}
+    cancelled = []
+
+    async def source():
+        try:
+            for i in itertools.count():
+                yield i
+        finally:
+            state["closed"] = True
+
+    async def work(x):
+        try:
+            await asyncio.sleep(10 if x == 2 else 0)
+        except asyncio.CancelledError:
+            cancelled.append(x)
+            raise
+        return x
+
+    stream = (
+        Stream(source())
+        .map(lambda x: x + 1)
+        .map_async(work, max_concurrent=2, ordered=True)
+        .with_deadline(0.1)
+    )
+    with pytest.raises(DeadlineExceededError) as info:
+        await stream.to_list()
+    assert info.value.stage == "2:map_async"
+    assert info.value.deadline == 0.1
+    assert 2 in cancelled
+    assert state["closed"] is True
+
+
+@pytest.mark.asyncio
+async def test_deadline_reports_a_stuck_source():
+    async def source():
+        yield 1
+        await asyncio.sleep(10)
+        yield 2
+
+    with pytest.raises(DeadlineExceededError) as info:
+        await Stream(source()).map(lambda x: x).with_deadline(0.05).reduce(
+            lambda a, x: a + x, 0
+        )
+    assert info.value.stage == "0:source"
+
+
+@pytest.mark.asyncio
+async def test_deadline_with_sync_source():
+    async def stall(x):
+        await asyncio.sleep(10)
+
+    with pytest.raises(DeadlineExceededError) as info:
+        await Stream.from_iterable([1, 2]).map(stall).with_deadline(0.05).to_list()
+    assert info.value.stage == "1:map"
+
+    with pytest.raises(DeadlineExceededError) as info:
+        await Stream.from_iterable([1, 2]).with_deadline(0.05).for_each(stall)
+    assert info.value.stage == "sink"
+
+
+def test_deadline_must_be_positive():
+    with pytest.raises(ValueError):
+        Stream.from_iterable([]).with_deadline(0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_runs_report_their_own_stuck_stage():
+    hang = {"on": True}
+
+    async def work(x):
+        await asyncio.sleep(10 if hang["on"] else 0)
+        return x
+
+    stream = Stream.from_iterable([1, 2]).map_async(work).with_deadline(0.1)
+
+    stuck = asyncio.ensure_future(stream.to_list())
+    await asyncio.sleep(0.02)
+    hang["on"] = False
+    assert sorted(await stream.to_list()) == [1, 2]
+
+    with pytest.raises(DeadlineExceededError) as info:
+        await stuck
+    assert info.value.stage == "1:map_async"
@@ -0,0 +1,54 @@
+# tests/test_first.py
+
+import itertools
+import pytest
+
+from corstream import Stream
+
+
+def endless(state):
+    async def gen():
+        try:
+            for i in itertools.count():
+                state["pulled"] = i + 1
+                yield i
+        finally:
+            state["closed"] = True
+
+    return gen()
+
+
+@pytest.mark.asyncio
+async def test_first_stops_the_pipeline():
+    state = {}
+    result = await Stream(endless(state)).filter(lambda x: x > 41).first()
+    assert result == 42
+    assert state == {"pulled": 43, "closed": True}
+
+
+@pytest.mark.asyncio
+async def test_first_default_on_empty_stream():
+    assert await Stream.from_iterable([]).first() is None
+    assert await Stream.from_iterable([]).first(default=-1) == -1
+
+
+@pytest.mark.asyncio
+async def test_any():
+    state = {}
+    assert await Stream(endless(state)).any(lambda x: x == 5) is True
+    assert state == {"pulled": 6, "closed": True}
+    assert await Stream.from_iterable([0, 0]).any() is False
+
+    async def odd(x):
+        return x % 2 == 1
+
+    assert await Stream.from_iterable([2, 4, 5]).any(odd) is True
+
+
+@pytest.mark.asyncio
+async def test_all():
+    state = {}
+    assert await Stream(endless(state)).all(lambda x: x < 3) is False
+    assert state == {"pulled": 4, "closed": True}
+    assert await Stream.from_iterable([1, 2]).all() is True
+    assert await Stream.from_iterable([]).all(lambda x: False) is True
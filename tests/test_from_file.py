@@ -0,0 +1,75 @@
+# tests/test_from_file.py
+
+import mmap
+import pytest
+
+from corstream import Stream
+
+LINES = [b"alpha", b"", b"bravo charlie", b"delta" * 20, b"echo"]
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    path = tmp_path / "log.txt"
+    path.write_bytes(b"\n".join(LINES) + b"\n")
+    return path
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["chunked", "mmap", "reuse"])
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 1 << 20])
+async def test_from_file_lines(log_file, mode, chunk_size):
+    result = (
+        await Stream.from_file(log_file, mode=mode, chunk_size=chunk_size)
+        .lines()
+        .map(bytes)
+        .to_list()
+    )
+    assert result == LINES
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["chunked", "mmap", "reuse"])
+async def test_from_file_chunks(log_file, mode):
+    chunks = (
+        await Stream.from_file(log_file, mode=mode, chunk_size=16).map(bytes).to_list()
+    )
+    assert b"".join(chunks) == log_file.read_bytes()
+    assert all(len(chunk) == 16 for chunk in chunks[:-1])
+
+
+@pytest.mark.asyncio
+async def test_mmap_lines_are_views_of_the_map(log_file):
+    views = await Stream.from_file(log_file, mode="mmap").lines().to_list()
+    assert [bytes(view) for view in views] == LINES
+    assert all(isinstance(view.obj, mmap.mmap) for view in views)
+
+
+@pytest.mark.asyncio
+async def test_from_file_default_views_stay_valid(tmp_path):
+    path = tmp_path / "numbered.txt"
+    lines = [b"line%03d" % i for i in range(6)]
+    path.write_bytes(b"\n".join(lines) + b"\n")
+
+    views = await Stream.from_file(path, chunk_size=16).lines().to_list()
+    batches = await Stream.from_file(path, chunk_size=16).batch(4).to_list()
+
+    assert [bytes(view) for view in views] == lines
+    assert b"".join(bytes(chunk) for batch in batches for chunk in batch) == (
+        path.read_bytes()
+    )
+
+
+@pytest.mark.asyncio
+async def test_from_file_empty(tmp_path):
+    path = tmp_path / "empty"
+    path.write_bytes(b"")
+    for mode in ("chunked", "mmap", "reuse"):
+        assert await Stream.from_file(path, mode=mode).lines().to_list() == []
+
+
+def test_from_file_rejects_bad_options(log_file):
+    with pytest.raises(ValueError):
+        Stream.from_file(log_file, mode="stdio")
+    with pytest.raises(ValueError):
+        Stream.from_file(log_file, chunk_size=0)
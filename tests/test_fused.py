@@ -0,0 +1,94 @@
+# tests/test_fused.py
+
+import pytest
+import asyncio
+from corstream import Stream
+from corstream.ops import map_op, filter_op, map_async_op, fuse_operations
+from corstream.ops.stage import stage_info
+
+
+def test_fuse_collapses_sync_runs():
+    async def slow_double(x):
+        return x * 2
+
+    ops = [
+        map_op(lambda x: x + 1),
+        filter_op(lambda x: x % 2 == 0),
+        map_op(lambda x: x * 3),
+        map_op(slow_double),
+        map_op(lambda x: x - 1),
+    ]
+
+    compiled = fuse_operations(ops)
+
+    assert [stage_info(op).name for op in compiled] == ["fused", "map", "map"]
+
+
+def test_fuse_keeps_async_stages_as_boundaries():
+    async def keep(x):
+        return True
+
+    ops = [map_op(lambda x: x), filter_op(keep), map_async_op(keep)]
+
+    assert fuse_operations(ops) == ops
+
+
+@pytest.mark.asyncio
+async def test_fused_chain_matches_unfused_semantics():
+    result = await (
+        Stream.from_iterable(range(10))
+        .map(lambda x: x + 1)
+        .filter(lambda x: x % 2 == 0)
+        .map(lambda x: x * 10)
+        .filter(lambda x: x > 20)
+        .to_list()
+    )
+
+    assert result == [40, 60, 80, 100]
+
+
+@pytest.mark.asyncio
+async def test_fused_chain_awaits_coroutines_from_sync_callables():
+    async def double(x):
+        await asyncio.sleep(0)
+        return x * 2
+
+    result = await (
+        Stream.from_iterable([1, 2, 3])
+        .map(lambda x: double(x))
+        .filter(lambda x: x != 4)
+        .to_list()
+    )
+
+    assert result == [2, 6]
+
+
+@pytest.mark.asyncio
+async def test_fused_chain_awaits_coroutines_from_stages_reached_late():
+    async def double(x):
+        await asyncio.sleep(0)
+        return x * 2
+
+    async def agen(items):
+        for item in items:
+            yield item
+
+    def build(stream):
+        return stream.filter(lambda x: x > 2).map(lambda x: double(x)).map(str)
+
+    assert await build(Stream.from_iterable(range(5))).to_list() == ["6", "8"]
+    assert await build(Stream.from_iterable(agen(range(5)))).to_list() == ["6", "8"]
+
+
+@pytest.mark.asyncio
+async def test_sync_plan_awaits_a_consumer_returning_coroutines():
+    seen = []
+
+    async def record(x):
+        seen.append(x)
+
+    await Stream.from_iterable(range(4)).map(lambda x: x * 2).for_each(
+        lambda x: record(x)
+    )
+
+    assert seen == [0, 2, 4, 6]
@@ -1,7 +1,12 @@
 # tests/test_log.py
 
+import asyncio
+import logging
+import threading
+import time
+
 import pytest
-from corstream import Stream
+from corstream import DeadlineExceededError, Stream
 
 
 @pytest.mark.asyncio
@@ -36,4 +41,123 @@ async def test_log_with_label(capsys):
     
     captured = capsys.readouterr()
     assert "[debug] a" in captured.out
-    assert "[debug] b" in captured.out
\ No newline at end of file
+    assert "[debug] b" in captured.out
+
+@pytest.mark.asyncio
+async def test_log_skips_formatting_unsampled_items():
+    formatted = []
+    records = []
+
+    def formatter(item):
+        formatted.append(item)
+        return f"item {item}"
+
+    result = await (
+        Stream.from_iterable(range(1000))
+        .log(sample=0.01, formatter=formatter, sink=records.append)
+        .to_list()
+    )
+
+    assert result == list(range(1000))
+    assert len(formatted) < 100
+    assert records == [f"item {item}" for item in formatted]
+
+
+@pytest.mark.asyncio
+async def test_log_rate_limit_and_logger_sink(caplog):
+    logger = logging.getLogger("corstream.test")
+
+    with caplog.at_level(logging.INFO, logger="corstream.test"):
+        stream = Stream.from_iterable(range(50)).log("x", rate_limit=5, sink=logger)
+        stream.with_metrics()
+        assert await stream.to_list() == list(range(50))
+
+    assert [r.getMessage() for r in caplog.records][:1] == ["[x] 0"]
+    gauges = stream.metrics()["stages"][0]["gauges"]
+    assert gauges["written"] == len(caplog.records) <= 6
+    assert gauges["rate_limited"] == 50 - gauges["written"]
+
+
+@pytest.mark.asyncio
+async def test_log_drops_records_instead_of_blocking_on_a_slow_sink():
+    release = threading.Event()
+
+    def slow_sink(record):
+        release.wait()
+
+    stream = Stream.from_iterable(range(100)).log(sink=slow_sink, queue_size=4)
+    stream.with_metrics()
+    result = []
+    try:
+        async for item in stream.apply():
+            result.append(item)
+            if len(result) == 100:
+                # Every item went through even though the sink is still stuck.
+                gauges = stream.metrics()["stages"][0]["gauges"]
+                assert gauges["dropped"] >= 100 - 5
+                release.set()
+    finally:
+        release.set()
+
+    assert result == list(range(100))
+
+
+@pytest.mark.asyncio
+async def test_log_writer_thread_exits_when_runs_finish():
+    before = threading.active_count()
+
+    for _ in range(50):
+        records = []
+        await Stream.from_iterable(range(3)).log(sink=records.append).to_list()
+        assert records == ["0", "1", "2"]
+
+    await asyncio.sleep(0.05)
+    assert threading.active_count() <= before + 1
+
+
+@pytest.mark.asyncio
+async def test_log_does_not_hold_up_a_deadline():
+    release = threading.Event()
+
+    def stuck_sink(record):
+        release.wait()
+
+    started = time.perf_counter()
+    try:
+        with pytest.raises(DeadlineExceededError):
+            await (
+                Stream.from_iterable(range(10))
+                .log(sink=stuck_sink)
+                .with_deadline(0.1)
+                .to_list()
+            )
+    finally:
+        release.set()
+
+    assert time.perf_counter() - started < 1
+
+
+@pytest.mark.asyncio
+async def test_log_bounds_the_flush_and_counts_unwritten_records():
+    release = threading.Event()
+
+    def stuck_sink(record):
+        release.wait()
+
+    stream = (
+        Stream.from_iterable(range(10))
+        .log(sink=stuck_sink, flush_timeout=0.05)
+        .with_metrics()
+    )
+    started = time.perf_counter()
+    try:
+        assert await stream.to_list() == list(range(10))
+        elapsed = time.perf_counter() - started
+        gauges = stream.metrics()["stages"][0]["gauges"]
+    finally:
+        release.set()
+
+    assert elapsed < 0.5
+    # The record stuck in the sink is the only one not counted as dropped.
+    assert gauges["dropped"] == 9
+    assert gauges["written"] == 0
@@ -57,4 +57,60 @@ async def test_map_async_invalid_concurrency():
         return x
     
     with pytest.raises(ValueError):
-        Stream.from_iterable([1]).map_async(noop, max_concurrent=0)
\ No newline at end of file
+        Stream.from_iterable([1]).map_async(noop, max_concurrent=0)
+
+@pytest.mark.asyncio
+async def test_map_async_ordered():
+    async def echo_with_delay(x):
+        await asyncio.sleep(0.03 if x == 1 else 0.01)
+        return x
+
+    result = await (
+        Stream.from_iterable([1, 2, 3, 4])
+        .map_async(echo_with_delay, max_concurrent=4, ordered=True)
+        .to_list()
+    )
+
+    assert result == [1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_map_async_unordered_completion_order():
+    async def echo_with_delay(x):
+        await asyncio.sleep(0.03 if x == 1 else 0.01)
+        return x
+
+    result = await (
+        Stream.from_iterable([1, 2, 3])
+        .map_async(echo_with_delay, max_concurrent=3)
+        .to_list()
+    )
+
+    assert result[-1] == 1
+
+
+@pytest.mark.asyncio
+async def test_map_async_streams_before_source_ends():
+    pulled = []
+    first_result_seen_after = []
+
+    async def source():
+        for i in range(10):
+            pulled.append(i)
+            yield i
+
+    async def identity(x):
+        return x
+
+    async def collect(x):
+        if not first_result_seen_after:
+            first_result_seen_after.append(len(pulled))
+
+    await (
+        Stream.from_iterable(source())
+        .map_async(identity, max_concurrent=2)
+        .for_each(collect)
+    )
+
+    # The window never pulls more than max_concurrent items ahead.
+    assert first_result_seen_after == [2]
@@ -0,0 +1,78 @@
+# tests/test_map_parallel.py
+
+import pytest
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from corstream import Stream
+
+
+def square(x):
+    return x * x
+
+
+@pytest.mark.asyncio
+async def test_map_parallel_threads_ordered():
+    result = await (
+        Stream.from_iterable(range(20))
+        .map_parallel(square, executor="thread", workers=4, chunksize=3)
+        .to_list()
+    )
+
+    assert result == [x * x for x in range(20)]
+
+
+@pytest.mark.asyncio
+async def test_map_parallel_processes():
+    result = await (
+        Stream.from_iterable(range(10))
+        .map_parallel(square, executor="process", workers=2, chunksize=4)
+        .to_list()
+    )
+
+    assert result == [x * x for x in range(10)]
+
+
+@pytest.mark.asyncio
+async def test_map_parallel_unordered():
+    result = await (
+        Stream.from_iterable(range(10))
+        .map_parallel(square, workers=3, ordered=False)
+        .to_list()
+    )
+
+    assert sorted(result) == [x * x for x in range(10)]
+
+
+@pytest.mark.asyncio
+async def test_map_parallel_runs_off_loop_thread():
+    loop_thread = threading.get_ident()
+
+    def whoami(_):
+        return threading.get_ident()
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        result = await (
+            Stream.from_iterable(range(4)).map_parallel(whoami, executor=pool).to_list()
+        )
+
+    assert loop_thread not in result
+
+
+@pytest.mark.asyncio
+async def test_map_parallel_error_propagation():
+    def risky(x):
+        if x == 3:
+            raise ValueError("Bad input!")
+        return x
+
+    with pytest.raises(ValueError, match="Bad input!"):
+        await Stream.from_iterable(range(5)).map_parallel(risky).to_list()
+
+
+@pytest.mark.asyncio
+async def test_map_parallel_invalid_arguments():
+    with pytest.raises(ValueError):
+        Stream.from_iterable([1]).map_parallel(square, executor="fiber")
+
+    with pytest.raises(ValueError):
+        Stream.from_iterable([1]).map_parallel(square, chunksize=0)
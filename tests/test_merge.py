@@ -0,0 +1,128 @@
+# tests/test_merge.py
+
+import pytest
+import asyncio
+import time
+from corstream import Stream
+
+
+async def ticking(values, delay):
+    for v in values:
+        await asyncio.sleep(delay)
+        yield v
+
+
+@pytest.mark.asyncio
+async def test_merge_pulls_sources_concurrently():
+    start = time.perf_counter()
+    result = await Stream.merge(
+        ticking("abc", 0.02), ticking("xyz", 0.02), Stream.from_iterable([1, 2])
+    ).to_list()
+    elapsed = time.perf_counter() - start
+
+    assert sorted(map(str, result)) == sorted(["a", "b", "c", "x", "y", "z", "1", "2"])
+    assert elapsed < 0.1  # Serial would be >= 0.12s.
+
+
+@pytest.mark.asyncio
+async def test_merge_yields_in_arrival_order():
+    result = await Stream.merge(
+        ticking([3], 0.03), ticking([1], 0.01), ticking([2], 0.02)
+    ).to_list()
+
+    assert result == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_merge_limits_concurrent_sources():
+    running = []
+    peak = []
+
+    async def tracked(values):
+        running.append(1)
+        peak.append(len(running))
+        try:
+            for v in values:
+                await asyncio.sleep(0.005)
+                yield v
+        finally:
+            running.pop()
+
+    result = await Stream.merge(
+        *(tracked([i]) for i in range(5)), max_concurrent_sources=2
+    ).to_list()
+
+    assert sorted(result) == [0, 1, 2, 3, 4]
+    assert max(peak) <= 2
+
+
+@pytest.mark.asyncio
+async def test_merge_cancels_remaining_sources_on_early_exit():
+    closed = []
+
+    async def endless(name):
+        try:
+            while True:
+                await asyncio.sleep(0.001)
+                yield name
+        finally:
+            closed.append(name)
+
+    iterator = Stream.merge(endless("a"), endless("b")).apply()
+    async for _ in iterator:
+        break
+    await iterator.aclose()
+
+    assert sorted(closed) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_merge_propagates_source_errors():
+    async def failing():
+        yield 1
+        raise ValueError("source failed")
+
+    with pytest.raises(ValueError, match="source failed"):
+        await Stream.merge(failing(), ticking([1, 2, 3], 0.01)).to_list()
+
+
+@pytest.mark.asyncio
+async def test_zip_pairs_items_and_stops_at_shortest():
+    result = await Stream.zip(
+        ticking([1, 2, 3], 0.01), Stream.from_iterable("ab").map(str.upper)
+    ).to_list()
+
+    assert result == [(1, "A"), (2, "B")]
+
+
+@pytest.mark.asyncio
+async def test_interleave_respects_weights():
+    result = await Stream.interleave(
+        Stream.from_iterable(["a"] * 6), Stream.from_iterable(["b"] * 6), weights=[2, 1]
+    ).to_list()
+
+    assert result[:6].count("a") == 4
+    assert sorted(result) == ["a"] * 6 + ["b"] * 6
+
+
+@pytest.mark.asyncio
+async def test_interleave_does_not_wait_for_idle_source():
+    result = await Stream.interleave(
+        ticking(["slow"], 0.05), Stream.from_iterable(["fast"] * 3), weights=[10, 1]
+    ).to_list()
+
+    assert result == ["fast", "fast", "fast", "slow"]
+
+
+def test_fanin_invalid_arguments():
+    with pytest.raises(ValueError):
+        Stream.merge([1], max_concurrent_sources=0)
+
+    with pytest.raises(ValueError):
+        Stream.merge([1], [2], prefetch=0)
+
+    with pytest.raises(ValueError):
+        Stream.zip([1], [2], prefetch=0)
+
+    with pytest.raises(ValueError):
+        Stream.interleave([1], [2], weights=[1])
@@ -0,0 +1,90 @@
+# tests/test_metrics.py
+
+import pytest
+import asyncio
+from corstream import Stream
+
+
+@pytest.mark.asyncio
+async def test_metrics_counts_items_per_stage():
+    stream = (
+        Stream.from_iterable(range(10))
+        .with_metrics()
+        .map(lambda x: x * 2)
+        .filter(lambda x: x % 4 == 0)
+        .batch(2)
+    )
+
+    await stream.to_list()
+    stages = stream.metrics()["stages"]
+
+    assert [s["name"] for s in stages] == ["map", "filter", "batch"]
+    assert [(s["items_in"], s["items_out"]) for s in stages] == [
+        (10, 10),
+        (10, 5),
+        (5, 3),
+    ]
+    assert all(not s["running"] for s in stages)
+    assert sum(stages[0]["latency_histogram"].values()) == 10
+
+
+@pytest.mark.asyncio
+async def test_metrics_separates_wait_from_busy_time():
+    async def slow_source():
+        for i in range(3):
+            await asyncio.sleep(0.02)
+            yield i
+
+    stream = Stream.from_iterable(slow_source()).with_metrics().map(lambda x: x)
+    await stream.to_list()
+    (stage,) = stream.metrics()["stages"]
+
+    assert stage["wait_time"] >= 0.05
+    assert stage["busy_time"] < stage["wait_time"]
+
+
+@pytest.mark.asyncio
+async def test_metrics_attributes_errors_to_failing_stage():
+    def boom(x):
+        if x == 2:
+            raise ValueError("boom")
+        return x
+
+    stream = Stream.from_iterable([1, 2, 3]).with_metrics().map(boom).map(str)
+
+    with pytest.raises(ValueError):
+        await stream.to_list()
+
+    stages = stream.metrics()["stages"]
+    assert [s["errors"] for s in stages] == [1, 0]
+
+
+@pytest.mark.asyncio
+async def test_metrics_can_be_polled_while_running():
+    snapshots = []
+    stream = Stream.from_iterable(range(3)).with_metrics().map(lambda x: x)
+
+    await stream.for_each(lambda x: snapshots.append(stream.metrics()))
+
+    assert snapshots[0]["stages"][0]["running"]
+    assert snapshots[-1]["stages"][0]["items_out"] == 3
+
+
+def test_metrics_disabled_by_default():
+    with pytest.raises(RuntimeError):
+        Stream.from_iterable([1]).metrics()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_runs_record_separate_metrics():
+    runs = []
+    stream = (
+        Stream.from_iterable(range(4))
+        .with_metrics(on_run=runs.append)
+        .map(lambda x: asyncio.sleep(0.001, result=x))
+    )
+
+    await asyncio.gather(stream.to_list(), stream.to_list(), stream.first())
+
+    assert sorted(run["stages"][0]["items_in"] for run in runs) == [1, 4, 4]
+    assert stream.metrics()["stages"][0]["items_in"] in (1, 4)
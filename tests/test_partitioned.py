@@ -0,0 +1,122 @@
+# tests/test_partitioned.py
+
+import asyncio
+import itertools
+import random
+import pytest
+
+from corstream import Stream
+
+
+def events(n_keys=5, per_key=10):
+    return [(key, i) for i in range(per_key) for key in range(n_keys)]
+
+
+@pytest.mark.asyncio
+async def test_partition_by_keeps_per_key_order_and_runs_shards_concurrently():
+    rng = random.Random(7)
+    active = set()
+    peak = 0
+
+    async def handle(event):
+        nonlocal peak
+        key, _ = event
+        assert key not in active  # One item per key in flight at a time.
+        active.add(key)
+        peak = max(peak, len(active))
+        await asyncio.sleep(rng.random() * 0.002)
+        active.discard(key)
+        return event
+
+    result = (
+        await Stream.from_iterable(events())
+        .partition_by(lambda e: e[0], shards=5)
+        .map_async(handle)
+        .to_list()
+    )
+    assert sorted(result) == sorted(events())
+    for key in range(5):
+        assert [i for k, i in result if k == key] == list(range(10))
+    assert peak > 1
+
+
+@pytest.mark.asyncio
+async def test_partition_by_ordered():
+    async def handle(event):
+        await asyncio.sleep(0.001 * (event[0] % 3))
+        return event
+
+    result = (
+        await Stream.from_iterable(events())
+        .partition_by(lambda e: e[0], shards=3)
+        .map_async(handle, ordered=True)
+        .to_list()
+    )
+    assert result == events()
+
+
+@pytest.mark.asyncio
+async def test_partition_by_propagates_errors():
+    async def handle(event):
+        if event == (2, 3):
+            raise RuntimeError("bad event")
+        return event
+
+    with pytest.raises(RuntimeError, match="bad event"):
+        await (
+            Stream.from_iterable(events())
+            .partition_by(lambda e: e[0], shards=2)
+            .map_async(handle)
+            .to_list()
+        )
+
+
+@pytest.mark.asyncio
+async def test_partition_by_backpressure_and_early_exit():
+    state = {"pulled": 0}
+
+    async def source():
+        try:
+            for i in itertools.count():
+                state["pulled"] = i + 1
+                yield i
+        finally:
+            state["closed"] = True
+
+    async def handle(x):
+        await asyncio.sleep(0)
+        return x
+
+    result = (
+        await Stream(source())
+        .partition_by(lambda x: x % 2, shards=2, queue_size=2)
+        .map_async(handle, ordered=True)
+        .take(5)
+        .to_list()
+    )
+    assert result == [0, 1, 2, 3, 4]
+    assert state["closed"] is True
+    assert state["pulled"] <= 5 + 2 * 3 + 1
+
+
+@pytest.mark.asyncio
+async def test_partition_by_reports_hot_shards():
+    async def handle(x):
+        return x
+
+    stream = (
+        Stream.from_iterable([0] * 40 + [1, 2, 3])
+        .with_metrics()
+        .partition_by(lambda x: x, shards=4)
+        .map_async(handle)
+    )
+    await stream.to_list()
+    gauges = stream.metrics()["stages"][0]["gauges"]
+    assert [shard["items"] for shard in gauges["shards"]] == [40, 1, 1, 1]
+    assert gauges["hot_shards"] == [0]
+    assert gauges["skew"] > 3
+
+
+def test_partition_by_rejects_bad_options():
+    with pytest.raises(ValueError):
+        Stream.from_iterable([]).partition_by(lambda x: x, shards=0)
@@ -0,0 +1,91 @@
+# tests/test_pipeline.py
+
+import asyncio
+import pytest
+
+import corstream
+from corstream import CompiledPipeline, Pipeline
+
+
+async def agen(items):
+    for item in items:
+        await asyncio.sleep(0)
+        yield item
+
+
+def test_pipeline_is_immutable():
+    base = corstream.pipeline().map(lambda x: x + 1)
+    extended = base.filter(lambda x: x % 2 == 0)
+
+    assert isinstance(base, Pipeline)
+    assert isinstance(extended, Pipeline)
+    assert len(base._operations) == 1
+    assert len(extended._operations) == 2
+    assert base.with_metrics() is not base
+    assert not base._instrumented
+    assert base.prefetch(2)._prefetch == 2
+    assert base._prefetch is None
+
+
+@pytest.mark.asyncio
+async def test_compiled_pipeline_runs_on_sync_and_async_sources():
+    plan = (
+        corstream.pipeline().map(lambda x: x * 2).filter(lambda x: x % 3 != 0).compile()
+    )
+
+    assert isinstance(plan, CompiledPipeline)
+    assert await plan.run(range(6)) == [2, 4, 8, 10]
+    assert await plan.run(agen(range(6))) == [2, 4, 8, 10]
+    assert await plan.stream([1, 2]).reduce(lambda a, b: a + b, 0) == 6
+
+
+@pytest.mark.asyncio
+async def test_compiled_pipeline_runs_concurrently_without_shared_state():
+    async def slow_double(x):
+        await asyncio.sleep(0.001 * (x % 3))
+        return x * 2
+
+    plan = (
+        corstream.pipeline()
+        .map_async(slow_double, max_concurrent=3, ordered=True)
+        .batch(2)
+        .partition_by(lambda batch: batch[0] % 2, shards=2)
+        .map_async(lambda batch: asyncio.sleep(0, result=sum(batch)), ordered=True)
+        .compile()
+    )
+
+    sources = [range(n * 10, n * 10 + 6) for n in range(20)]
+    results = await asyncio.gather(*(plan.run(agen(s)) for s in sources))
+
+    for source, result in zip(sources, results):
+        doubled = [x * 2 for x in source]
+        assert result == [sum(doubled[i : i + 2]) for i in range(0, 6, 2)]
+
+
+@pytest.mark.asyncio
+async def test_bound_stream_can_be_extended_without_touching_the_plan():
+    plan = corstream.pipeline().map(lambda x: x + 1).compile()
+
+    assert await plan.stream(range(3)).map(lambda x: x * 10).to_list() == [10, 20, 30]
+    assert await plan.run(range(3)) == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_metrics_and_deadline_are_per_run():
+    plan = (
+        corstream.pipeline().map(lambda x: x).with_metrics().with_deadline(1).compile()
+    )
+
+    stream = plan.stream(range(4))
+    assert await stream.to_list() == [0, 1, 2, 3]
+    assert stream.metrics()["stages"][0]["items_out"] == 4
+
+
+@pytest.mark.asyncio
+async def test_uncompiled_pipeline_cannot_run():
+    template = corstream.pipeline().map(lambda x: x)
+
+    with pytest.raises(TypeError, match="no source"):
+        await template.to_list()
+    with pytest.raises(TypeError, match="no source"):
+        template.apply()
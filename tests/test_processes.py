@@ -0,0 +1,134 @@
+# tests/test_processes.py
+
+import multiprocessing
+import os
+import pytest
+
+from corstream import Stream, WorkerError
+from corstream.ops.parallel.codec import decode, encode
+from corstream.ops.parallel.ring import RingBuffer
+
+fork_only = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="groups below are closures and need the fork start method",
+)
+FORK = (
+    multiprocessing.get_context("fork")
+    if "fork" in multiprocessing.get_all_start_methods()
+    else None
+)
+
+
+def test_codec_round_trip():
+    items = [b"raw", "text \udcff", 42, -(2**63), 2**80, 1.5, None, True, (1, "a")]
+    for item in items:
+        tag, payload = encode(item)
+        decoded = decode(tag, bytes(payload))
+        assert decoded == item and type(decoded) is type(item)
+    assert decode(*encode(memoryview(b"view"))) == b"view"
+
+
+def test_ring_buffer_wraps_around():
+    ring = RingBuffer(capacity=32)
+    try:
+        received = []
+        for i in range(50):
+            payload = bytes([i]) * (i % 7)
+            assert ring.try_put(1, payload)
+            if i % 3 == 0:
+                assert ring.try_put(2, b"x" * 10)
+                received.append(ring.try_get())
+            received.append(ring.try_get())
+        assert ring.try_get() is None
+        expected = []
+        for i in range(50):
+            expected.append((1, bytes([i]) * (i % 7)))
+            if i % 3 == 0:
+                expected.append((2, b"x" * 10))
+        assert received == expected
+    finally:
+        ring.close()
+        ring.unlink()
+
+
+def test_ring_buffer_is_bounded():
+    ring = RingBuffer(capacity=32)
+    try:
+        assert ring.try_put(1, b"a" * 20)
+        assert not ring.try_put(1, b"b" * 20)
+        ring.try_get()
+        assert ring.try_put(1, b"b" * 20)
+        with pytest.raises(ValueError):
+            ring.try_put(1, b"c" * 40)
+    finally:
+        ring.close()
+        ring.unlink()
+
+
+@fork_only
+@pytest.mark.asyncio
+async def test_run_in_processes():
+    pids = []
+    result = (
+        await Stream.from_iterable(range(2000))
+        .run_in_processes(
+            lambda s: s.map(lambda x: (x * x, os.getpid())),
+            lambda s: s.filter(lambda pair: pair[0] % 2 == 0),
+            capacity=256,
+            context=FORK,
+        )
+        .map(lambda pair: pids.append(pair[1]) or pair[0])
+        .to_list()
+    )
+    assert result == [x * x for x in range(0, 2000, 2)]
+    assert os.getpid() not in pids
+
+
+@fork_only
+@pytest.mark.asyncio
+async def test_run_in_processes_propagates_errors():
+    def fail(x):
+        if x == 50:
+            raise KeyError("bad record")
+        return x
+
+    with pytest.raises(KeyError, match="bad record"):
+        await (
+            Stream.from_iterable(range(100))
+            .run_in_processes(lambda s: s.map(fail), lambda s: s, context=FORK)
+            .to_list()
+        )
+
+    async def broken_source():
+        yield b"ok"
+        raise RuntimeError("source failed")
+
+    with pytest.raises(RuntimeError, match="source failed"):
+        await Stream(broken_source()).run_in_processes(
+            lambda s: s, context=FORK
+        ).to_list()
+
+
+@fork_only
+@pytest.mark.asyncio
+async def test_run_in_processes_reports_dead_workers():
+    with pytest.raises(WorkerError):
+        await (
+            Stream.from_iterable(range(10))
+            .run_in_processes(lambda s: s.map(lambda x: os._exit(3)), context=FORK)
+            .to_list()
+        )
+
+
+@fork_only
+@pytest.mark.asyncio
+async def test_run_in_processes_early_exit_stops_workers():
+    children_before = set(multiprocessing.active_children())
+    result = (
+        await Stream.from_iterable(iter(int, 1))  # Endless zeros.
+        .run_in_processes(lambda s: s.map(lambda x: x + 1), capacity=64, context=FORK)
+        .take(3)
+        .to_list()
+    )
+    assert result == [1, 1, 1]
+    assert set(multiprocessing.active_children()) <= children_before
@@ -0,0 +1,112 @@
+# tests/test_retry.py
+
+import pytest
+import asyncio
+import time
+from corstream import Stream, RetryDeadlineError, RetryPolicy
+
+
+def flaky(failures):
+    calls = {}
+
+    async def fn(x):
+        calls[x] = calls.get(x, 0) + 1
+        if calls[x] <= failures.get(x, 0):
+            raise ConnectionError(f"transient {x}")
+        return x * 10
+
+    return fn, calls
+
+
+@pytest.mark.asyncio
+async def test_map_retries_only_failed_item():
+    fn, calls = flaky({2: 2})
+
+    result = await (
+        Stream.from_iterable([1, 2, 3])
+        .map(fn, retry=RetryPolicy(attempts=3, base_delay=0))
+        .to_list()
+    )
+
+    assert result == [10, 20, 30]
+    assert calls == {1: 1, 2: 3, 3: 1}
+
+
+@pytest.mark.asyncio
+async def test_map_async_retry_does_not_block_other_items():
+    fn, calls = flaky({1: 1})
+    finished = []
+
+    async def record(x):
+        finished.append(x)
+
+    await (
+        Stream.from_iterable([1, 2, 3])
+        .map_async(fn, max_concurrent=3, retry=RetryPolicy(base_delay=0.05, jitter=0))
+        .for_each(record)
+    )
+
+    assert finished[-1] == 10
+    assert sorted(finished) == [10, 20, 30]
+
+
+@pytest.mark.asyncio
+async def test_retry_gives_up_after_attempts():
+    fn, calls = flaky({1: 5})
+
+    with pytest.raises(ConnectionError):
+        await (
+            Stream.from_iterable([1])
+            .map(fn, retry=RetryPolicy(attempts=2, base_delay=0))
+            .to_list()
+        )
+
+    assert calls == {1: 2}
+
+
+@pytest.mark.asyncio
+async def test_retry_filter_skips_non_retryable_errors():
+    calls = []
+
+    def bad(x):
+        calls.append(x)
+        raise KeyError(x)
+
+    policy = RetryPolicy(retry_on=(ConnectionError, TimeoutError), base_delay=0)
+
+    with pytest.raises(KeyError):
+        await Stream.from_iterable([1]).map(bad, retry=policy).to_list()
+
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_retry_deadline_bounds_total_time():
+    fn, _ = flaky({1: 100})
+    policy = RetryPolicy(attempts=100, base_delay=0.02, jitter=0, deadline=0.1)
+
+    start = time.perf_counter()
+    with pytest.raises(RetryDeadlineError) as info:
+        await Stream.from_iterable([1]).map_async(fn, retry=policy).to_list()
+
+    assert time.perf_counter() - start < 0.15
+    assert isinstance(info.value, asyncio.TimeoutError)
+    assert isinstance(info.value.__cause__, ConnectionError)
+    assert info.value.deadline == 0.1
+
+
+def test_retry_backoff_is_exponential_and_capped():
+    policy = RetryPolicy(base_delay=0.1, multiplier=2, max_delay=0.3, jitter=0)
+
+    assert [policy.backoff(n) for n in (1, 2, 3, 4)] == [0.1, 0.2, 0.3, 0.3]
+
+    jittered = RetryPolicy(base_delay=1.0, jitter=0.5)
+    assert all(0.5 <= jittered.backoff(1) <= 1.0 for _ in range(50))
+
+
+def test_retry_policy_invalid_arguments():
+    with pytest.raises(ValueError):
+        RetryPolicy(attempts=0)
+
+    with pytest.raises(ValueError):
+        RetryPolicy(jitter=2)
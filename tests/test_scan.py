@@ -0,0 +1,126 @@
+# tests/test_scan.py
+
+import asyncio
+import pytest
+
+import corstream
+from corstream import Reducer, Stream, combine_partials
+
+
+class Sum(Reducer):
+    def initial(self):
+        return 0
+
+    def step(self, acc, item):
+        return acc + item
+
+    def combine(self, left, right):
+        return left + right
+
+
+@pytest.mark.asyncio
+async def test_scan_emits_every_item_by_default():
+    result = (
+        await Stream.from_iterable([1, 2, 3, 4]).scan(lambda a, x: a + x, 0).to_list()
+    )
+    assert result == [1, 3, 6, 10]
+
+
+@pytest.mark.asyncio
+async def test_scan_emit_every_and_final_snapshot():
+    result = (
+        await Stream.from_iterable(range(1, 8))
+        .scan(lambda a, x: a + x, 0, emit_every=3)
+        .to_list()
+    )
+    assert result == [6, 21, 28]
+
+
+@pytest.mark.asyncio
+async def test_scan_does_not_repeat_final_snapshot():
+    result = (
+        await Stream.from_iterable(range(6))
+        .scan(lambda a, x: a + 1, 0, emit_every=3)
+        .to_list()
+    )
+    assert result == [3, 6]
+
+
+@pytest.mark.asyncio
+async def test_scan_interval():
+    async def slow():
+        for i in range(4):
+            yield i
+            await asyncio.sleep(0.03)
+
+    result = await Stream(slow()).scan(lambda a, x: a + 1, 0, interval=0.05).to_list()
+    assert result[-1] == 4
+    assert 1 <= len(result) < 4
+
+
+@pytest.mark.asyncio
+async def test_scan_and_reduce_accept_reducer():
+    assert await Stream.from_iterable([1, 2, 3]).scan(Sum()).to_list() == [1, 3, 6]
+    assert await Stream.from_iterable([1, 2, 3]).reduce(Sum()) == 6
+    assert await Stream.from_iterable([]).reduce(Sum()) == 0
+
+
+@pytest.mark.asyncio
+async def test_combine_partial_reductions():
+    reducer = Sum()
+    partials = (
+        await Stream.from_iterable(range(10))
+        .batch(3)
+        .map(reducer.reduce_chunk)
+        .to_list()
+    )
+    assert partials == [3, 12, 21, 9]
+    assert combine_partials(reducer, partials) == 45
+
+
+def test_scan_rejects_bad_options():
+    with pytest.raises(ValueError):
+        Stream.from_iterable([]).scan(lambda a, x: a, 0, emit_every=0)
+    with pytest.raises(ValueError):
+        Stream.from_iterable([]).scan(lambda a, x: a, 0, interval=0)
+
+
+@pytest.mark.asyncio
+async def test_reducer_function_needs_an_initial_value():
+    with pytest.raises(ValueError, match="initial"):
+        Stream.from_iterable([1]).scan(lambda a, x: a + x)
+    with pytest.raises(ValueError, match="initial"):
+        await Stream.from_iterable([1]).reduce(lambda a, x: a + x)
+
+
+class Collect(Reducer):
+    def initial(self):
+        return []
+
+    def step(self, acc, item):
+        acc.append(item)
+        return acc
+
+    def combine(self, left, right):
+        return left + right
+
+
+@pytest.mark.asyncio
+async def test_scan_snapshots_of_a_mutable_accumulator_are_independent():
+    result = (
+        await Stream.from_iterable(range(3)).scan(Collect(), emit_every=1).to_list()
+    )
+
+    assert result == [[0], [0, 1], [0, 1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_scan_starts_every_run_from_a_fresh_accumulator():
+    plan = corstream.pipeline().scan(Collect(), emit_every=10).compile()
+    listed = (
+        corstream.pipeline().scan(lambda acc, x: acc.append(x) or acc, []).compile()
+    )
+
+    for _ in range(2):
+        assert await plan.run(range(3)) == [[0, 1, 2]]
+        assert await listed.run(range(2)) == [[0], [0, 1]]
@@ -0,0 +1,94 @@
+# tests/test_take.py
+
+import asyncio
+import itertools
+import pytest
+
+from corstream import Stream
+
+
+def counting_source(state):
+    async def gen():
+        try:
+            for i in itertools.count():
+                state["pulled"] = i + 1
+                yield i
+        finally:
+            state["closed"] = True
+
+    return gen()
+
+
+@pytest.mark.asyncio
+async def test_take():
+    result = await Stream.from_iterable(range(10)).take(3).to_list()
+    assert result == [0, 1, 2]
+    assert await Stream.from_iterable(range(10)).take(0).to_list() == []
+    assert await Stream.from_iterable(range(2)).take(5).to_list() == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_take_closes_endless_upstream():
+    state = {}
+    result = (
+        await Stream(counting_source(state))
+        .map(lambda x: x * 2)
+        .filter(lambda x: x % 3 == 0)
+        .take(3)
+        .to_list()
+    )
+    assert result == [0, 6, 12]
+    assert state["closed"] is True
+    assert state["pulled"] == 7
+
+
+@pytest.mark.asyncio
+async def test_take_cancels_in_flight_map_async_tasks():
+    state = {}
+    cancelled = []
+
+    async def work(x):
+        try:
+            await asyncio.sleep(0 if x < 2 else 10)
+        except asyncio.CancelledError:
+            cancelled.append(x)
+            raise
+        return x
+
+    result = (
+        await Stream(counting_source(state))
+        .map_async(work, max_concurrent=4, ordered=True)
+        .take(2)
+        .to_list()
+    )
+    assert result == [0, 1]
+    assert sorted(cancelled) == [2, 3]
+    assert state["closed"] is True
+    assert state["pulled"] == 4
+
+
+@pytest.mark.asyncio
+async def test_take_while():
+    state = {}
+    result = await Stream(counting_source(state)).take_while(lambda x: x < 4).to_list()
+    assert result == [0, 1, 2, 3]
+    assert state["closed"] is True
+
+    async def small(x):
+        return x < 2
+
+    assert await Stream.from_iterable(range(5)).take_while(small).to_list() == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_skip():
+    assert await Stream.from_iterable(range(5)).skip(2).to_list() == [2, 3, 4]
+    assert await Stream.from_iterable(range(5)).skip(2).take(2).to_list() == [2, 3]
+    assert await Stream.from_iterable(range(2)).skip(5).to_list() == []
+
+
+def test_take_and_skip_reject_negative_counts():
+    with pytest.raises(ValueError):
+        Stream.from_iterable([]).take(-1)
+    with pytest.raises(ValueError):
+        Stream.from_iterable([]).skip(-1)
@@ -0,0 +1,152 @@
+# tests/test_tee.py
+
+import pytest
+import asyncio
+from corstream import Stream
+
+
+@pytest.mark.asyncio
+async def test_tee_reads_source_once():
+    reads = []
+
+    async def source():
+        for i in range(5):
+            reads.append(i)
+            yield i
+
+    left, right = Stream.from_iterable(source()).map(lambda x: x * 2).tee(2)
+    a, b = await asyncio.gather(left.to_list(), right.map(str).to_list())
+
+    assert reads == [0, 1, 2, 3, 4]
+    assert a == [0, 2, 4, 6, 8]
+    assert b == ["0", "2", "4", "6", "8"]
+
+
+@pytest.mark.asyncio
+async def test_tee_slowest_branch_applies_backpressure():
+    pulled = []
+    lags = []
+
+    async def source():
+        for i in range(20):
+            pulled.append(i)
+            yield i
+
+    fast, slow = Stream.from_iterable(source()).tee(2, max_lag=3)
+
+    async def slow_consume(x):
+        lags.append(len(pulled) - (x + 1))
+        await asyncio.sleep(0.001)
+
+    await asyncio.gather(fast.to_list(), slow.for_each(slow_consume))
+
+    assert max(lags) <= 3
+
+
+@pytest.mark.asyncio
+async def test_tee_lossy_branch_drops_instead_of_blocking():
+    async def source():
+        for i in range(50):
+            await asyncio.sleep(0)
+            yield i
+
+    fast, slow = Stream.from_iterable(source()).tee(2, max_lag=4, lossy=[False, True])
+    seen = []
+
+    async def slow_consume(x):
+        seen.append(x)
+        await asyncio.sleep(0.005)
+
+    result, _ = await asyncio.gather(fast.to_list(), slow.for_each(slow_consume))
+
+    assert result == list(range(50))
+    assert len(seen) < 50
+    assert seen == sorted(seen)
+
+
+@pytest.mark.asyncio
+async def test_tee_propagates_errors_to_every_branch():
+    async def failing():
+        yield 1
+        raise ValueError("upstream failed")
+
+    left, right = Stream.from_iterable(failing()).tee(2)
+    results = await asyncio.gather(
+        left.to_list(), right.to_list(), return_exceptions=True
+    )
+
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_tee_closed_branch_does_not_block_others():
+    left, right = Stream.from_iterable(range(10)).tee(2, max_lag=2)
+
+    async def take_two():
+        taken = []
+        iterator = left.apply()
+        async for item in iterator:
+            taken.append(item)
+            if len(taken) == 2:
+                break
+        await iterator.aclose()
+        return taken
+
+    taken, rest = await asyncio.gather(take_two(), right.to_list())
+
+    assert taken == [0, 1]
+    assert rest == list(range(10))
+
+
+@pytest.mark.asyncio
+async def test_tee_cancelled_branch_does_not_end_the_source_for_others():
+    async def slow_source():
+        for i in range(10):
+            await asyncio.sleep(0.005)
+            yield i
+
+    left, right = Stream.from_iterable(slow_source()).tee(2)
+    cancelled = asyncio.ensure_future(left.to_list())
+    rest = asyncio.ensure_future(right.to_list())
+    await asyncio.sleep(0.012)  # Cancel while a pull is in flight.
+    cancelled.cancel()
+
+    assert await rest == list(range(10))
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+
+@pytest.mark.asyncio
+async def test_tee_source_base_exception_reaches_every_branch():
+    class Fatal(BaseException):
+        pass
+
+    async def interrupted():
+        yield 1
+        raise Fatal
+
+    left, right = Stream.from_iterable(interrupted()).tee(2)
+    results = await asyncio.gather(
+        left.to_list(), right.to_list(), return_exceptions=True
+    )
+
+    assert all(isinstance(r, Fatal) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_split_routes_by_predicate():
+    evens, odds, big = Stream.from_iterable(range(10)).split(
+        lambda x: x % 2 == 0, lambda x: x % 2 == 1, lambda x: x >= 8
+    )
+
+    result = await asyncio.gather(evens.to_list(), odds.to_list(), big.to_list())
+
+    assert result == [[0, 2, 4, 6, 8], [1, 3, 5, 7, 9], [8, 9]]
+
+
+def test_tee_invalid_arguments():
+    with pytest.raises(ValueError):
+        Stream.from_iterable([1]).tee(0)
+
+    with pytest.raises(ValueError):
+        Stream.from_iterable([1]).tee(2, lossy=[True])
@@ -1,8 +1,9 @@
 # tests/test_throttle.py
 
 import pytest
+import asyncio
 import time
-from corstream import Stream
+from corstream import Stream, RateLimiter
 
 
 @pytest.mark.asyncio
@@ -35,4 +36,94 @@ async def test_throttle_invalid_arguments():
         Stream.from_iterable([1]).throttle(rate=0, per_seconds=1)
         
     with pytest.raises(ValueError):
-        Stream.from_iterable([1]).throttle(rate=1, per_seconds=0)
\ No newline at end of file
+        Stream.from_iterable([1]).throttle(rate=1, per_seconds=0)
+
+@pytest.mark.asyncio
+async def test_throttle_allows_bursts():
+    timestamps = []
+
+    start = time.perf_counter()
+    await (
+        Stream
+        .from_iterable(range(4))
+        .throttle(rate=1, per_seconds=0.1, burst=3)
+        .for_each(lambda x: timestamps.append(time.perf_counter() - start))
+    )
+
+    assert all(t < 0.05 for t in timestamps[:3])
+    assert 0.08 <= timestamps[3] <= 0.2
+
+
+@pytest.mark.asyncio
+async def test_throttle_weighted_cost():
+    timestamps = []
+
+    start = time.perf_counter()
+    await (
+        Stream
+        .from_iterable([1, 3])
+        .throttle(rate=10, per_seconds=1, cost=lambda x: x)
+        .for_each(lambda x: timestamps.append(time.perf_counter() - start))
+    )
+
+    # The second item costs 3 units at 10 units/s.
+    assert 0.25 <= timestamps[1] - timestamps[0] <= 0.4
+
+
+@pytest.mark.asyncio
+async def test_limiter_shared_across_streams():
+    limiter = RateLimiter(rate=20, per_seconds=1)
+    timestamps = []
+
+    async def record(x):
+        timestamps.append(time.perf_counter())
+
+    async def noop(x):
+        return x
+
+    await asyncio.gather(
+        Stream.from_iterable(range(3)).throttle(limiter=limiter).for_each(record),
+        Stream.from_iterable(range(3)).map_async(noop, limiter=limiter).for_each(record),
+    )
+
+    timestamps.sort()
+    # Six admissions at 20/s take at least 5 intervals of 50ms in total.
+    assert timestamps[-1] - timestamps[0] >= 0.24
+
+
+def test_limiter_try_acquire():
+    limiter = RateLimiter(rate=1, per_seconds=10, burst=2)
+
+    assert limiter.try_acquire()
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+
+
+@pytest.mark.asyncio
+async def test_limiter_cancelled_waiters_give_their_units_back():
+    limiter = RateLimiter(rate=10)
+
+    async def slow(x):
+        await asyncio.sleep(0.01)
+        return x
+
+    first = await (
+        Stream.from_iterable(range(100))
+        .map_async(slow, max_concurrent=20, limiter=limiter)
+        .first()
+    )
+
+    assert first == 0
+    await asyncio.sleep(0.11)
+    assert limiter.try_acquire()
+    started = time.monotonic()
+    await limiter.acquire()
+    assert time.monotonic() - started < 0.15
+
+
+def test_limiter_invalid_arguments():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=1, burst=0)
+
+    with pytest.raises(ValueError):
+        Stream.from_iterable([1]).throttle()
@@ -0,0 +1,74 @@
+# tests/test_timeout.py
+
+import asyncio
+import pytest
+
+from corstream import RetryPolicy, StageTimeoutError, Stream
+
+
+async def slow_on_three(x):
+    await asyncio.sleep(10 if x == 3 else 0)
+    return x
+
+
+@pytest.mark.asyncio
+async def test_map_timeout():
+    with pytest.raises(StageTimeoutError) as info:
+        await Stream.from_iterable([1, 2, 3]).map(slow_on_three, timeout=0.05).to_list()
+    assert info.value.stage == "map"
+    assert info.value.item == 3
+    assert isinstance(info.value, asyncio.TimeoutError)
+
+
+@pytest.mark.asyncio
+async def test_filter_timeout():
+    async def keep(x):
+        return await slow_on_three(x) > 0
+
+    with pytest.raises(StageTimeoutError) as info:
+        await Stream.from_iterable([1, 3]).filter(keep, timeout=0.05).to_list()
+    assert info.value.stage == "filter"
+
+
+@pytest.mark.asyncio
+async def test_map_async_timeout_cancels_the_call():
+    cancelled = []
+
+    async def hang(x):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(x)
+            raise
+
+    with pytest.raises(StageTimeoutError) as info:
+        await Stream.from_iterable([1]).map_async(hang, timeout=0.05).to_list()
+    assert info.value.stage == "map_async"
+    assert cancelled == [1]
+
+
+@pytest.mark.asyncio
+async def test_timeouts_are_retried():
+    attempts = []
+
+    async def slow_first(x):
+        attempts.append(x)
+        await asyncio.sleep(10 if len(attempts) == 1 else 0)
+        return x
+
+    policy = RetryPolicy(attempts=2, base_delay=0, jitter=0)
+    result = (
+        await Stream.from_iterable([7])
+        .map_async(slow_first, timeout=0.05, retry=policy)
+        .to_list()
+    )
+    assert result == [7]
+    assert attempts == [7, 7]
+
+
+@pytest.mark.asyncio
+async def test_timeout_leaves_sync_functions_fast():
+    result = (
+        await Stream.from_iterable([1, 2]).map(lambda x: x + 1, timeout=1).to_list()
+    )
+    assert result == [2, 3]
@@ -0,0 +1,127 @@
+# tests/test_to_file.py
+
+import asyncio
+import csv
+import gzip
+import json
+import threading
+import pytest
+
+from corstream import Stream, WriteStats
+
+
+async def agen(items):
+    for item in items:
+        await asyncio.sleep(0)
+        yield item
+
+
+@pytest.mark.asyncio
+async def test_to_file_jsonl(tmp_path):
+    path = tmp_path / "out.jsonl"
+    records = [{"id": i, "name": f"n{i}"} for i in range(2500)]
+
+    stats = await Stream.from_iterable(agen(records)).to_file(path, batch_size=100)
+
+    assert stats == WriteStats(2500, path.stat().st_size, [str(path)])
+    lines = path.read_text().splitlines()
+    assert [json.loads(line) for line in lines] == records
+
+
+@pytest.mark.asyncio
+async def test_to_file_csv_with_dict_and_sequence_rows(tmp_path):
+    rows = [{"a": i, "b": i * 2} for i in range(5)]
+    await Stream.from_iterable(rows).to_file(tmp_path / "d.csv", format="csv")
+    with open(tmp_path / "d.csv", newline="") as f:
+        assert list(csv.DictReader(f)) == [
+            {"a": str(r["a"]), "b": str(r["b"])} for r in rows
+        ]
+
+    await Stream.from_iterable([(1, "x,y")]).to_file(
+        tmp_path / "s.csv", format="csv", fields=["n", "s"]
+    )
+    with open(tmp_path / "s.csv", newline="") as f:
+        assert list(csv.reader(f)) == [["n", "s"], ["1", "x,y"]]
+
+
+@pytest.mark.asyncio
+async def test_to_file_bytes_copies_views_from_a_reused_buffer(tmp_path):
+    source = tmp_path / "in.bin"
+    source.write_bytes(bytes(range(256)) * 100)
+
+    stats = await Stream.from_file(source, chunk_size=1000).to_file(
+        tmp_path / "out.bin", format="bytes", batch_size=4
+    )
+
+    assert stats.bytes == 25600
+    assert (tmp_path / "out.bin").read_bytes() == source.read_bytes()
+
+
+@pytest.mark.asyncio
+async def test_to_file_rotates_and_compresses(tmp_path):
+    path = tmp_path / "out.csv.gz"
+    rows = [(i, "x" * 20) for i in range(100)]
+
+    stats = await Stream.from_iterable(rows).to_file(
+        path, format="csv", rotate_bytes=500, compress="gzip", fields=["i", "x"]
+    )
+
+    assert len(stats.files) > 1
+    assert stats.files[0] == str(tmp_path / "out.00000.csv.gz")
+    read = []
+    for name in stats.files:
+        with gzip.open(name, "rt", newline="") as f:
+            part = list(csv.reader(f))
+        assert part[0] == ["i", "x"]
+        assert sum(len(",".join(row)) + 2 for row in part) <= 500 + 30
+        read.extend(part[1:])
+    assert read == [[str(i), x] for i, x in rows]
+    assert stats.items == 100
+
+
+@pytest.mark.asyncio
+async def test_to_file_serializes_off_the_event_loop(tmp_path):
+    threads = set()
+
+    class Row:
+        def __init__(self, value):
+            self.value = value
+
+        def __iter__(self):
+            threads.add(threading.current_thread())
+            return iter((self.value, self.value + 1))
+
+    stats = (
+        await Stream.from_iterable(range(10))
+        .map(Row)
+        .to_file(tmp_path / "out.csv", format="csv", batch_size=3)
+    )
+
+    assert stats.items == 10
+    assert len(threads) == 1
+    assert threading.current_thread() not in threads
+
+
+@pytest.mark.asyncio
+async def test_to_file_closes_files_on_error(tmp_path):
+    def boom(x):
+        if x == 50:
+            raise ValueError("boom")
+        return x
+
+    with pytest.raises(ValueError):
+        await Stream.from_iterable(range(100)).map(boom).to_file(
+            tmp_path / "out.jsonl", batch_size=10
+        )
+
+    await asyncio.sleep(0.05)
+    # Batches handed to the writer before the failure are flushed on close.
+    assert (tmp_path / "out.jsonl").read_text().splitlines() == [
+        str(i) for i in range(50)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_to_file_rejects_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        await Stream.from_iterable([1]).to_file(tmp_path / "x", format="xml")
@@ -0,0 +1,200 @@
+# tests/test_window.py
+
+import asyncio
+import pytest
+from corstream import Stream, WindowResult
+
+
+def events(*pairs):
+    return [{"user": user, "t": t} for user, t in pairs]
+
+
+def by_user(e):
+    return e["user"]
+
+
+def event_time(e):
+    return e["t"]
+
+
+@pytest.mark.asyncio
+async def test_tumbling_windows_emit_when_closed():
+    emitted = []
+    source = events(("a", 0.5), ("b", 0.7), ("a", 1.2), ("a", 2.1), ("b", 3.5))
+
+    async def collect(result):
+        emitted.append(result)
+
+    await (
+        Stream.from_iterable(source)
+        .group_by(by_user)
+        .window("tumbling", size=1.0, timestamp=event_time)
+        .for_each(collect)
+    )
+
+    assert emitted == [
+        WindowResult("a", 0.0, 1.0, 1, 1),
+        WindowResult("b", 0.0, 1.0, 1, 1),
+        WindowResult("a", 1.0, 2.0, 1, 1),
+        WindowResult("a", 2.0, 3.0, 1, 1),
+        WindowResult("b", 3.0, 4.0, 1, 1),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_sliding_windows_with_reducer():
+    source = [{"user": "a", "t": t, "v": v} for t, v in [(0.0, 1), (1.0, 2), (2.0, 3)]]
+
+    result = await (
+        Stream.from_iterable(source)
+        .group_by(by_user)
+        .window(
+            "sliding",
+            size=2.0,
+            slide=1.0,
+            timestamp=event_time,
+            reducer=lambda acc, e: acc + e["v"],
+            initial=0,
+        )
+        .to_list()
+    )
+
+    assert [(r.start, r.end, r.value) for r in result] == [
+        (-1.0, 1.0, 1),
+        (0.0, 2.0, 3),
+        (1.0, 3.0, 5),
+        (2.0, 4.0, 3),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_session_windows_close_after_gap():
+    source = events(("a", 0.0), ("a", 0.5), ("a", 0.9), ("a", 5.0), ("a", 5.2))
+
+    result = await (
+        Stream.from_iterable(source)
+        .group_by(by_user)
+        .window("session", gap=1.0, timestamp=event_time)
+        .to_list()
+    )
+
+    assert [(r.start, r.end, r.items) for r in result] == [
+        (0.0, 1.9, 3),
+        (5.0, 6.2, 2),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_late_items_go_to_side_output():
+    late = []
+    source = events(("a", 0.5), ("a", 2.5), ("a", 0.9), ("a", 1.9))
+
+    result = await (
+        Stream.from_iterable(source)
+        .group_by(by_user)
+        .window(
+            "tumbling",
+            size=1.0,
+            timestamp=event_time,
+            allowed_lateness=1.0,
+            on_late=late.append,
+        )
+        .to_list()
+    )
+
+    assert late == [{"user": "a", "t": 0.9}]
+    assert [(r.start, r.items) for r in result] == [(0.0, 1), (1.0, 1), (2.0, 1)]
+
+
+@pytest.mark.asyncio
+async def test_max_keys_flushes_least_recent_key():
+    source = events(("a", 0.1), ("b", 0.2), ("c", 0.3), ("a", 0.4))
+
+    result = await (
+        Stream.from_iterable(source)
+        .group_by(by_user)
+        .window("tumbling", size=10.0, timestamp=event_time, max_keys=2)
+        .to_list()
+    )
+
+    assert [(r.key, r.items) for r in result] == [
+        ("a", 1),
+        ("b", 1),
+        ("c", 1),
+        ("a", 1),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_late_item_merges_the_sessions_it_bridges():
+    source = events(("a", 0), ("a", 10), ("a", 5))
+
+    counted = await (
+        Stream.from_iterable(source)
+        .group_by(by_user)
+        .window("session", gap=6, timestamp=event_time, allowed_lateness=20)
+        .to_list()
+    )
+    collected = await (
+        Stream.from_iterable(source)
+        .group_by(by_user)
+        .window(
+            "session",
+            gap=6,
+            timestamp=event_time,
+            allowed_lateness=20,
+            reducer=lambda acc, e: acc + (e["t"],),
+            initial=(),
+            combine=lambda left, right: left + right,
+        )
+        .to_list()
+    )
+
+    assert [(r.start, r.end, r.items) for r in counted] == [(0, 16, 3)]
+    assert counted[0].value == 3
+    assert sorted(collected[0].value) == [0, 5, 10]
+
+
+def test_window_invalid_arguments():
+    grouped = Stream.from_iterable([]).group_by(by_user)
+
+    with pytest.raises(ValueError):
+        grouped.window("hopping", size=1.0)
+
+    with pytest.raises(ValueError):
+        grouped.window("sliding", size=1.0)
+
+    with pytest.raises(ValueError):
+        grouped.window("session")
+
+    with pytest.raises(ValueError):
+        grouped.window(
+            "session", gap=1.0, reducer=lambda acc, e: acc, allowed_lateness=1.0
+        )
+
+
+@pytest.mark.asyncio
+async def test_processing_time_windows_close_on_the_clock():
+    release = asyncio.Event()
+    emitted = []
+
+    async def source():
+        yield {"user": "a"}
+        yield {"user": "a"}
+        await release.wait()
+        yield {"user": "b"}
+
+    async def collect(result):
+        emitted.append(result)
+        release.set()
+
+    await asyncio.wait_for(
+        Stream.from_iterable(source())
+        .group_by(by_user)
+        .window("tumbling", size=0.2)
+        .for_each(collect),
+        timeout=2,
+    )
+
+    # The first window closed while the source was idle, releasing it.
+    assert [(r.key, r.items) for r in emitted] == [("a", 2), ("b", 1)]